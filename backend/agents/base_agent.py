@@ -2,12 +2,11 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-import json
-import os
 from typing import Any
 
 from dotenv import load_dotenv
-from openai import OpenAI
+
+from utils.llm_gateway import LLMGateway, get_llm_gateway
 
 
 class BaseAgent(ABC):
@@ -26,10 +25,6 @@ class BaseAgent(ABC):
         self.reasoning_log: list[dict[str, Any]] = []
         self.stats = {"total_calls": 0, "success_count": 0, "success_rate": 100}
 
-        self._api_key = os.getenv("OPENAI_API_KEY")
-        self._model_name = os.getenv("OPENAI_MODEL", "gpt-4o")
-        self._client: OpenAI | None = None
-
     def log_reasoning(self, step: str, details: dict[str, Any] | None = None, confidence: float | None = None) -> None:
         self.reasoning_log.append(
             {
@@ -53,44 +48,25 @@ class BaseAgent(ABC):
     def get_recent_reasoning(self, limit: int = 10) -> list[dict[str, Any]]:
         return self.reasoning_log[-limit:]
 
-    def _ensure_llm(self) -> OpenAI:
+    def _ensure_llm(self) -> LLMGateway:
         if self.config.get("llm_enabled", True) is False:
             raise RuntimeError("LLM is disabled (llm_enabled=false).")
-        if not self._api_key:
+        gateway = get_llm_gateway()
+        if not gateway.api_key:
             raise RuntimeError("OPENAI_API_KEY is not set (create backend/.env).")
-        if self._client is None:
-            self._client = OpenAI(api_key=self._api_key)
-        return self._client
+        return gateway
 
-    def openai_json(self, *, system: str, user: str) -> dict[str, Any]:
-        client = self._ensure_llm()
+    async def openai_json(self, *, system: str, user: str) -> dict[str, Any]:
+        gateway = self._ensure_llm()
         try:
-            response = client.chat.completions.create(
-                model=self._model_name,
-                messages=[
-                    {"role": "system", "content": system},
-                    {"role": "user", "content": user},
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.2,
-            )
-            content = response.choices[0].message.content or "{}"
-            return json.loads(content)
+            return await gateway.chat_json(system=system, user=user, temperature=0.2)
         except Exception as e:
             raise RuntimeError(f"OpenAI API error: {e}")
 
-    def openai_text(self, *, system: str, user: str) -> str:
-        client = self._ensure_llm()
+    async def openai_text(self, *, system: str, user: str) -> str:
+        gateway = self._ensure_llm()
         try:
-            response = client.chat.completions.create(
-                model=self._model_name,
-                messages=[
-                    {"role": "system", "content": system},
-                    {"role": "user", "content": user},
-                ],
-                temperature=0.7,
-            )
-            return (response.choices[0].message.content or "").strip()
+            return await gateway.chat_text(system=system, user=user, temperature=0.7)
         except Exception as e:
             raise RuntimeError(f"OpenAI API error: {e}")
 
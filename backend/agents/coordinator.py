@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import time
+from itertools import chain
+from typing import Any, Callable, Iterable
+
 from .base_agent import BaseAgent
 from .memory_agent import MemoryAgent
 from .router_agent import RouterAgent
 from .critic_agent import CriticAgent
 from .intelligence_agent import IntelligenceAgent
 from knowledge_graph import GraphBuilder
-from typing import Any
+from utils.answer_cache import normalize_question
+from utils.dedup import EVENT_PREFIX, SeenSet, event_id_for
+from utils.metrics import get_metrics
+from utils.singleflight import SingleFlight
 
 
 class Coordinator(BaseAgent):
@@ -28,6 +36,10 @@ class Coordinator(BaseAgent):
         self.critic = CriticAgent(graph=graph, config=config)
         self.intelligence = IntelligenceAgent(name="intelligence", config=config, memory=self.memory)
         self.execution_log: list[dict[str, Any]] = []
+        self._step_listeners: list[Callable[[dict[str, Any]], None]] = []
+        self.flights = SingleFlight("coordinator")
+        # Event ids already in the graph; replays are answered before any LLM call.
+        self.seen = SeenSet(capacity=int(self.config.get("dedup_capacity", 100_000)))
         self._agents: dict[str, BaseAgent] = {
             "router": self.router,
             "memory": self.memory,
@@ -35,12 +47,51 @@ class Coordinator(BaseAgent):
             "intelligence": self.intelligence,
         }
 
-    async def process_new_information(self, info: dict[str, Any]) -> dict[str, Any]:
+    async def process_new_information(self, info: dict[str, Any], dedupe: bool = True) -> dict[str, Any]:
+        """Run critic -> memory -> router for one update.
+
+        A replay of an update already in the graph (same sender, subject, date and body)
+        returns ``deduplicated=True`` without calling any agent, unless ``dedupe`` is False
+        (demo scenarios, which are meant to be re-run).
+        """
         start = time.perf_counter()
         self.log_reasoning("Coordinator received new info", {"keys": sorted(list(info.keys()))}, confidence=0.9)
 
+        event_id = event_id_for(info)
+        known = event_id is not None and event_id in self.seen
+        if known and dedupe:
+            return self._deduplicated(event_id, start)
+        claimed = event_id is not None and not known
+        if claimed:
+            # Claimed up front so a concurrent retry of the same update is skipped too.
+            self.seen.add(event_id)
+        try:
+            result = await self._run_pipeline(info, start)
+        except BaseException:
+            if claimed:
+                self.seen.discard(event_id)
+            raise
+        if result["conflict"] and claimed:
+            # Nothing was written, so a resend gets a fresh verdict.
+            self.seen.discard(event_id)
+        return {**result, "deduplicated": False, "event_id": event_id}
+
+    def _deduplicated(self, event_id: str, start: float) -> dict[str, Any]:
+        self.log_reasoning("Skipped duplicate update", {"event_id": event_id}, confidence=0.95)
+        out = {
+            "timestamp": time.time(),
+            "processing_time": time.perf_counter() - start,
+            "agent_actions": [],
+            "success": True,
+        }
+        self.execution_log.append(out)
+        return {"conflict": False, "deduplicated": True, "event_id": event_id, "execution": out}
+
+    async def _run_pipeline(self, info: dict[str, Any], start: float) -> dict[str, Any]:
+        step = time.perf_counter()
         critic_result = await self.critic.process({"action": "detect_conflicts", **info})
         self.critic.update_stats()
+        self._emit_step("critic", step, conflict=bool(critic_result.get("conflict")))
 
         if critic_result.get("conflict"):
             out = {
@@ -52,11 +103,15 @@ class Coordinator(BaseAgent):
             self.execution_log.append(out)
             return {"conflict": True, "critic": critic_result, "execution": out}
 
+        step = time.perf_counter()
         memory_result = await self.memory.process({"action": "update_knowledge", **info})
         self.memory.update_stats()
-        
+        self._emit_step("memory", step, version=memory_result.get("version"))
+
+        step = time.perf_counter()
         router_result = await self.router.process({"action": "route_information", **info})
         self.router.update_stats()
+        self._emit_step("router", step, must_notify=len(router_result.get("must_notify", [])))
 
         out = {
             "timestamp": time.time(),
@@ -78,6 +133,120 @@ class Coordinator(BaseAgent):
             },
         }
 
+    async def process_batch(self, items: list[dict[str, Any]]) -> dict[str, Any]:
+        """Process many items with multi-item critic/extraction prompts and one graph commit.
+
+        Items are chunked (``batch_chunk_size``, default 10) for the LLM prompts; chunks run
+        concurrently. Every item gets its own result, so one failure never sinks the batch.
+        """
+        start = time.perf_counter()
+        self.log_reasoning("Coordinator received batch", {"count": len(items)}, confidence=0.9)
+        size = max(1, int(self.config.get("batch_chunk_size", 10)))
+
+        def chunked(seq: list[Any]) -> list[list[Any]]:
+            return [seq[i : i + size] for i in range(0, len(seq), size)]
+
+        async def run_chunked(fn: Callable, seq: list[dict[str, Any]]) -> list[Any]:
+            out: list[Any] = []
+            chunks = chunked(seq)
+            for chunk, res in zip(chunks, await asyncio.gather(*(fn(c) for c in chunks), return_exceptions=True)):
+                out.extend([res] * len(chunk) if isinstance(res, BaseException) else res)
+            return out
+
+        results: list[dict[str, Any]] = [{"index": i} for i in range(len(items))]
+
+        # Replays (of earlier updates, or repeats within this batch) skip the pipeline.
+        fresh: list[int] = []
+        for i, item in enumerate(items):
+            event_id = event_id_for(item)
+            results[i]["event_id"] = event_id
+            if event_id is not None and event_id in self.seen:
+                results[i].update(status="duplicate", conflict=False, deduplicated=True)
+                continue
+            if event_id is not None:
+                self.seen.add(event_id)
+            results[i]["deduplicated"] = False
+            fresh.append(i)
+
+        step = time.perf_counter()
+        verdicts = await run_chunked(self.critic.detect_conflicts_batch, [items[i] for i in fresh])
+        self.critic.update_stats()
+        self._emit_step("critic", step, batch=len(fresh))
+
+        accepted: list[int] = []
+        for i, verdict in zip(fresh, verdicts):
+            if isinstance(verdict, BaseException):
+                results[i].update(status="error", error=f"critic: {verdict}")
+            elif verdict.get("conflict"):
+                results[i].update(status="conflict", conflict=True, critic=verdict)
+            else:
+                results[i].update(conflict=False, critic=verdict)
+                accepted.append(i)
+
+        routed: list[int] = []
+        if accepted:
+            accepted_items = [items[i] for i in accepted]
+            step = time.perf_counter()
+            extracted = await run_chunked(self.memory.extract_batch, accepted_items)
+            extracted = [{} if isinstance(e, BaseException) else e for e in extracted]
+            memory_results = self.memory.apply_batch(accepted_items, extracted)
+            self.memory.update_stats()
+            self._emit_step("memory", step, version=self.memory.get_graph_state().get("version"))
+            for i, mem in zip(accepted, memory_results):
+                if mem["status"] == "updated":
+                    results[i]["memory"] = mem
+                    routed.append(i)
+                else:
+                    results[i].update(status="error", error=f"memory: {mem.get('error')}")
+
+        if routed:
+            step = time.perf_counter()
+            routings = await asyncio.gather(*(self.router.route_information(items[i]) for i in routed), return_exceptions=True)
+            self.router.update_stats()
+            self._emit_step("router", step, batch=len(routed))
+            for i, routing in zip(routed, routings):
+                if isinstance(routing, BaseException):
+                    # The item is already in the graph; only its notification plan failed.
+                    results[i].update(status="processed", routing=None, routing_error=str(routing))
+                else:
+                    results[i].update(status="processed", routing=routing)
+
+        # Items that were not written may be sent again.
+        for r in results:
+            if r.get("status") in ("conflict", "error") and r["event_id"] is not None:
+                self.seen.discard(r["event_id"])
+
+        summary = {
+            "total": len(items),
+            "processed": sum(1 for r in results if r.get("status") == "processed"),
+            "deduplicated": sum(1 for r in results if r.get("status") == "duplicate"),
+            "conflicts": sum(1 for r in results if r.get("status") == "conflict"),
+            "failed": sum(1 for r in results if r.get("status") == "error"),
+        }
+        out = {
+            "timestamp": time.time(),
+            "processing_time": time.perf_counter() - start,
+            "batch": summary,
+            "success": summary["failed"] == 0,
+        }
+        self.execution_log.append(out)
+        return {
+            "results": results,
+            "summary": summary,
+            "version": self.memory.get_graph_state().get("version"),
+            "execution": out,
+        }
+
+    def remember_events(self, archived: Iterable[str] = ()) -> int:
+        """Seed the seen-set from the event nodes of the current graph (after a load or swap).
+
+        ``archived`` adds ids of events no longer in the graph (rolled up by retention).
+        """
+        g = self._graph.get_graph() if self._graph else None
+        current = (n for n in (g.nodes if g is not None else ()) if str(n).startswith(EVENT_PREFIX))
+        self.seen.rebuild(chain(current, archived))
+        return len(self.seen)
+
     def get_agent_status(self) -> dict[str, Any]:
         return {
             "agents": {
@@ -97,9 +266,14 @@ class Coordinator(BaseAgent):
 
         # Direct routing for intelligence queries
         if input_data.get("intent") == "intelligence":
-            result = await self.intelligence.process(input_data)
-            self.intelligence.update_stats()
-            return {"coordinator": True, "target": "intelligence", "result": result}
+            async def run_intelligence() -> dict[str, Any]:
+                step = time.perf_counter()
+                result = await self.intelligence.process(input_data)
+                self.intelligence.update_stats()
+                self._emit_step("intelligence", step)
+                return {"coordinator": True, "target": "intelligence", "result": result}
+
+            return await self.coalesce("intelligence", input_data, run_intelligence)
 
         # Treat payloads with 'content' as new information unless explicitly intent-routed.
         if "content" in input_data and "intent" not in input_data:
@@ -108,8 +282,10 @@ class Coordinator(BaseAgent):
         route_result = await self.router.process(input_data)
         target = route_result.get("target_agent", "memory")
         agent = self._agents.get(target, self.memory)
+        step = time.perf_counter()
         result = await agent.process(route_result.get("payload", input_data))
         agent.update_stats()
+        self._emit_step(target, step)
 
         if self.config.get("critique_enabled", True):
             critique = await self.critic.process({"content": result, "source_agent": target})
@@ -117,9 +293,50 @@ class Coordinator(BaseAgent):
 
         return {"coordinator": True, "target": target, "result": result}
 
+    async def coalesce(self, intent: str, payload: dict[str, Any], fn: Callable[[], Any]) -> Any:
+        """Share one in-flight ``fn()`` among concurrent callers with the same intent,
+        normalized payload and graph version."""
+        normalized = {
+            k: normalize_question(v) if k in ("query", "question") and isinstance(v, str) else v
+            for k, v in payload.items()
+        }
+        key = (
+            intent,
+            json.dumps(normalized, sort_keys=True, default=str),
+            self.memory.get_graph_state().get("version"),
+        )
+        return await self.flights.do(key, fn)
+
     def get_capabilities(self) -> list[str]:
         return ["orchestration", "pipeline", "delegation", "process_new_information", "status"]
 
+    def add_step_listener(self, listener: Callable[[dict[str, Any]], None]) -> None:
+        """Register ``listener(event)`` to be called after each agent step completes."""
+        self._step_listeners.append(listener)
+
+    def remove_step_listener(self, listener: Callable[[dict[str, Any]], None]) -> None:
+        if listener in self._step_listeners:
+            self._step_listeners.remove(listener)
+
+    def _emit_step(self, agent_name: str, started: float | None = None, **extra: Any) -> None:
+        """Record the step's latency and notify listeners with a compact summary of it."""
+        if started is not None:
+            extra["duration"] = time.perf_counter() - started
+            get_metrics().observe("orgmind_agent_step_duration_seconds", extra["duration"], agent=agent_name)
+        if not self._step_listeners:
+            return
+        agent = self._agents.get(agent_name)
+        last = agent.reasoning_log[-1] if agent and agent.reasoning_log else {}
+        event = {
+            "agent": agent_name,
+            "step": last.get("step"),
+            "confidence": last.get("confidence"),
+            "success_rate": agent.stats.get("success_rate") if agent else None,
+            **extra,
+        }
+        for listener in self._step_listeners:
+            listener(event)
+
     def register_agent(self, name: str, agent: BaseAgent) -> None:
         """Register a specialist agent for the coordinator."""
         self._agents[name] = agent
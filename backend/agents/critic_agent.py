@@ -19,25 +19,13 @@ class CriticAgent(BaseAgent):
         super().__init__(name, role="Conflict Detector", config=config)
         self._graph = graph
 
-    def detect_conflicts(self, new_info: dict[str, Any]) -> dict[str, Any]:
+    async def detect_conflicts(self, new_info: dict[str, Any]) -> dict[str, Any]:
         """Detect conflicts between new info and existing graph content."""
         if not self._graph:
             raise RuntimeError("CriticAgent requires a GraphBuilder instance.")
 
         self.log_reasoning("Checking for conflicts", {"keys": sorted(list(new_info.keys()))}, confidence=0.8)
-
-        content = str(new_info.get("content") or "")
-        topic = str(new_info.get("topic") or "")
-        q = (topic or content[:120]).lower()
-
-        existing = []
-        for nid, attrs in self._graph.get_graph().nodes(data=True):
-            if attrs.get("type") == "decision":
-                label = str(attrs.get("label", "")).lower()
-                if q and any(tok in label for tok in q.split()[:6]):
-                    existing.append({"id": str(nid), "label": attrs.get("label", ""), "content": attrs.get("content", "")})
-            if len(existing) >= 10:
-                break
+        existing = self._existing_decisions(new_info)
 
         system = (
             "You compare a new organizational update against existing facts.\n"
@@ -47,39 +35,94 @@ class CriticAgent(BaseAgent):
         user = f"EXISTING: {existing}\n\nNEW: {new_info}"
 
         try:
-            verdict = self.openai_json(system=system, user=user)
+            verdict = await self.openai_json(system=system, user=user)
             self.log_reasoning("Conflict check complete", {"verdict": verdict}, confidence=0.75)
         except Exception as e:
-            # Heuristic fallback: detect conflicting numeric values (e.g. budgets) for same topic.
-            import re
-
-            def dollars(text: str) -> list[str]:
-                return re.findall(r"\\$\\s?\\d+(?:\\.\\d+)?\\s?[mbkMBK]?", text or "")
-
-            new_amounts = dollars(content)
-            old_amounts = []
-            for item in existing:
-                old_amounts.extend(dollars(str(item.get("label", "")) + " " + str(item.get("content", ""))))
-
-            conflict = False
-            explanation = f"LLM unavailable: {e}"
-            severity = "low"
-            if new_amounts and old_amounts:
-                if any(na != oa for na in new_amounts for oa in old_amounts):
-                    conflict = True
-                    severity = "high" if "budget" in (topic or "").lower() else "medium"
-                    explanation = f"Numeric conflict detected: new {new_amounts} vs existing {old_amounts}"
-
-            verdict = {"conflict": conflict, "severity": severity, "explanation": explanation}
+            verdict = self._heuristic_verdict(new_info, existing, e)
             self.log_reasoning("Conflict check failed (heuristic fallback)", {"error": str(e), "verdict": verdict}, confidence=0.45)
 
         return verdict
 
+    async def detect_conflicts_batch(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Check many updates against existing facts with a single multi-item prompt."""
+        if not self._graph:
+            raise RuntimeError("CriticAgent requires a GraphBuilder instance.")
+        if not items:
+            return []
+
+        self.log_reasoning("Checking batch for conflicts", {"count": len(items)}, confidence=0.8)
+        existing = [self._existing_decisions(item) for item in items]
+
+        system = (
+            "You compare numbered organizational updates against existing facts.\n"
+            "Return JSON only, one entry per update:\n"
+            '{ "results": [{ "index": number, "conflict": bool, "severity": "critical"|"high"|"medium"|"low", "explanation": string }] }\n'
+        )
+        user = "\n\n".join(f"[{i}] EXISTING: {existing[i]}\nNEW: {item}" for i, item in enumerate(items))
+
+        by_index: dict[int, dict[str, Any]] = {}
+        error: Exception = RuntimeError("missing from batch verdict")
+        try:
+            response = await self.openai_json(system=system, user=user)
+            for entry in response.get("results") or []:
+                if isinstance(entry, dict) and isinstance(entry.get("index"), int):
+                    by_index[entry.pop("index")] = entry
+            self.log_reasoning("Batch conflict check complete", {"count": len(by_index)}, confidence=0.75)
+        except Exception as e:
+            error = e
+            self.log_reasoning("Batch conflict check failed (heuristic fallback)", {"error": str(e)}, confidence=0.45)
+
+        return [by_index.get(i) or self._heuristic_verdict(item, existing[i], error) for i, item in enumerate(items)]
+
+    def _existing_decisions(self, new_info: dict[str, Any]) -> list[dict[str, Any]]:
+        content = str(new_info.get("content") or "")
+        topic = str(new_info.get("topic") or "")
+        q = topic or content[:120]
+
+        existing = []
+        # Read one committed version; the live index may list decisions it does not have yet.
+        snap = self._graph.snapshot()
+        try:
+            g = snap.get_graph()
+            for nid, _ in self._graph.search_nodes(q, k=10, type="decision"):
+                if nid not in g:
+                    continue
+                attrs = g.nodes[nid]
+                existing.append({"id": str(nid), "label": attrs.get("label", ""), "content": attrs.get("content", "")})
+        finally:
+            snap.release()
+        return existing
+
+    def _heuristic_verdict(self, new_info: dict[str, Any], existing: list[dict[str, Any]], error: Exception) -> dict[str, Any]:
+        """Heuristic fallback: detect conflicting numeric values (e.g. budgets) for same topic."""
+        import re
+
+        def dollars(text: str) -> list[str]:
+            return re.findall(r"\\$\\s?\\d+(?:\\.\\d+)?\\s?[mbkMBK]?", text or "")
+
+        content = str(new_info.get("content") or "")
+        topic = str(new_info.get("topic") or "")
+        new_amounts = dollars(content)
+        old_amounts = []
+        for item in existing:
+            old_amounts.extend(dollars(str(item.get("label", "")) + " " + str(item.get("content", ""))))
+
+        conflict = False
+        explanation = f"LLM unavailable: {error}"
+        severity = "low"
+        if new_amounts and old_amounts:
+            if any(na != oa for na in new_amounts for oa in old_amounts):
+                conflict = True
+                severity = "high" if "budget" in (topic or "").lower() else "medium"
+                explanation = f"Numeric conflict detected: new {new_amounts} vs existing {old_amounts}"
+
+        return {"conflict": conflict, "severity": severity, "explanation": explanation}
+
     async def process(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """Either detect conflicts for new info, or critique an output."""
         action = input_data.get("action")
         if action in {"detect_conflicts", "conflicts"} or ("content" in input_data and "source_agent" not in input_data and self._graph):
-            return self.detect_conflicts(input_data)
+            return await self.detect_conflicts(input_data)
 
         content = input_data.get("content", "")
         source_agent = input_data.get("source_agent", "unknown")
@@ -94,4 +137,4 @@ class CriticAgent(BaseAgent):
         }
 
     def get_capabilities(self) -> list[str]:
-        return ["critique", "quality_check", "refinement", "detect_conflicts"]
+        return ["critique", "quality_check", "refinement", "detect_conflicts", "detect_conflicts_batch"]
@@ -1,4 +1,5 @@
 import logging
+import time
 from typing import Any, Dict, List
 from .base_agent import BaseAgent
 
@@ -10,6 +11,8 @@ class IntelligenceAgent(BaseAgent):
     It synthesizes data from the graph to provide structured briefs and visual reasoning.
     """
 
+    CHANGE_WINDOW = 24 * 3600  # seconds counted as "recent" in a brief
+
     def __init__(self, name: str, config: Dict[str, Any], memory=None):
         super().__init__(name, config)
         self.memory = memory  # Access to graph
@@ -82,12 +85,14 @@ class IntelligenceAgent(BaseAgent):
             "Generate a summary response."
         )
 
+        llm_error = None
         try:
-            generated_answer = self.openai_text(system=system_prompt, user=user_prompt)
+            generated_answer = await self.openai_text(system=system_prompt, user=user_prompt)
             brief["answer"] = generated_answer
         except Exception as e:
             logger.error(f"LLM Synthesis failed: {e}")
             brief["answer"] = "Unable to synthesize detailed answer. Please check raw insights."
+            llm_error = str(e)
 
         # Build Edges (Star topology for visualization context)
         visual_edges = []
@@ -107,7 +112,7 @@ class IntelligenceAgent(BaseAgent):
             confidence=1.0
         )
 
-        return {
+        result = {
             "brief": brief,
             "visual_reasoning": {
                 "nodes": visual_nodes,
@@ -115,6 +120,9 @@ class IntelligenceAgent(BaseAgent):
             },
             "answer": brief["answer"]
         }
+        if llm_error is not None:
+            result["llm_error"] = llm_error
+        return result
 
     def _analyze_graph(self) -> Dict[str, List[Any]]:
         """
@@ -123,8 +131,12 @@ class IntelligenceAgent(BaseAgent):
         if not self.memory or not self.memory._graph:
             return {"risks": [], "blockers": [], "changes": []}
 
-        g = self.memory._graph.get_graph()
-        
+        graph = self.memory._graph
+        # Read one committed version throughout; writes landing meanwhile go to a new copy.
+        with graph.snapshot() as snap:
+            return self._scan(graph, snap.get_graph())
+
+    def _scan(self, graph, g) -> Dict[str, List[Any]]:
         risks = []
         blockers = []
         changes = []
@@ -133,10 +145,15 @@ class IntelligenceAgent(BaseAgent):
         risk_keywords = ["conflict", "risk", "urgent", "delay", "fail", "miss", "alert"]
         blocker_keywords = ["block", "stuck", "wait", "hold"]
         
-        # Sort nodes by some 'date' if available, otherwise just arbitrary
-        # In a real system, we'd query by timestamp. Here we iterate all.
-        
-        for nid, attrs in g.nodes(data=True):
+        # People carry names, not content: skip them with a bitmap ANDNOT instead of
+        # testing every node.
+        candidates = graph.index.query() - graph.index.query(type="person")
+
+        for nid in graph.index.keys(candidates):
+            # The indexes track the live graph, which may be ahead of the snapshot.
+            if nid not in g:
+                continue
+            attrs = g.nodes[nid]
             label = str(attrs.get("label", "")).lower()
             content = str(attrs.get("content", "")).lower()
             node_type = attrs.get("type", "unknown")
@@ -148,14 +165,14 @@ class IntelligenceAgent(BaseAgent):
             # Check for Blockers
             if any(k in label or k in content for k in blocker_keywords):
                 blockers.append({"id": nid, "label": attrs.get("label", nid), "type": node_type, "detail": label})
-                
-            # Assume everything is a "recent change" for this simulation if it has a date
-            if attrs.get("date"):
-                changes.append(attrs.get("label", nid))
-                
-        # Deduplicate
+
+        # Changes are what the time index has in the last CHANGE_WINDOW seconds, newest first;
+        # if nothing is that fresh, fall back to the most recent dated nodes.
+        recent = graph.nodes_between(time.time() - self.CHANGE_WINDOW)[::-1] or graph.timeline.latest(5)
+        changes = [g.nodes[nid].get("label", nid) for nid in recent if nid in g][:5]
+
         return {
             "risks": risks,
             "blockers": blockers,
-            "changes": changes[-5:] # Last 5
+            "changes": changes
         }
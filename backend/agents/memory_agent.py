@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from uuid import uuid4
+from itertools import islice
 from .base_agent import BaseAgent
 from knowledge_graph import GraphBuilder
+from knowledge_graph.temporal_index import parse_window
+from knowledge_graph.text_index import tokenize
 from typing import Any
+from utils.dedup import event_id_for
 
 
 class MemoryAgent(BaseAgent):
@@ -24,36 +27,127 @@ class MemoryAgent(BaseAgent):
         self._version = 0
         self._last_update_ts: str | None = None
 
-    def update_knowledge(self, new_info: dict[str, Any]) -> dict[str, Any]:
+    _EXTRACTION_SCHEMA = (
+        "{\n"
+        '  "people": [{"name": string, "email": string|null}],\n'
+        '  "topics": [string],\n'
+        '  "decisions": [string],\n'
+        '  "urgency": "low"|"medium"|"high"\n'
+        "}\n"
+    )
+
+    async def update_knowledge(self, new_info: dict[str, Any]) -> dict[str, Any]:
         if not self._graph:
             raise RuntimeError("MemoryAgent requires a GraphBuilder instance.")
 
         self.log_reasoning("Received new information", {"keys": sorted(list(new_info.keys()))}, confidence=0.9)
         content = str(new_info.get("content") or "")
         topic = str(new_info.get("topic") or "")
-        stakeholders = new_info.get("stakeholders") or []
         priority = str(new_info.get("priority") or "")
 
         system = (
             "Extract from organizational info: people, topics, decisions, and urgency.\n"
-            "Return JSON only:\n"
-            "{\n"
-            '  "people": [{"name": string, "email": string|null}],\n'
-            '  "topics": [string],\n'
-            '  "decisions": [string],\n'
-            '  "urgency": "low"|"medium"|"high"\n'
-            "}\n"
+            "Return JSON only:\n" + self._EXTRACTION_SCHEMA
         )
         user = f"TOPIC: {topic}\nPRIORITY: {priority}\nCONTENT:\n{content[:8000]}"
 
         extracted: dict[str, Any]
         try:
-            extracted = self.openai_json(system=system, user=user)
+            extracted = await self.openai_json(system=system, user=user)
             self.log_reasoning("OpenAI extracted entities", {"preview": extracted}, confidence=0.8)
         except Exception as e:
-            extracted = {"people": [], "topics": [topic] if topic else [], "decisions": [], "urgency": "medium", "_error": str(e)}
+            extracted = self._fallback_extraction(new_info, e)
             self.log_reasoning("OpenAI extraction failed (fallback)", {"error": str(e)}, confidence=0.4)
 
+        nodes_added, edges_added = self._apply_extraction(new_info, extracted)
+        self._commit_version()
+        self.log_reasoning(
+            "Updated knowledge graph",
+            {"nodes_added": nodes_added, "edges_added": edges_added, "version": self._version},
+            confidence=0.85,
+        )
+
+        return {
+            "status": "updated",
+            "version": self._version,
+            "nodes_added": nodes_added,
+            "edges_added": edges_added,
+            "extracted": extracted,
+        }
+
+    async def update_knowledge_batch(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Extract entities for many items with one prompt and apply them as a single commit."""
+        return self.apply_batch(items, await self.extract_batch(items))
+
+    async def extract_batch(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Extract people/topics/decisions for numbered items in one multi-item prompt."""
+        if not items:
+            return []
+        self.log_reasoning("Received information batch", {"count": len(items)}, confidence=0.9)
+        system = (
+            "Extract from each numbered organizational update: people, topics, decisions, and urgency.\n"
+            'Return JSON only: {"items": [{"index": number, ...}]} with one entry per update, where each entry is:\n'
+            + self._EXTRACTION_SCHEMA
+        )
+        user = "\n\n".join(
+            f"[{i}] TOPIC: {item.get('topic') or ''}\nPRIORITY: {item.get('priority') or ''}\n"
+            f"CONTENT:\n{str(item.get('content') or '')[:4000]}"
+            for i, item in enumerate(items)
+        )
+
+        by_index: dict[int, dict[str, Any]] = {}
+        error: Exception = RuntimeError("missing from batch extraction")
+        try:
+            response = await self.openai_json(system=system, user=user)
+            for entry in response.get("items") or []:
+                if isinstance(entry, dict) and isinstance(entry.get("index"), int):
+                    by_index[entry.pop("index")] = entry
+            self.log_reasoning("OpenAI extracted entities (batch)", {"count": len(by_index)}, confidence=0.8)
+        except Exception as e:
+            error = e
+            self.log_reasoning("OpenAI batch extraction failed (fallback)", {"error": str(e)}, confidence=0.4)
+
+        return [by_index.get(i) or self._fallback_extraction(item, error) for i, item in enumerate(items)]
+
+    def apply_batch(self, items: list[dict[str, Any]], extracted: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Apply pre-extracted items to the graph as one commit (one version bump).
+
+        An item whose mutations fail gets ``status="error"``; its partial writes are rolled
+        back, so the commit holds only the items that succeeded.
+        """
+        if not self._graph:
+            raise RuntimeError("MemoryAgent requires a GraphBuilder instance.")
+        results: list[dict[str, Any]] = []
+        for item, ext in zip(items, extracted):
+            mark = self._graph.savepoint()
+            try:
+                nodes_added, edges_added = self._apply_extraction(item, ext)
+                results.append({"status": "updated", "nodes_added": nodes_added, "edges_added": edges_added, "extracted": ext})
+            except Exception as e:
+                self._graph.rollback(mark)
+                results.append({"status": "error", "error": str(e)})
+
+        if any(r["status"] == "updated" for r in results):
+            self._commit_version()
+        for r in results:
+            if r["status"] == "updated":
+                r["version"] = self._version
+        self.log_reasoning(
+            "Updated knowledge graph (batch)",
+            {"items": len(items), "version": self._version},
+            confidence=0.85,
+        )
+        return results
+
+    def _fallback_extraction(self, new_info: dict[str, Any], error: Exception) -> dict[str, Any]:
+        topic = str(new_info.get("topic") or "")
+        return {"people": [], "topics": [topic] if topic else [], "decisions": [], "urgency": "medium", "_error": str(error)}
+
+    def _apply_extraction(self, new_info: dict[str, Any], extracted: dict[str, Any]) -> tuple[int, int]:
+        """Write extracted people/topics/decisions and the source event into the graph."""
+        content = str(new_info.get("content") or "")
+        topic = str(new_info.get("topic") or "")
+        stakeholders = new_info.get("stakeholders") or []
         nodes_added = 0
         edges_added = 0
 
@@ -77,87 +171,116 @@ class MemoryAgent(BaseAgent):
                 self._graph.add_topic(t.strip())
                 nodes_added += 1
 
+        # Categorical facets the graph's bitmap index filters on.
+        facets = {
+            "priority": str(new_info.get("priority") or "").lower(),
+            "urgency": str(extracted.get("urgency") or "").lower(),
+            "topic": self._graph.topic_id(topic) if topic else "",
+        }
+        facets = {k: v for k, v in facets.items() if v}
+
+        # Undated updates are stamped with the time they were recorded, so they land in the time index.
+        # A relayed update's arrival time (metadata.received_at) wins over its send date, which
+        # stays in the event id only.
+        metadata = new_info.get("metadata") or {}
+        date = metadata.get("received_at") or new_info.get("date", "") or datetime.now().strftime("%Y-%m-%d %H:%M")
+
         decisions = extracted.get("decisions") or []
         if not decisions and content.strip():
             decisions = [content.strip().split("\n", 1)[0][:160]]
         for d in decisions:
             if isinstance(d, str) and d.strip():
-                did = self._graph.add_decision(d.strip(), content=d.strip(), date=new_info.get("date", "") or "")
+                did = self._graph.add_decision(d.strip(), content=d.strip(), date=date, props=facets)
                 nodes_added += 1
 
                 for s in stakeholders:
                     if isinstance(s, str) and s.strip():
-                        pid = self._graph.person_id(s.strip())
-                        self._graph.add_person(s.strip(), name=s.strip())
+                        pid = self._graph.add_person(s.strip(), name=s.strip())
                         self._graph.add_impact_edge(did, pid)
                         edges_added += 1
 
         # Always capture the source event as a node to ensure Timeline persistence
-        # (even if no decision was extracted).
+        # (even if no decision was extracted). Its id is a content hash, so a replay
+        # lands on the same node.
         if content.strip():
-            event_id = f"event:{uuid4().hex}"
-            event_label = (new_info.get("metadata", {}) or {}).get("subject") or f"{content[:30]}..."
+            event_id = event_id_for(new_info)
+            event_label = metadata.get("subject") or f"{content[:30]}..."
             self._graph.add_entity(
                 event_id,
                 label=event_label,
                 props={
                     "type": new_info.get("type", "event"),
-                    "date": new_info.get("date", "") or datetime.now().strftime("%Y-%m-%d %H:%M"),
+                    "date": date,
                     "content": content,
+                    **facets,
                 },
             )
             nodes_added += 1
 
+        return nodes_added, edges_added
+
+    def commit_changes(self, reason: str, details: dict[str, Any] | None = None) -> int:
+        """Version and commit graph changes made outside this agent (e.g. retention rollups)."""
+        self._commit_version()
+        self.log_reasoning(reason, {**(details or {}), "version": self._version}, confidence=0.9)
+        return self._version
+
+    def _commit_version(self) -> None:
         self._version += 1
+        self._graph.commit(self._version)
         self._last_update_ts = datetime.now(timezone.utc).isoformat()
-        self.log_reasoning(
-            "Updated knowledge graph",
-            {"nodes_added": nodes_added, "edges_added": edges_added, "version": self._version},
-            confidence=0.85,
-        )
-
-        return {
-            "status": "updated",
-            "version": self._version,
-            "nodes_added": nodes_added,
-            "edges_added": edges_added,
-            "extracted": extracted,
-        }
 
-    def query_knowledge(self, question: str) -> dict[str, Any]:
+    async def query_knowledge(self, question: str) -> dict[str, Any]:
         if not self._graph:
             raise RuntimeError("MemoryAgent requires a GraphBuilder instance.")
 
         self.log_reasoning("Processing query", {"question": question}, confidence=0.85)
-        g = self._graph.get_graph()
 
-        q = (question or "").lower()
-        hits = []
-        for nid, attrs in g.nodes(data=True):
-            label = str(attrs.get("label", "")).lower()
-            if q and (q in label or any(tok in label for tok in q.split()[:5])):
-                hits.append({"id": nid, **attrs})
-            if len(hits) >= 30:
-                break
+        # Nodes, edges and stats all come from one pinned committed version. The indexes track
+        # the live graph, which may be ahead of it, so their hits are filtered to the snapshot.
+        snap = self._graph.snapshot()
+        try:
+            g = snap.get_graph()
+            window = parse_window(question or "")
+            if window:
+                # Time-scoped question ("decisions this week"): newest nodes in the window from the
+                # time index, narrowed to any node type the question names.
+                types = self._graph.index.values("type").keys() & set(tokenize(question))
+                ids = self._graph.nodes_between(*window, **({"type": types} if types else {}))
+                ids = list(islice((nid for nid in reversed(ids) if nid in g), 30))
+            else:
+                # Most relevant nodes first (BM25 over label + content), not the first 30 scanned.
+                ids = [nid for nid, _ in self._graph.search_nodes(question or "", k=30) if nid in g]
+            hits = [{"id": nid, **g.nodes[nid]} for nid in ids]
+            # Only the 60 edges sent are materialized.
+            edges = [{"source": u, "target": v, **dict(attrs)} for u, v, attrs in islice(g.edges(data=True), 60)]
+            stats = snap.get_stats()
+        finally:
+            snap.release()
 
         # Provide a compact context to the model.
         context = {
-            "nodes": hits[:30],
-            "edges": self._graph.get_edges()[:60],
-            "stats": self._graph.get_stats(),
+            "nodes": hits,
+            "edges": edges,
+            "stats": stats,
         }
 
         system = "Answer questions using the provided knowledge graph context. Be concise."
         user = f"CONTEXT(JSON): {context}\n\nQUESTION: {question}"
         try:
-            answer = self.openai_text(system=system, user=user)
+            answer = await self.openai_text(system=system, user=user)
             self.log_reasoning("Query answered", {"answer_preview": answer[:200]}, confidence=0.75)
         except Exception as e:
-            answer = f"LLM unavailable: {e}"
             self.log_reasoning("Query failed", {"error": str(e)}, confidence=0.2)
+            # Flagged so the answer cache does not keep serving a transient outage.
+            return {"answer": f"LLM unavailable: {e}", "context": context, "llm_error": str(e)}
 
         return {"answer": answer, "context": context}
 
+    def restore_version(self, version: int) -> None:
+        """Resume version numbering after the graph was restored from disk."""
+        self._version = max(self._version, int(version))
+
     def get_graph_state(self) -> dict[str, Any]:
         if not self._graph:
             return {"version": self._version, "graph": None, "last_update": self._last_update_ts}
@@ -171,9 +294,11 @@ class MemoryAgent(BaseAgent):
         """Store or retrieve from memory based on input action."""
         action = input_data.get("action", "retrieve")
         if action in {"update", "update_knowledge"}:
-            return self.update_knowledge(input_data)
+            return await self.update_knowledge(input_data)
+        if action == "update_knowledge_batch":
+            return {"results": await self.update_knowledge_batch(input_data.get("items") or [])}
         if action in {"query", "query_knowledge"}:
-            return self.query_knowledge(str(input_data.get("question") or input_data.get("query") or ""))
+            return await self.query_knowledge(str(input_data.get("question") or input_data.get("query") or ""))
         if action in {"state", "graph_state"}:
             return self.get_graph_state()
         if action == "store":
@@ -187,7 +312,7 @@ class MemoryAgent(BaseAgent):
         return {"results": results, "count": len(results)}
 
     def get_capabilities(self) -> list[str]:
-        return ["store", "retrieve", "context", "update_knowledge", "query_knowledge", "graph_state"]
+        return ["store", "retrieve", "context", "update_knowledge", "update_knowledge_batch", "query_knowledge", "graph_state"]
 
 
 def _matches(entry: dict[str, Any], query: str) -> bool:
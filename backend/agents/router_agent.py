@@ -20,19 +20,26 @@ class RouterAgent(BaseAgent):
         self._graph = graph
         self._routes: dict[str, str] = {}
 
-    def route_information(self, message: dict[str, Any]) -> dict[str, Any]:
+    async def route_information(self, message: dict[str, Any]) -> dict[str, Any]:
         if not self._graph:
             raise RuntimeError("RouterAgent requires a GraphBuilder instance.")
 
         self.log_reasoning("Analyzing routing needs", {"keys": sorted(list(message.keys()))}, confidence=0.85)
 
-        g = self._graph.get_graph()
-        people = []
-        for nid, attrs in g.nodes(data=True):
-            if attrs.get("type") == "person":
-                people.append({"id": str(nid), "label": attrs.get("label", str(nid))})
-            if len(people) >= 60:
-                break
+        # People and degrees come from one pinned committed version, held until routing is done.
+        snap = self._graph.snapshot()
+        try:
+            return await self._route(message, snap.get_graph())
+        finally:
+            snap.release()
+
+    async def _route(self, message: dict[str, Any], g: Any) -> dict[str, Any]:
+        # The live index may list people the pinned version does not have yet.
+        people = [
+            {"id": str(nid), "label": g.nodes[nid].get("label", str(nid))}
+            for nid in self._graph.find_nodes(type="person", limit=60)
+            if nid in g
+        ]
 
         content = str(message.get("content") or "")
         topic = str(message.get("topic") or "")
@@ -50,14 +57,14 @@ class RouterAgent(BaseAgent):
         user = f"PEOPLE: {people}\n\nMESSAGE:\nTOPIC: {topic}\nPRIORITY: {priority}\nCONTENT: {content[:6000]}"
 
         try:
-            scored = self.openai_json(system=system, user=user)
+            scored = await self.openai_json(system=system, user=user)
             items = scored.get("scores") or []
             self.log_reasoning("OpenAI scored relevance", {"count": len(items)}, confidence=0.75)
         except Exception as e:
             stakeholders = message.get("stakeholders") or []
             stakeholder_set = {str(s).strip().lower() for s in stakeholders if str(s).strip()}
             # Heuristic fallback: prioritize explicit stakeholders, then high-degree nodes.
-            degree = dict(self._graph.get_graph().degree())
+            degree = {p["id"]: g.degree(p["id"]) for p in people if g.has_node(p["id"])}
             top_people = sorted(
                 [p for p in people if p["id"] in degree],
                 key=lambda p: degree.get(p["id"], 0),
@@ -95,11 +102,11 @@ class RouterAgent(BaseAgent):
         )
         return {"must_notify": must, "should_notify": should, "fyi": fyi}
 
-    def explain_routing_decision(self, person: dict[str, Any], decision: dict[str, Any], score: float) -> str:
+    async def explain_routing_decision(self, person: dict[str, Any], decision: dict[str, Any], score: float) -> str:
         system = "Explain in one short paragraph why someone should be notified."
         user = f"PERSON: {person}\nDECISION/INFO: {decision}\nSCORE: {score}"
         try:
-            return self.openai_text(system=system, user=user)
+            return await self.openai_text(system=system, user=user)
         except Exception:
             return person.get("reason") or "No explanation available."
 
@@ -107,7 +114,7 @@ class RouterAgent(BaseAgent):
         """Route either to an agent (intent routing) or compute a routing plan for a message."""
         action = input_data.get("action")
         if action in {"route", "route_information"} or ("content" in input_data and "intent" not in input_data):
-            return self.route_information(input_data)
+            return await self.route_information(input_data)
 
         intent = input_data.get("intent", "unknown")
         target = self._routes.get(intent, "coordinator")
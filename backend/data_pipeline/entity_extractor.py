@@ -5,14 +5,12 @@ Phase 2: adds OpenAI-backed extraction from emails.
 
 from __future__ import annotations
 
-import json
-import os
+import asyncio
 import re
-import time
 from typing import Any
 
-from dotenv import load_dotenv
-from openai import OpenAI
+from utils.llm_gateway import LLMGateway, get_llm_gateway
+
 
 class EntityExtractor:
     """Extract entities and relationships for the knowledge graph."""
@@ -21,10 +19,7 @@ class EntityExtractor:
         self._person_pattern = re.compile(r"\b([A-Z][a-z]+ [A-Z][a-z]+)\b")
         self._org_pattern = re.compile(r"\b([A-Z][a-z]+ (?:Team|Org|Dept|Group))\b", re.I)
 
-        load_dotenv()
-        self._api_key = os.getenv("OPENAI_API_KEY")
-        self._model = os.getenv("OPENAI_MODEL", "gpt-4o")
-        self._client: OpenAI | None = None
+        self._gateway: LLMGateway | None = None
 
     def extract_from_text(self, text: str) -> dict[str, Any]:
         """Extract entities and suggested relations from free text."""
@@ -36,20 +31,20 @@ class EntityExtractor:
             "relations": [],
         }
 
-    def _ensure_client(self):
-        if not self._api_key:
+    def _ensure_gateway(self) -> LLMGateway:
+        gateway = self._gateway or get_llm_gateway()
+        if not gateway.api_key:
             raise RuntimeError("OPENAI_API_KEY is not set (create backend/.env).")
-        if not self._client:
-            self._client = OpenAI(api_key=self._api_key)
-        return self._client
+        self._gateway = gateway
+        return gateway
 
-    def extract_from_email(self, email_dict: dict[str, Any]) -> dict[str, Any]:
+    async def extract_from_email(self, email_dict: dict[str, Any]) -> dict[str, Any]:
         """Extract structured entities from a single email dict.
 
         Expects keys like: id, date, sender, to, cc, subject, body
         Returns JSON with: people/topics/decisions/urgency.
         """
-        client = self._ensure_client()
+        gateway = self._ensure_gateway()
 
         subject = str(email_dict.get("subject", "") or "")
         sender = str(email_dict.get("sender", "") or "")
@@ -80,17 +75,7 @@ class EntityExtractor:
         )
 
         try:
-            resp = client.chat.completions.create(
-                model=self._model,
-                messages=[
-                    {"role": "system", "content": system},
-                    {"role": "user", "content": user_content},
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.2,
-            )
-            content = resp.choices[0].message.content or "{}"
-            return json.loads(content)
+            return await gateway.chat_json(system=system, user=user_content, temperature=0.2)
         except Exception as e:
             # Fallback: attempt best-effort extraction using regex.
             fallback = self.extract_from_text(f"{subject}\n\n{body}")
@@ -102,7 +87,7 @@ class EntityExtractor:
                 "_error": str(e),
             }
 
-    def batch_extract(
+    async def batch_extract(
         self,
         df: Any,
         limit: int = 100,
@@ -111,6 +96,8 @@ class EntityExtractor:
     ) -> dict[str, Any]:
         """Extract entities from a DataFrame of emails.
 
+        Emails within a batch are extracted concurrently through the shared gateway.
+
         Returns:
           {
             "emails": [{"email_id": "...", ...extracted...}, ...],
@@ -136,9 +123,9 @@ class EntityExtractor:
             start = bi * batch_size
             end = min(total, (bi + 1) * batch_size)
             batch = records[start:end]
-            for row in batch:
+            results = await asyncio.gather(*(self.extract_from_email(row) for row in batch))
+            for row, extracted in zip(batch, results):
                 email_id = str(row.get("id", "") or row.get("email_id", "") or "")
-                extracted = self.extract_from_email(row)
                 entry = {"email_id": email_id, **extracted}
                 emails_out.append(entry)
 
@@ -158,7 +145,7 @@ class EntityExtractor:
 
             print(f"Batch {bi + 1}/{batches} complete ({end} emails)")
             if bi < batches - 1 and sleep_seconds > 0:
-                time.sleep(sleep_seconds)
+                await asyncio.sleep(sleep_seconds)
 
         return {
             "emails": emails_out,
@@ -0,0 +1,27 @@
+"""DataFrame helpers that pre-aggregate email rows for GraphBuilder's bulk loaders."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def aggregate_edges(
+    pairs: pd.DataFrame,
+    source: str = "source",
+    target: str = "target",
+    id_column: str = "email_id",
+    ids_name: str = "email_ids",
+) -> pd.DataFrame:
+    """One row per (source, target) with ``weight`` (row count) and the list of ``id_column`` values.
+
+    The id lists are sliced out of one stable sort by group code; a ``groupby().agg(list)``
+    would build them group by group in Python.
+    """
+    grouped = pairs.groupby([source, target], sort=False)
+    edges = grouped.size().rename("weight").reset_index()
+    codes = grouped.ngroup().to_numpy()
+    ids = pairs[id_column].to_numpy()[np.argsort(codes, kind="stable")].tolist()
+    bounds = np.concatenate(([0], np.cumsum(edges["weight"].to_numpy()))).tolist()
+    edges[ids_name] = [ids[a:b] for a, b in zip(bounds, bounds[1:])]
+    return edges.rename(columns={source: "source", target: "target"})
@@ -1,6 +1,36 @@
 """OrgMind knowledge graph - entities and relationships."""
 
+from .bitmap_index import AttributeIndex, RoaringBitmap
+from .entity_resolver import EntityResolver
 from .graph_builder import GraphBuilder
 from .graph_export import GraphExporter
+from .graph_store import GraphStore
+from .snapshots import SnapshotPublisher, SnapshotWatcher
+from .temporal_index import TemporalIndex
+from .text_index import TextIndex
+from .versions import GraphSnapshot, VersionStore
 
-__all__ = ["GraphBuilder", "GraphExporter"]
+__all__ = [
+    "AttributeIndex",
+    "CompactGraph",
+    "EntityResolver",
+    "GraphBuilder",
+    "GraphExporter",
+    "GraphSnapshot",
+    "GraphStore",
+    "RoaringBitmap",
+    "SnapshotPublisher",
+    "SnapshotWatcher",
+    "TemporalIndex",
+    "TextIndex",
+    "VersionStore",
+]
+
+
+def __getattr__(name: str):
+    # The compact engine pulls in numpy (~50 ms), so it is only imported when asked for.
+    if name == "CompactGraph":
+        from .compact_graph import CompactGraph
+
+        return CompactGraph
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
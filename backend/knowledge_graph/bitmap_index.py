@@ -0,0 +1,292 @@
+"""Compressed bitmap indexes over categorical node attributes.
+
+``RoaringBitmap`` splits 32-bit ids by their high 16 bits into containers that are
+either a sorted ``array('H')`` (sparse, up to 4096 entries) or a 65536-bit Python
+int (dense), so AND/OR/ANDNOT run container by container at C speed.
+
+``AttributeIndex`` keeps one bitmap per (field, value) - node type, priority,
+urgency, topic and day/ISO-week date buckets - and answers conjunctive queries
+such as "decisions in topic X dated this week" without scanning the graph.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from datetime import date
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping
+
+if TYPE_CHECKING:
+    # numpy costs ~50 ms to import and only dense containers need it; loaded on first use.
+    import numpy as np
+
+ARRAY_MAX = 4096
+INDEXED_FIELDS = ("type", "priority", "urgency", "topic")
+DATE_BUCKETS = ("day", "week")
+
+
+def _to_bits(values: array) -> int:
+    import numpy as np
+
+    mask = np.zeros(1 << 16, dtype=bool)
+    mask[np.frombuffer(values, dtype=np.uint16)] = True
+    return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+
+
+def _from_bits(bits: int) -> np.ndarray:
+    import numpy as np
+
+    raw = np.frombuffer(bits.to_bytes(1 << 13, "little"), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(raw, bitorder="little")).astype(np.uint16)
+
+
+def _normalize(container: array | int) -> array | int | None:
+    """Pick the cheaper representation for a container (None when empty)."""
+    if isinstance(container, int):
+        n = container.bit_count()
+        if n == 0:
+            return None
+        return array("H", _from_bits(container).tobytes()) if n <= ARRAY_MAX else container
+    if not container:
+        return None
+    return _to_bits(container) if len(container) > ARRAY_MAX else container
+
+
+def _and(a: array | int, b: array | int) -> array | int | None:
+    if isinstance(a, int) and isinstance(b, int):
+        return _normalize(a & b)
+    if isinstance(a, int):
+        a, b = b, a
+    if isinstance(b, int):
+        import numpy as np
+
+        values = np.frombuffer(a, dtype=np.uint16)
+        mask = np.unpackbits(np.frombuffer(b.to_bytes(1 << 13, "little"), dtype=np.uint8), bitorder="little")
+        return _normalize(array("H", values[mask[values].astype(bool)].tobytes()))
+    return _normalize(array("H", sorted(set(a).intersection(b))))
+
+
+def _or(a: array | int, b: array | int) -> array | int | None:
+    if isinstance(a, int) or isinstance(b, int):
+        a_bits = a if isinstance(a, int) else _to_bits(a)
+        b_bits = b if isinstance(b, int) else _to_bits(b)
+        return _normalize(a_bits | b_bits)
+    return _normalize(array("H", sorted(set(a).union(b))))
+
+
+def _andnot(a: array | int, b: array | int) -> array | int | None:
+    if isinstance(a, int):
+        return _normalize(a & ~(b if isinstance(b, int) else _to_bits(b)))
+    if isinstance(b, int):
+        import numpy as np
+
+        values = np.frombuffer(a, dtype=np.uint16)
+        mask = np.unpackbits(np.frombuffer(b.to_bytes(1 << 13, "little"), dtype=np.uint8), bitorder="little")
+        return _normalize(array("H", values[~mask[values].astype(bool)].tobytes()))
+    drop = set(b)
+    return _normalize(array("H", [x for x in a if x not in drop]))
+
+
+class RoaringBitmap:
+    """Set of non-negative ints stored as array/bitset containers per 65536-id chunk."""
+
+    __slots__ = ("_c",)
+
+    def __init__(self, values: Iterable[int] = ()):
+        self._c: dict[int, array | int] = {}
+        for v in values:
+            self.add(v)
+
+    def add(self, value: int) -> None:
+        hi, lo = value >> 16, value & 0xFFFF
+        c = self._c.get(hi)
+        if c is None:
+            self._c[hi] = array("H", [lo])
+        elif isinstance(c, int):
+            self._c[hi] = c | (1 << lo)
+        else:
+            i = bisect_left(c, lo)
+            if i == len(c) or c[i] != lo:
+                c.insert(i, lo)
+                if len(c) > ARRAY_MAX:
+                    self._c[hi] = _to_bits(c)
+
+    def discard(self, value: int) -> None:
+        hi, lo = value >> 16, value & 0xFFFF
+        c = self._c.get(hi)
+        if c is None:
+            return
+        if isinstance(c, int):
+            c &= ~(1 << lo)
+        else:
+            i = bisect_left(c, lo)
+            if i == len(c) or c[i] != lo:
+                return
+            del c[i]
+        c = _normalize(c)
+        if c is None:
+            del self._c[hi]
+        else:
+            self._c[hi] = c
+
+    def __contains__(self, value: int) -> bool:
+        c = self._c.get(value >> 16)
+        if c is None:
+            return False
+        lo = value & 0xFFFF
+        if isinstance(c, int):
+            return bool((c >> lo) & 1)
+        i = bisect_left(c, lo)
+        return i < len(c) and c[i] == lo
+
+    def __len__(self) -> int:
+        return sum(c.bit_count() if isinstance(c, int) else len(c) for c in self._c.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._c)
+
+    def __iter__(self) -> Iterator[int]:
+        for hi in sorted(self._c):
+            c = self._c[hi]
+            base = hi << 16
+            values = _from_bits(c) if isinstance(c, int) else c
+            for lo in values.tolist():
+                yield base + lo
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, RoaringBitmap) and self._c == other._c
+
+    def copy(self) -> "RoaringBitmap":
+        out = RoaringBitmap()
+        out._c = {hi: c if isinstance(c, int) else array("H", c) for hi, c in self._c.items()}
+        return out
+
+    def _combine(self, other: "RoaringBitmap", op, keep_left: bool, keep_right: bool) -> "RoaringBitmap":
+        out = RoaringBitmap()
+        for hi in self._c.keys() | other._c.keys():
+            a, b = self._c.get(hi), other._c.get(hi)
+            if a is not None and b is not None:
+                c = op(a, b)
+            elif a is not None and keep_left:
+                c = a if isinstance(a, int) else array("H", a)
+            elif b is not None and keep_right:
+                c = b if isinstance(b, int) else array("H", b)
+            else:
+                c = None
+            if c is not None:
+                out._c[hi] = c
+        return out
+
+    def __and__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        return self._combine(other, _and, False, False)
+
+    def __or__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        return self._combine(other, _or, True, True)
+
+    def __sub__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        return self._combine(other, _andnot, True, False)
+
+    def __repr__(self) -> str:
+        return f"RoaringBitmap(len={len(self)})"
+
+
+def date_buckets(value: Any) -> dict[str, str]:
+    """``{"day": "2024-01-15", "week": "2024-W03"}`` for an ISO-ish date string, else ``{}``."""
+    try:
+        d = date.fromisoformat(str(value)[:10])
+    except (TypeError, ValueError):
+        return {}
+    year, week, _ = d.isocalendar()
+    return {"day": d.isoformat(), "week": f"{year}-W{week:02d}"}
+
+
+class AttributeIndex:
+    """Bitmaps of node ids per (field, value), maintained by GraphBuilder on every mutation."""
+
+    def __init__(self, fields: tuple[str, ...] = INDEXED_FIELDS):
+        self.fields = fields
+        self._ids: dict[str, int] = {}
+        self._keys: list[str | None] = []
+        self._entries: dict[int, tuple[tuple[str, str], ...]] = {}
+        self._bitmaps: dict[str, dict[str, RoaringBitmap]] = {f: {} for f in (*fields, *DATE_BUCKETS)}
+        self._live = RoaringBitmap()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _extract(self, attrs: Mapping[str, Any]) -> tuple[tuple[str, str], ...]:
+        pairs = []
+        for field in self.fields:
+            value = attrs.get(field, "unknown" if field == "type" else None)
+            if value not in (None, ""):
+                pairs.append((field, str(value)))
+        pairs.extend(date_buckets(attrs.get("date")).items())
+        return tuple(pairs)
+
+    def update(self, key: str, attrs: Mapping[str, Any]) -> None:
+        """Index (or re-index) node ``key`` from its current attributes."""
+        i = self._ids.get(key)
+        if i is None:
+            i = self._ids[key] = len(self._keys)
+            self._keys.append(key)
+            self._live.add(i)
+        new = self._extract(attrs)
+        old = self._entries.get(i, ())
+        if new == old:
+            self._entries[i] = new
+            return
+        for field, value in old:
+            if (field, value) not in new:
+                bm = self._bitmaps[field][value]
+                bm.discard(i)
+                if not bm:
+                    del self._bitmaps[field][value]
+        for field, value in new:
+            self._bitmaps[field].setdefault(value, RoaringBitmap()).add(i)
+        self._entries[i] = new
+
+    def remove(self, key: str) -> None:
+        i = self._ids.pop(key, None)
+        if i is None:
+            return
+        for field, value in self._entries.pop(i, ()):
+            bm = self._bitmaps[field][value]
+            bm.discard(i)
+            if not bm:
+                del self._bitmaps[field][value]
+        self._live.discard(i)
+        self._keys[i] = None
+
+    def rebuild(self, nodes: Iterable[tuple[str, Mapping[str, Any]]]) -> None:
+        self.__init__(self.fields)
+        for key, attrs in nodes:
+            self.update(key, attrs)
+
+    def bitmap(self, field: str, value: str) -> RoaringBitmap:
+        return self._bitmaps[field].get(value) or RoaringBitmap()
+
+    def query(self, **filters: Any) -> RoaringBitmap:
+        """AND across fields, OR across the values given for one field (a str or a collection)."""
+        result = self._live
+        for field, wanted in filters.items():
+            if field not in self._bitmaps:
+                raise KeyError(f"Field {field!r} is not indexed")
+            values = [wanted] if isinstance(wanted, str) else list(wanted)
+            matched = RoaringBitmap()
+            for v in values:
+                matched = matched | self.bitmap(field, str(v))
+            result = result & matched
+        return result if filters else result.copy()
+
+    def keys(self, bitmap: RoaringBitmap, limit: int | None = None) -> list[str]:
+        """Node keys for the ids in ``bitmap``, in insertion order."""
+        out = []
+        for i in bitmap:
+            out.append(self._keys[i])
+            if limit is not None and len(out) >= limit:
+                break
+        return out
+
+    def values(self, field: str) -> dict[str, int]:
+        """Distinct values of ``field`` with their node counts."""
+        return {v: len(bm) for v, bm in self._bitmaps[field].items()}
@@ -0,0 +1,340 @@
+"""Versioned columnar snapshot format for the knowledge graph.
+
+One file holds::
+
+    MAGIC (8 bytes) | header length (u64 LE) | header JSON | padding | buffers
+
+The header describes a node table and an edge table. Every attribute is one
+typed column:
+
+    str                    int32 codes into the file's shared string dictionary (-1 = absent)
+    text                   code-point offsets (int64) into a UTF-8 blob; for long, mostly
+                           unique strings such as ``content``
+    int / float / bool     int64 / float64 / uint8 values
+    json                   a text column of JSON-encoded values (lists, dicts, mixed types, None);
+                           tuples, sets and datetimes are tagged ``{"$type": ...}`` so they load
+                           back as the same type, and any other value is rejected
+
+Columns where some rows lack the attribute also carry a uint8 validity mask.
+
+Each buffer is a raw little-endian array at a 64-byte-aligned offset. Loading
+mmaps the file only so that columns dropped via ``exclude`` are never read from
+disk; every kept column is decoded into Python objects for the DiGraph, so a
+loaded graph takes as much memory as one restored from a pickle. Nothing is
+unpickled.
+
+Older pickle snapshots are still read (``read_graph`` sniffs the magic); new
+ones are written in the format chosen by ``ORG_GRAPH_FORMAT`` (``columnar`` by
+default, or ``pickle``).
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import pickle
+import struct
+from datetime import date, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterable
+
+import networkx as nx
+
+if TYPE_CHECKING:
+    # numpy costs ~50 ms to import; it is loaded on the first columnar read or write.
+    import numpy as np
+
+MAGIC = b"OMKGCOL\x00"
+FORMAT_VERSION = 1
+SNAPSHOT_FORMATS = ("columnar", "pickle")
+
+_ALIGN = 64
+_ABSENT = object()
+
+
+def _aligned(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _encode(value: Any) -> Any:
+    """``value`` as plain JSON, with tuples, sets and datetimes tagged so they round-trip."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    if isinstance(value, dict):
+        if not all(isinstance(k, str) for k in value):
+            raise TypeError("Columnar snapshots only store dicts with string keys; use ORG_GRAPH_FORMAT=pickle")
+        return {k: _encode(v) for k, v in value.items()}
+    import numpy as np
+
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (tuple, set, frozenset)):
+        return {"$type": type(value).__name__, "items": [_encode(v) for v in value]}
+    if isinstance(value, (datetime, date)):
+        return {"$type": type(value).__name__, "iso": value.isoformat()}
+    raise TypeError(f"Cannot store a {type(value).__name__} in a columnar snapshot; use ORG_GRAPH_FORMAT=pickle")
+
+
+_DECODERS = {
+    "tuple": lambda d: tuple(d["items"]),
+    "set": lambda d: set(d["items"]),
+    "frozenset": lambda d: frozenset(d["items"]),
+    "datetime": lambda d: datetime.fromisoformat(d["iso"]),
+    "date": lambda d: date.fromisoformat(d["iso"]),
+}
+
+
+def _decode(obj: dict[str, Any]) -> Any:
+    kind = obj.get("$type")
+    return _DECODERS[kind](obj) if isinstance(kind, str) and kind in _DECODERS else obj
+
+
+class _Writer:
+    def __init__(self):
+        self.buffers: list[tuple[str, int, bytes]] = []
+        self.strings: dict[str, int] = {}
+
+    def add(self, array: np.ndarray) -> int:
+        import numpy as np
+
+        array = np.ascontiguousarray(array)
+        dtype = array.dtype.newbyteorder("<") if array.dtype.byteorder == ">" else array.dtype
+        self.buffers.append((dtype.str, int(array.size), array.astype(dtype, copy=False).tobytes()))
+        return len(self.buffers) - 1
+
+    def add_bytes(self, data: bytes) -> int:
+        self.buffers.append(("|u1", len(data), data))
+        return len(self.buffers) - 1
+
+    def intern(self, value: str) -> int:
+        code = self.strings.get(value)
+        if code is None:
+            code = self.strings[value] = len(self.strings)
+        return code
+
+    def text(self, values: list[str]) -> tuple[int, int]:
+        import numpy as np
+
+        lengths = np.fromiter((len(v) for v in values), dtype=np.int64, count=len(values))
+        offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return self.add(offsets), self.add_bytes("".join(values).encode("utf-8"))
+
+    def column(self, name: str, values: list[Any]) -> dict[str, Any]:
+        """Encode one attribute column (``_ABSENT`` marks rows without the attribute)."""
+        import numpy as np
+
+        present = [v for v in values if v is not _ABSENT]
+        valid = np.fromiter((v is not _ABSENT for v in values), dtype=np.uint8, count=len(values))
+        types = {type(v) for v in present}
+        col: dict[str, Any] = {"name": name}
+        if types <= {str} and len(set(present)) * 2 <= len(present):
+            col["kind"] = "str"
+            codes = [self.intern(v) if v is not _ABSENT else -1 for v in values]
+            col["values"] = self.add(np.asarray(codes, dtype=np.int32))
+        elif types <= {str}:
+            col["kind"] = "text"
+            col["offsets"], col["values"] = self.text([v if v is not _ABSENT else "" for v in values])
+        elif types == {bool}:
+            col["kind"] = "bool"
+            col["values"] = self.add(np.asarray([bool(v) if v is not _ABSENT else False for v in values], dtype=np.uint8))
+        elif types == {int} and all(-(2**63) <= v < 2**63 for v in present):
+            col["kind"] = "int"
+            col["values"] = self.add(np.asarray([v if v is not _ABSENT else 0 for v in values], dtype=np.int64))
+        elif types == {float}:
+            col["kind"] = "float"
+            col["values"] = self.add(np.asarray([v if v is not _ABSENT else 0.0 for v in values], dtype=np.float64))
+        else:
+            col["kind"] = "json"
+            col["offsets"], col["values"] = self.text(
+                [json.dumps(_encode(v)) if v is not _ABSENT else "" for v in values]
+            )
+        if not valid.all():
+            col["valid"] = self.add(valid)
+        return col
+
+
+def _table(writer: _Writer, rows: list[Any]) -> list[dict[str, Any]]:
+    """Columns for a list of attribute mappings, in first-seen key order."""
+    names: dict[str, None] = {}
+    for attrs in rows:
+        names.update(dict.fromkeys(attrs))
+    return [writer.column(name, [attrs.get(name, _ABSENT) for attrs in rows]) for name in names]
+
+
+def write_columnar(graph: Any, f: BinaryIO, version: int | None = None) -> None:
+    """Write ``graph`` (networkx or CompactGraph) to the binary file ``f``."""
+    import numpy as np
+
+    writer = _Writer()
+    node_ids = list(graph.nodes)
+    position = {n: i for i, n in enumerate(node_ids)}
+    node_rows = [graph.nodes[n] for n in node_ids]
+    edge_list = list(graph.edges(data=True))
+
+    header: dict[str, Any] = {
+        "format": FORMAT_VERSION,
+        "graph_version": version,
+        "graph": _encode(dict(getattr(graph, "graph", {}) or {})),
+        "nodes": {
+            "count": len(node_ids),
+            "id": writer.column("id", node_ids),
+            "columns": _table(writer, node_rows),
+        },
+        "edges": {
+            "count": len(edge_list),
+            "src": writer.add(np.fromiter((position[u] for u, _, _ in edge_list), dtype=np.int32, count=len(edge_list))),
+            "dst": writer.add(np.fromiter((position[v] for _, v, _ in edge_list), dtype=np.int32, count=len(edge_list))),
+            "columns": _table(writer, [attrs for _, _, attrs in edge_list]),
+        },
+    }
+    strings = list(writer.strings)
+    header["strings"] = dict(zip(("offsets", "values"), writer.text(strings)))
+
+    layout, offset = [], 0
+    for dtype, count, data in writer.buffers:
+        layout.append({"dtype": dtype, "count": count, "offset": offset, "nbytes": len(data)})
+        offset = _aligned(offset + len(data))
+    header["buffers"] = layout
+
+    raw = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    prefix = MAGIC + struct.pack("<Q", len(raw)) + raw
+    f.write(prefix + b"\0" * (_aligned(len(prefix)) - len(prefix)))
+    for _, _, data in writer.buffers:
+        f.write(data)
+        f.write(b"\0" * (_aligned(len(data)) - len(data)))
+
+
+class _Reader:
+    def __init__(self, mm: mmap.mmap):
+        if mm[: len(MAGIC)] != MAGIC:
+            raise ValueError("Not a columnar graph snapshot")
+        (length,) = struct.unpack_from("<Q", mm, len(MAGIC))
+        start = len(MAGIC) + 8
+        self.header = json.loads(mm[start : start + length], object_hook=_decode)
+        if self.header.get("format") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported columnar snapshot format {self.header.get('format')!r}")
+        self.mm = mm
+        self.base = _aligned(start + length)
+        self._strings: list[str] | None = None
+
+    def array(self, i: int) -> list[Any]:
+        import numpy as np
+
+        b = self.header["buffers"][i]
+        return np.frombuffer(self.mm, dtype=b["dtype"], count=b["count"], offset=self.base + b["offset"]).tolist()
+
+    def blob(self, i: int) -> str:
+        b = self.header["buffers"][i]
+        start = self.base + b["offset"]
+        return self.mm[start : start + b["nbytes"]].decode("utf-8")
+
+    def text(self, offsets: int, values: int) -> list[str]:
+        bounds, blob = self.array(offsets), self.blob(values)
+        return [blob[a:b] for a, b in zip(bounds, bounds[1:])]
+
+    def strings(self) -> list[str]:
+        if self._strings is None:
+            s = self.header["strings"]
+            self._strings = self.text(s["offsets"], s["values"])
+        return self._strings
+
+    def column(self, col: dict[str, Any]) -> list[Any]:
+        kind = col["kind"]
+        if kind == "str":
+            strings = self.strings()
+            return [strings[c] if c >= 0 else _ABSENT for c in self.array(col["values"])]
+        if kind in ("text", "json"):
+            values: list[Any] = self.text(col["offsets"], col["values"])
+        else:
+            values = self.array(col["values"])
+            if kind == "bool":
+                values = [bool(v) for v in values]
+        if "valid" in col and kind != "str":
+            values = [v if ok else _ABSENT for v, ok in zip(values, self.array(col["valid"]))]
+        if kind == "json":
+            values = [json.loads(v, object_hook=_decode) if v is not _ABSENT else _ABSENT for v in values]
+        return values
+
+    def rows(self, table: dict[str, Any], exclude: frozenset[str]) -> list[dict[str, Any]]:
+        dense, sparse = {}, {}
+        for col in table["columns"]:
+            if col["name"] not in exclude:
+                values = self.column(col)
+                (sparse if "valid" in col else dense)[col["name"]] = values
+        # Columns present on every row zip straight into dicts; only gappy ones are filled per cell.
+        if dense:
+            names = tuple(dense)
+            rows = [dict(zip(names, values)) for values in zip(*dense.values())]
+        else:
+            rows = [{} for _ in range(table["count"])]
+        for name, values in sparse.items():
+            for attrs, value in zip(rows, values):
+                if value is not _ABSENT:
+                    attrs[name] = value
+        return rows
+
+
+def read_header(path: str | Path) -> dict[str, Any]:
+    """The header of a columnar snapshot (format, graph version, tables, buffer layout)."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _Reader(mm).header
+
+
+def read_columnar(path: str | Path, exclude: Iterable[str] = ()) -> nx.DiGraph:
+    """Load a columnar snapshot, skipping the node/edge attribute columns named in ``exclude``."""
+    skip = frozenset(exclude)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        reader = _Reader(mm)
+        header = reader.header
+        node_ids = reader.column(header["nodes"]["id"])
+        node_rows = reader.rows(header["nodes"], skip)
+        edges = header["edges"]
+        src, dst = reader.array(edges["src"]), reader.array(edges["dst"])
+        edge_rows = reader.rows(edges, skip)
+
+    g = nx.DiGraph()
+    g.graph.update(header.get("graph") or {})
+    # Fill DiGraph's adjacency dicts directly (the layout a pickle restores): ids are unique
+    # and edges already deduplicated, so add_edges_from's per-edge checks are pure overhead
+    # (about 3.5x slower on 300k edges). This relies on DiGraph internals, so networkx is
+    # pinned in requirements.txt and TestColumnarFormat checks the result against the public API.
+    succ_of = [{} for _ in node_ids]
+    pred_of = [{} for _ in node_ids]
+    for u, v, attrs in zip(src, dst, edge_rows):
+        succ_of[u][node_ids[v]] = attrs
+        pred_of[v][node_ids[u]] = attrs
+    g._node.update(zip(node_ids, node_rows))
+    g._succ.update(zip(node_ids, succ_of))
+    g._pred.update(zip(node_ids, pred_of))
+    return g
+
+
+def is_columnar(path: str | Path) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def write_graph(graph: Any, f: BinaryIO, fmt: str | None = None, version: int | None = None) -> None:
+    """Write ``graph`` to ``f`` as ``fmt`` (default ``ORG_GRAPH_FORMAT``, else ``columnar``)."""
+    fmt = fmt or os.getenv("ORG_GRAPH_FORMAT", "columnar")
+    if fmt not in SNAPSHOT_FORMATS:
+        raise ValueError(f"Unknown graph format {fmt!r}; expected one of {SNAPSHOT_FORMATS}")
+    if fmt == "pickle":
+        pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+    else:
+        write_columnar(graph, f, version=version)
+
+
+def read_graph(path: str | Path, exclude: Iterable[str] = ()) -> Any:
+    """Load a snapshot in either format; ``exclude`` only applies to columnar files.
+
+    Pickle snapshots are only for trusted, legacy files.
+    """
+    if is_columnar(path):
+        return read_columnar(path, exclude=exclude)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return pickle.loads(mm)
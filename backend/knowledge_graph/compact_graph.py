@@ -0,0 +1,616 @@
+"""Compact array-backed directed graph with a networkx-compatible surface.
+
+Node keys are interned to dense integer ids. Edges live in parallel ``array('i')``
+columns and are indexed by CSR (out) / CSC (in) adjacency arrays; new edges go to a
+small append buffer that is folded into the CSR/CSC arrays by periodic compaction.
+Node and edge attributes are stored column-wise: low-cardinality string columns
+(``type``, ``relation_type``, ``date``...) are dictionary-encoded into int32 codes,
+everything else is a plain Python list.
+
+``fork()`` is the copy-on-write copy used by GraphBuilder: attribute columns and
+append-buffer lists stay shared with the original until the fork first writes to them.
+
+Only the subset of the ``networkx.DiGraph`` API that OrgMind uses is implemented;
+``to_networkx()`` materialises a real DiGraph for algorithms such as layouts.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import MutableMapping
+from typing import Any, Iterable, Iterator
+
+import networkx as nx
+import numpy as np
+
+
+class _Missing:
+    """Marker for an absent attribute value (pickles back to the singleton)."""
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+    def __reduce__(self) -> str:
+        return "_MISSING"
+
+
+_MISSING = _Missing()
+
+
+class _DictColumn:
+    """Dictionary-encoded string column: int32 codes into a value table."""
+
+    # Above this many distinct values, and when most values are distinct, encoding stops paying off.
+    MAX_DISTINCT = 1024
+
+    def __init__(self):
+        self.codes = array("i")
+        self.values: list[str] = []
+        self.index: dict[str, int] = {}
+        self.count = 0
+
+    def get(self, row: int) -> Any:
+        if row >= len(self.codes):
+            return _MISSING
+        code = self.codes[row]
+        return _MISSING if code < 0 else self.values[code]
+
+    def set(self, row: int, value: str) -> None:
+        if row >= len(self.codes):
+            self.codes.extend([-1] * (row + 1 - len(self.codes)))
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+        if self.codes[row] < 0:
+            self.count += 1
+        self.codes[row] = code
+
+    def delete(self, row: int) -> bool:
+        if row < len(self.codes) and self.codes[row] >= 0:
+            self.codes[row] = -1
+            self.count -= 1
+            return True
+        return False
+
+    def too_diverse(self) -> bool:
+        return len(self.values) > self.MAX_DISTINCT and len(self.values) * 2 > self.count
+
+    def take(self, rows: np.ndarray) -> "_DictColumn":
+        col = _DictColumn()
+        codes = np.full(max(len(self.codes), int(rows.max()) + 1 if len(rows) else 0), -1, dtype=np.int32)
+        codes[: len(self.codes)] = np.frombuffer(self.codes, dtype=np.int32)
+        picked = codes[rows]
+        col.codes = array("i", picked.tobytes())
+        # Copied, not shared: this column may belong to a published fork that must not change.
+        col.values = list(self.values)
+        col.index = dict(self.index)
+        col.count = int((picked >= 0).sum())
+        return col
+
+    def __deepcopy__(self, memo: dict) -> "_DictColumn":
+        col = _DictColumn()
+        col.codes = array("i", self.codes)
+        col.values = list(self.values)
+        col.index = dict(self.index)
+        col.count = self.count
+        return col
+
+
+class _ObjectColumn:
+    """Generic column of Python objects."""
+
+    def __init__(self, values: list[Any] | None = None):
+        self.values: list[Any] = values or []
+
+    def get(self, row: int) -> Any:
+        return self.values[row] if row < len(self.values) else _MISSING
+
+    def set(self, row: int, value: Any) -> None:
+        if row >= len(self.values):
+            self.values.extend([_MISSING] * (row + 1 - len(self.values)))
+        self.values[row] = value
+
+    def delete(self, row: int) -> bool:
+        if row < len(self.values) and self.values[row] is not _MISSING:
+            self.values[row] = _MISSING
+            return True
+        return False
+
+    def take(self, rows: np.ndarray) -> "_ObjectColumn":
+        n = len(self.values)
+        return _ObjectColumn([self.values[r] if r < n else _MISSING for r in rows.tolist()])
+
+    def __deepcopy__(self, memo: dict) -> "_ObjectColumn":
+        return _ObjectColumn(list(self.values))
+
+
+class _Table:
+    """Column store of attribute rows addressed by integer id."""
+
+    def __init__(self):
+        self.columns: dict[str, _DictColumn | _ObjectColumn] = {}
+        # Columns still shared with the table this one was forked from; copied on first write.
+        self._shared: set[str] = set()
+
+    def get(self, row: int, key: str) -> Any:
+        col = self.columns.get(key)
+        return _MISSING if col is None else col.get(row)
+
+    def _writable(self, key: str) -> _DictColumn | _ObjectColumn:
+        col = self.columns[key]
+        if key in self._shared:
+            col = self.columns[key] = col.__deepcopy__({})
+            self._shared.discard(key)
+        return col
+
+    def set(self, row: int, key: str, value: Any) -> None:
+        col = self.columns.get(key)
+        if col is None:
+            col = self.columns[key] = _DictColumn() if isinstance(value, str) else _ObjectColumn()
+        elif isinstance(col, _DictColumn) and (not isinstance(value, str) or col.too_diverse()):
+            col = self.columns[key] = _ObjectColumn([col.get(r) for r in range(len(col.codes))])
+            self._shared.discard(key)
+        else:
+            col = self._writable(key)
+        col.set(row, value)
+
+    def delete(self, row: int, key: str) -> bool:
+        col = self.columns.get(key)
+        return col is not None and col.get(row) is not _MISSING and self._writable(key).delete(row)
+
+    def keys(self, row: int) -> list[str]:
+        return [k for k, col in self.columns.items() if col.get(row) is not _MISSING]
+
+    def row(self, row: int) -> dict[str, Any]:
+        out = {}
+        for k, col in self.columns.items():
+            v = col.get(row)
+            if v is not _MISSING:
+                out[k] = v
+        return out
+
+    def clear_row(self, row: int) -> None:
+        for key in self.keys(row):
+            self._writable(key).delete(row)
+
+    def take(self, rows: np.ndarray) -> "_Table":
+        table = _Table()
+        table.columns = {k: col.take(rows) for k, col in self.columns.items()}
+        return table
+
+    def copy(self) -> "_Table":
+        table = _Table()
+        table.columns = {k: col.__deepcopy__({}) for k, col in self.columns.items()}
+        return table
+
+    def fork(self) -> "_Table":
+        """A table sharing every column with this one; each is copied on its first write."""
+        table = _Table()
+        table.columns = dict(self.columns)
+        table._shared = set(self.columns)
+        return table
+
+
+class AttrView(MutableMapping):
+    """Live, mutable mapping over one node's or edge's attribute row."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: _Table, row: int):
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._table.get(self._row, key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._table.set(self._row, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if not self._table.delete(self._row, key):
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.keys(self._row))
+
+    def __len__(self) -> int:
+        return len(self._table.keys(self._row))
+
+    def clear(self) -> None:
+        self._table.clear_row(self._row)
+
+    def __repr__(self) -> str:
+        return repr(self._table.row(self._row))
+
+
+class _NodeView:
+    def __init__(self, graph: "CompactGraph"):
+        self._g = graph
+
+    def __iter__(self) -> Iterator[str]:
+        return (k for k in self._g._keys if k is not None)
+
+    def __len__(self) -> int:
+        return self._g.number_of_nodes()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._g._ids
+
+    def __getitem__(self, key: str) -> AttrView:
+        return AttrView(self._g._node_attrs, self._g._ids[key])
+
+    def __call__(self, data: bool | str = False, default: Any = None) -> Iterable[Any]:
+        g = self._g
+        if data is False:
+            return iter(self)
+        if data is True:
+            return ((k, AttrView(g._node_attrs, i)) for i, k in enumerate(g._keys) if k is not None)
+        return ((k, g._node_attrs.row(i).get(data, default)) for i, k in enumerate(g._keys) if k is not None)
+
+
+class _EdgeView:
+    def __init__(self, graph: "CompactGraph"):
+        self._g = graph
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        keys = self._g._keys
+        return ((keys[u], keys[v]) for _, u, v in self._g._live_edges())
+
+    def __len__(self) -> int:
+        return self._g.number_of_edges()
+
+    def __contains__(self, edge: object) -> bool:
+        u, v = edge  # type: ignore[misc]
+        return self._g.has_edge(u, v)
+
+    def __getitem__(self, edge: tuple[str, str]) -> AttrView:
+        eid = self._g._edge_id(*edge)
+        if eid < 0:
+            raise KeyError(edge)
+        return AttrView(self._g._edge_attrs, eid)
+
+    def __call__(self, data: bool | str = False, default: Any = None) -> Iterable[Any]:
+        g = self._g
+        keys = g._keys
+        if data is False:
+            return iter(self)
+        if data is True:
+            return ((keys[u], keys[v], AttrView(g._edge_attrs, e)) for e, u, v in g._live_edges())
+        return ((keys[u], keys[v], g._edge_attrs.row(e).get(data, default)) for e, u, v in g._live_edges())
+
+
+class CompactGraph:
+    """Directed graph over interned int ids with CSR/CSC adjacency and columnar attributes."""
+
+    def __init__(self, compact_min: int = 1024, compact_ratio: float = 0.1):
+        self.compact_min = compact_min
+        self.compact_ratio = compact_ratio
+        # Nodes: key <-> dense id. Removed nodes leave a None slot until compaction.
+        self._ids: dict[str, int] = {}
+        self._keys: list[str | None] = []
+        self._node_attrs = _Table()
+        # Edges: parallel columns indexed by edge id; dead edges are tombstoned.
+        self._e_src = array("i")
+        self._e_dst = array("i")
+        self._e_alive = bytearray()
+        self._edge_attrs = _Table()
+        self._n_edges = 0
+        # Compacted adjacency over node ids [0, _csr_nodes).
+        # Built with numpy, held as ``array`` so point lookups avoid numpy scalar overhead.
+        self._csr_nodes = 0
+        self._out_ptr = array("q", [0])
+        self._out_dst = array("i")
+        self._out_eid = array("i")
+        self._in_ptr = array("q", [0])
+        self._in_src = array("i")
+        self._in_eid = array("i")
+        self._dead_in_csr = 0
+        # Append buffer: edges added since the last compaction, by endpoint.
+        self._buf_out: dict[int, list[int]] = {}
+        self._buf_in: dict[int, list[int]] = {}
+        # After fork(): the buffer lists this graph owns (the rest are shared). None = owns all.
+        self._buf_owned: set[tuple[bool, int]] | None = None
+        self._buffered = 0
+        self._dead_nodes = 0
+
+    # -- construction / conversion ------------------------------------------------
+
+    @classmethod
+    def from_networkx(cls, graph: nx.DiGraph) -> "CompactGraph":
+        g = cls()
+        for n, attrs in graph.nodes(data=True):
+            g.add_node(n, **attrs)
+        for u, v, attrs in graph.edges(data=True):
+            g.add_edge(u, v, **attrs)
+        g.compact()
+        return g
+
+    def to_networkx(self) -> nx.DiGraph:
+        """Materialise an equivalent ``networkx.DiGraph`` (compatibility view)."""
+        graph = nx.DiGraph()
+        for i, k in enumerate(self._keys):
+            if k is not None:
+                graph.add_node(k, **self._node_attrs.row(i))
+        keys = self._keys
+        for e, u, v in self._live_edges():
+            graph.add_edge(keys[u], keys[v], **self._edge_attrs.row(e))
+        return graph
+
+    def copy(self) -> "CompactGraph":
+        g = CompactGraph(self.compact_min, self.compact_ratio)
+        g._ids = dict(self._ids)
+        g._keys = list(self._keys)
+        g._node_attrs = self._node_attrs.copy()
+        g._e_src = array("i", self._e_src)
+        g._e_dst = array("i", self._e_dst)
+        g._e_alive = bytearray(self._e_alive)
+        g._edge_attrs = self._edge_attrs.copy()
+        g._n_edges = self._n_edges
+        g._csr_nodes = self._csr_nodes
+        # CSR/CSC arrays are never mutated in place (compaction replaces them), so sharing is safe.
+        g._out_ptr, g._out_dst, g._out_eid = self._out_ptr, self._out_dst, self._out_eid
+        g._in_ptr, g._in_src, g._in_eid = self._in_ptr, self._in_src, self._in_eid
+        g._dead_in_csr = self._dead_in_csr
+        g._buf_out = {k: list(v) for k, v in self._buf_out.items()}
+        g._buf_in = {k: list(v) for k, v in self._buf_in.items()}
+        g._buffered = self._buffered
+        g._dead_nodes = self._dead_nodes
+        return g
+
+    def fork(self) -> "CompactGraph":
+        """Copy-on-write copy: this graph must not be mutated afterwards.
+
+        Node ids and the edge arrays are copied flat; attribute columns and append-buffer
+        lists stay shared until the fork first writes to them, so a write after a fork
+        pays for the columns and buffers it touches rather than for every column.
+        """
+        g = CompactGraph(self.compact_min, self.compact_ratio)
+        g._ids = dict(self._ids)
+        g._keys = list(self._keys)
+        g._node_attrs = self._node_attrs.fork()
+        g._e_src = array("i", self._e_src)
+        g._e_dst = array("i", self._e_dst)
+        g._e_alive = bytearray(self._e_alive)
+        g._edge_attrs = self._edge_attrs.fork()
+        g._n_edges = self._n_edges
+        g._csr_nodes = self._csr_nodes
+        g._out_ptr, g._out_dst, g._out_eid = self._out_ptr, self._out_dst, self._out_eid
+        g._in_ptr, g._in_src, g._in_eid = self._in_ptr, self._in_src, self._in_eid
+        g._dead_in_csr = self._dead_in_csr
+        g._buf_out = dict(self._buf_out)
+        g._buf_in = dict(self._buf_in)
+        g._buf_owned = set()
+        g._buffered = self._buffered
+        g._dead_nodes = self._dead_nodes
+        return g
+
+    def _buffer(self, out: bool, i: int) -> list[int]:
+        """Node ``i``'s append-buffer list, made private to this graph before it is written."""
+        bufs = self._buf_out if out else self._buf_in
+        owned = self._buf_owned
+        buf = bufs.get(i)
+        if buf is None:
+            buf = bufs[i] = []
+        elif owned is not None and (out, i) not in owned:
+            buf = bufs[i] = list(buf)
+        else:
+            return buf
+        if owned is not None:
+            owned.add((out, i))
+        return buf
+
+    # -- nodes ------------------------------------------------------------------------
+
+    @property
+    def nodes(self) -> _NodeView:
+        return _NodeView(self)
+
+    def _intern(self, key: str) -> int:
+        i = self._ids.get(key)
+        if i is None:
+            i = self._ids[key] = len(self._keys)
+            self._keys.append(key)
+        return i
+
+    def add_node(self, key: str, **attrs: Any) -> None:
+        i = self._intern(key)
+        for k, v in attrs.items():
+            self._node_attrs.set(i, k, v)
+
+    def has_node(self, key: str) -> bool:
+        return key in self._ids
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.nodes)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def number_of_nodes(self) -> int:
+        return len(self._ids)
+
+    def remove_node(self, key: str) -> None:
+        i = self._ids.get(key)
+        if i is None:
+            raise nx.NetworkXError(f"The node {key} is not in the digraph.")
+        for e in self._out_eids(i) + self._in_eids(i):
+            self._kill_edge(e)
+        del self._ids[key]
+        self._keys[i] = None
+        self._node_attrs.clear_row(i)
+        self._dead_nodes += 1
+
+    # -- edges ------------------------------------------------------------------------
+
+    @property
+    def edges(self) -> _EdgeView:
+        return _EdgeView(self)
+
+    def number_of_edges(self) -> int:
+        return self._n_edges
+
+    def _edge_id(self, u: str, v: str) -> int:
+        ui, vi = self._ids.get(u), self._ids.get(v)
+        if ui is None or vi is None:
+            return -1
+        for e in self._buf_out.get(ui, ()):
+            if self._e_dst[e] == vi:
+                return e
+        if ui < self._csr_nodes:
+            hi = self._out_ptr[ui + 1]
+            j = bisect_left(self._out_dst, vi, self._out_ptr[ui], hi)
+            if j < hi and self._out_dst[j] == vi:
+                e = self._out_eid[j]
+                if self._e_alive[e]:
+                    return e
+        return -1
+
+    def has_edge(self, u: str, v: str) -> bool:
+        return self._edge_id(u, v) >= 0
+
+    def add_edge(self, u: str, v: str, **attrs: Any) -> None:
+        e = self._edge_id(u, v)
+        if e < 0:
+            ui, vi = self._intern(u), self._intern(v)
+            e = len(self._e_src)
+            self._e_src.append(ui)
+            self._e_dst.append(vi)
+            self._e_alive.append(1)
+            self._buffer(True, ui).append(e)
+            self._buffer(False, vi).append(e)
+            self._buffered += 1
+            self._n_edges += 1
+        for k, val in attrs.items():
+            self._edge_attrs.set(e, k, val)
+        if self._buffered > max(self.compact_min, self.compact_ratio * self._n_edges):
+            self.compact()
+
+    def remove_edge(self, u: str, v: str) -> None:
+        e = self._edge_id(u, v)
+        if e < 0:
+            raise nx.NetworkXError(f"The edge {u}-{v} not in graph.")
+        self._kill_edge(e)
+
+    def _kill_edge(self, e: int) -> None:
+        if not self._e_alive[e]:
+            return
+        self._e_alive[e] = 0
+        self._n_edges -= 1
+        self._edge_attrs.clear_row(e)
+        u, v = self._e_src[e], self._e_dst[e]
+        out_buf = self._buf_out.get(u)
+        if out_buf and e in out_buf:
+            self._buffer(True, u).remove(e)
+            self._buffer(False, v).remove(e)
+            self._buffered -= 1
+        else:
+            self._dead_in_csr += 1
+
+    def _out_eids(self, i: int) -> list[int]:
+        eids: list[int] = []
+        if i < self._csr_nodes:
+            eids = self._out_eid[self._out_ptr[i] : self._out_ptr[i + 1]].tolist()
+            if self._dead_in_csr:
+                eids = [e for e in eids if self._e_alive[e]]
+        return eids + self._buf_out.get(i, [])
+
+    def _in_eids(self, i: int) -> list[int]:
+        eids: list[int] = []
+        if i < self._csr_nodes:
+            eids = self._in_eid[self._in_ptr[i] : self._in_ptr[i + 1]].tolist()
+            if self._dead_in_csr:
+                eids = [e for e in eids if self._e_alive[e]]
+        return eids + self._buf_in.get(i, [])
+
+    def _live_edges(self) -> Iterator[tuple[int, int, int]]:
+        src, dst, alive = self._e_src, self._e_dst, self._e_alive
+        for e in range(len(src)):
+            if alive[e]:
+                yield e, src[e], dst[e]
+
+    def out_edges(self, key: str) -> list[tuple[str, str]]:
+        i = self._ids[key]
+        return [(key, self._keys[self._e_dst[e]]) for e in self._out_eids(i)]
+
+    def in_edges(self, key: str) -> list[tuple[str, str]]:
+        i = self._ids[key]
+        return [(self._keys[self._e_src[e]], key) for e in self._in_eids(i)]
+
+    def successors(self, key: str) -> Iterator[str]:
+        keys, dst = self._keys, self._e_dst
+        return (keys[dst[e]] for e in self._out_eids(self._ids[key]))
+
+    neighbors = successors
+
+    def predecessors(self, key: str) -> Iterator[str]:
+        keys, src = self._keys, self._e_src
+        return (keys[src[e]] for e in self._in_eids(self._ids[key]))
+
+    def degree(self, key: str | None = None) -> Any:
+        """In + out degree of ``key``, or an iterator of ``(node, degree)`` pairs."""
+        if key is not None:
+            i = self._ids[key]
+            return len(self._out_eids(i)) + len(self._in_eids(i))
+        n = len(self._keys)
+        alive = np.frombuffer(self._e_alive, dtype=np.uint8).astype(bool)
+        counts = np.bincount(np.frombuffer(self._e_src, dtype=np.int32)[alive], minlength=n)
+        counts += np.bincount(np.frombuffer(self._e_dst, dtype=np.int32)[alive], minlength=n)
+        return ((k, int(counts[i])) for i, k in enumerate(self._keys) if k is not None)
+
+    @staticmethod
+    def _build_index(keys: np.ndarray, values: np.ndarray, n: int) -> tuple[array, array, array]:
+        """CSR arrays ``(ptr, values, eids)`` grouping edges by ``keys``, sorted by ``values`` within a group."""
+        order = np.lexsort((values, keys))
+        ptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys, minlength=n), out=ptr[1:])
+        return (
+            array("q", ptr.tobytes()),
+            array("i", values[order].astype(np.int32).tobytes()),
+            array("i", order.astype(np.int32).tobytes()),
+        )
+
+    # -- compaction -----------------------------------------------------------------
+
+    def compact(self) -> None:
+        """Fold the append buffer into fresh CSR/CSC arrays, dropping dead edges and nodes."""
+        node_map: np.ndarray | None = None
+        if self._dead_nodes:
+            live_nodes = np.array([i for i, k in enumerate(self._keys) if k is not None], dtype=np.int64)
+            node_map = np.full(len(self._keys), -1, dtype=np.int32)
+            node_map[live_nodes] = np.arange(len(live_nodes), dtype=np.int32)
+            self._keys = [self._keys[i] for i in live_nodes.tolist()]
+            self._ids = {k: i for i, k in enumerate(self._keys)}
+            self._node_attrs = self._node_attrs.take(live_nodes)
+            self._dead_nodes = 0
+
+        alive = np.frombuffer(self._e_alive, dtype=np.uint8).astype(bool)
+        live_edges = np.nonzero(alive)[0]
+        src = np.frombuffer(self._e_src, dtype=np.int32)[live_edges]
+        dst = np.frombuffer(self._e_dst, dtype=np.int32)[live_edges]
+        if node_map is not None:
+            src, dst = node_map[src], node_map[dst]
+        if len(live_edges) != len(alive):
+            self._edge_attrs = self._edge_attrs.take(live_edges)
+        m = len(live_edges)
+        self._e_src = array("i", src.astype(np.int32).tobytes())
+        self._e_dst = array("i", dst.astype(np.int32).tobytes())
+        self._e_alive = bytearray(b"\x01" * m)
+
+        n = len(self._keys)
+        self._out_ptr, self._out_dst, self._out_eid = self._build_index(src, dst, n)
+        self._in_ptr, self._in_src, self._in_eid = self._build_index(dst, src, n)
+
+        self._csr_nodes = n
+        self._dead_in_csr = 0
+        self._buf_out = {}
+        self._buf_in = {}
+        self._buf_owned = None
+        self._buffered = 0
@@ -0,0 +1,216 @@
+"""Resolve incoming person and topic mentions to existing graph nodes.
+
+People are matched by normalized email first, then by an order-insensitive name
+key (also derived from the email local part, so ``sarah.chen@corp.com`` and
+"Sarah Chen" share one), then fuzzily by trigram Jaccard similarity. Topics use
+the same name-key and trigram steps. Candidates come from hash and trigram
+postings, so a lookup never scans all nodes.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from typing import Any, Iterable, Mapping
+
+from .text_index import stem
+
+KINDS = ("person", "topic")
+
+_ADDRESS = re.compile(r"[\w.+'-]+@[\w-]+(?:\.[\w-]+)+")
+
+
+def parse_person(raw: str) -> tuple[str, str | None]:
+    """Split ``"Sarah Chen <sarah.chen@corp.com>"`` into ``("Sarah Chen", "sarah.chen@corp.com")``.
+
+    A bare address gives ``("", address)``; a bare name gives ``(name, None)``.
+    """
+    text = (raw or "").strip()
+    match = _ADDRESS.search(text)
+    if not match:
+        return text, None
+    name = (text[: match.start()] + text[match.end() :]).strip(" <>\"'(),")
+    return name, normalize_email(match.group(0))
+
+
+def normalize_email(email: str | None) -> str | None:
+    """Lowercased address with any ``+tag`` dropped, or None if it is not an address."""
+    match = _ADDRESS.search(email or "")
+    if not match:
+        return None
+    local, domain = match.group(0).lower().split("@", 1)
+    return f"{local.split('+', 1)[0]}@{domain}"
+
+
+def name_key(kind: str, text: str) -> str:
+    """Order-insensitive key: ``"Chen, Sarah"``, ``"sarah chen"`` and ``sarah.chen@x`` all give ``"chen sarah"``."""
+    text = (text or "").strip().lower()
+    if kind == "person" and "@" in text:
+        text = text.split("@", 1)[0].split("+", 1)[0]
+    words = re.findall(r"[a-z0-9]+", text)
+    if kind == "topic":
+        words = [stem(w) for w in words]
+    return " ".join(sorted(words))
+
+
+def trigrams(key: str) -> set[str]:
+    padded = f"  {key} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _digits(key: str) -> set[str]:
+    return {w for w in key.split() if any(c.isdigit() for c in w)}
+
+
+class EntityResolver:
+    """Email, name-key and trigram postings over person and topic nodes."""
+
+    def __init__(self, threshold: float = 0.8, min_fuzzy_len: int = 5):
+        self.threshold = threshold
+        self.min_fuzzy_len = min_fuzzy_len
+        self._emails: dict[str, set[str]] = {}
+        self._names: dict[str, dict[str, set[str]]] = {k: {} for k in KINDS}
+        self._grams: dict[str, dict[str, set[str]]] = {k: {} for k in KINDS}
+        # node id -> (kind, email, name keys)
+        self._entries: dict[str, tuple[str, str | None, frozenset[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def update(self, node_id: str, attrs: Mapping[str, Any]) -> None:
+        """Track (or stop tracking) ``node_id`` according to its current attributes."""
+        kind = attrs.get("type")
+        if kind not in KINDS:
+            self.remove(node_id)
+            return
+        label = str(attrs.get("label") or "")
+        email = normalize_email(str(attrs.get("email") or "")) if kind == "person" else None
+        keys = {name_key(kind, label)}
+        if email:
+            keys.add(name_key(kind, email))
+        entry = (kind, email, frozenset(k for k in keys if k))
+        if self._entries.get(node_id) == entry:
+            return
+        self.remove(node_id)
+        self._entries[node_id] = entry
+        if email:
+            self._emails.setdefault(email, set()).add(node_id)
+        for key in entry[2]:
+            self._names[kind].setdefault(key, set()).add(node_id)
+            for gram in trigrams(key):
+                self._grams[kind].setdefault(gram, set()).add(node_id)
+
+    def remove(self, node_id: str) -> None:
+        entry = self._entries.pop(node_id, None)
+        if entry is None:
+            return
+        kind, email, keys = entry
+        if email:
+            self._discard(self._emails, email, node_id)
+        for key in keys:
+            self._discard(self._names[kind], key, node_id)
+            for gram in trigrams(key):
+                self._discard(self._grams[kind], gram, node_id)
+
+    @staticmethod
+    def _discard(postings: dict[str, set[str]], key: str, node_id: str) -> None:
+        ids = postings.get(key)
+        if ids is not None:
+            ids.discard(node_id)
+            if not ids:
+                del postings[key]
+
+    def rebuild(self, nodes: Iterable[tuple[str, Mapping[str, Any]]]) -> None:
+        self.__init__(self.threshold, self.min_fuzzy_len)
+        for node_id, attrs in nodes:
+            self.update(node_id, attrs)
+
+    def _compatible(self, node_id: str, email: str | None) -> bool:
+        # Two different addresses are two different people, however similar the names.
+        other = self._entries[node_id][1]
+        return email is None or other is None or other == email
+
+    def similar(self, kind: str, key: str) -> list[tuple[str, float]]:
+        """Nodes whose name key has trigram Jaccard >= threshold with ``key``, best first."""
+        if len(key) < self.min_fuzzy_len:
+            return []
+        grams = trigrams(key)
+        postings = self._grams[kind]
+        shared: Counter = Counter()
+        for gram in grams:
+            shared.update(postings.get(gram, ()))
+        # Jaccard <= shared / |grams|, so anything below this cannot reach the threshold.
+        floor = self.threshold * len(grams)
+        digits = _digits(key)
+        scored = []
+        for node_id, count in shared.items():
+            if count < floor:
+                continue
+            best = 0.0
+            for other in self._entries[node_id][2]:
+                if _digits(other) != digits:
+                    continue
+                other_grams = trigrams(other)
+                best = max(best, len(grams & other_grams) / len(grams | other_grams))
+            if best >= self.threshold:
+                scored.append((node_id, best))
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored
+
+    def resolve(self, kind: str, texts: Iterable[str | None], email: str | None = None) -> str | None:
+        """Existing node for a mention given by names/addresses ``texts`` (and address ``email``), or None."""
+        if email:
+            ids = self._emails.get(email)
+            if ids:
+                return min(ids)
+        keys = {name_key(kind, t) for t in texts if t}
+        keys.discard("")
+        for key in keys:
+            ids = [i for i in self._names[kind].get(key, ()) if self._compatible(i, email)]
+            if len(ids) == 1:
+                return ids[0]
+        for key in keys:
+            matches = [(i, s) for i, s in self.similar(kind, key) if self._compatible(i, email)]
+            # Only a unique best match resolves; a tie means we cannot tell which one was meant.
+            if matches and (len(matches) == 1 or matches[1][1] < matches[0][1]):
+                return matches[0][0]
+        return None
+
+    def duplicate_groups(self, kind: str) -> list[list[str]]:
+        """Sets of nodes that resolve to each other (shared email, name key or fuzzy name)."""
+        parent = {n: n for n, entry in self._entries.items() if entry[0] == kind}
+        emails = {n: {self._entries[n][1]} - {None} for n in parent}
+
+        def find(n: str) -> str:
+            while parent[n] != n:
+                parent[n] = parent[parent[n]]
+                n = parent[n]
+            return n
+
+        def union(a: str, b: str) -> None:
+            ra, rb = find(a), find(b)
+            if ra == rb or (emails[ra] and emails[rb] and emails[ra] != emails[rb]):
+                return
+            if rb < ra:
+                ra, rb = rb, ra
+            parent[rb] = ra
+            emails[ra] |= emails[rb]
+
+        if kind == "person":
+            for ids in self._emails.values():
+                first, *rest = sorted(ids)
+                for other in rest:
+                    union(first, other)
+        for ids in self._names[kind].values():
+            first, *rest = sorted(ids)
+            for other in rest:
+                union(first, other)
+        for node_id in list(parent):
+            for key in self._entries[node_id][2]:
+                for other, _ in self.similar(kind, key):
+                    union(node_id, other)
+
+        groups: dict[str, list[str]] = {}
+        for n in parent:
+            groups.setdefault(find(n), []).append(n)
+        return [sorted(g) for g in groups.values() if len(g) > 1]
@@ -2,39 +2,395 @@
 
 from __future__ import annotations
 
-import pickle
+import os
 import re
 from pathlib import Path
 import networkx as nx
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable
+
+from .bitmap_index import AttributeIndex
+from .columnar import read_graph, write_graph
+from .entity_resolver import EntityResolver, parse_person
+from .journal import ChangeJournal
+from .temporal_index import TemporalIndex, node_timestamp, parse_timestamp
+from .text_index import TextIndex
+from .versions import GraphSnapshot, VersionStore
+
+if TYPE_CHECKING:
+    from .compact_graph import CompactGraph
+
+GRAPH_ENGINES = ("networkx", "compact")
+
+
+def _missing(value: Any) -> bool:
+    """True for the empty cells of a DataFrame column (None / NaN)."""
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def _empty_graph(engine: str) -> nx.DiGraph | CompactGraph:
+    if engine == "compact":
+        # Imported only for this engine: CompactGraph pulls in numpy (~50 ms).
+        from .compact_graph import CompactGraph
+
+        return CompactGraph()
+    return nx.DiGraph()
+
+
+def _fork(graph: nx.DiGraph) -> nx.DiGraph:
+    """A DiGraph over the same per-node and per-edge dicts; only the outer dicts are copied.
+
+    Relies on DiGraph's ``_node`` / ``_succ`` / ``_pred`` layout (networkx is pinned in
+    requirements.txt). The builder copies an inner dict before it first writes to it.
+    """
+    fork = graph.__class__()
+    fork.graph.update(graph.graph)
+    fork._node = dict(graph._node)
+    fork._succ = dict(graph._succ)  # also rebinds _adj
+    fork._pred = dict(graph._pred)
+    return fork
 
 
 class GraphBuilder:
-    """Constructs a directed graph of entities and relationships."""
+    """Constructs a directed graph of entities and relationships.
+
+    The storage engine is ``networkx`` (default) or ``compact`` (array-backed
+    CompactGraph), chosen by the ``engine`` argument or ``ORG_GRAPH_ENGINE``.
+    """
 
-    def __init__(self):
-        self._graph: nx.DiGraph = nx.DiGraph()
+    def __init__(self, engine: str | None = None):
+        self.engine = engine or os.getenv("ORG_GRAPH_ENGINE", "networkx")
+        if self.engine not in GRAPH_ENGINES:
+            raise ValueError(f"Unknown graph engine {self.engine!r}; expected one of {GRAPH_ENGINES}")
+        self._graph: nx.DiGraph | CompactGraph = _empty_graph(self.engine)
+        self.journal = ChangeJournal(max_ops=int(os.getenv("ORG_GRAPH_JOURNAL_SIZE", "10000")))
+        self._commit_hooks: list[Callable[[int, list[dict[str, Any]]], None]] = []
+        # Maintained on every mutation so get_stats() never scans the graph.
+        self._node_type_counts: dict[str, int] = {}
+        self._relation_counts: dict[str, int] = {}
+        # Bitmaps over type / priority / urgency / topic / date buckets and a BM25 index over
+        # label + content; same upkeep as the counters.
+        self.index = AttributeIndex()
+        self.text_index = TextIndex()
+        # Maps incoming names / addresses onto existing person and topic nodes.
+        self.resolver = EntityResolver()
+        # Node ids sorted by canonical ``ts`` (epoch seconds) for time-window queries.
+        self.timeline = TemporalIndex()
+        # Committed versions for readers; the live graph is forked before the first write
+        # after it was published, so published graphs are never mutated.
+        self.versions = VersionStore()
+        self._shared = False
+        # Nodes / edges whose dicts the live DiGraph fork owns (copied, or created since the fork).
+        self._owned_nodes: set[str] = set()
+        self._owned_edges: set[tuple[str, str]] = set()
+        self.publish()
 
-    def set_graph(self, graph: nx.DiGraph) -> None:
-        """Replace the underlying graph (used when loading from disk)."""
+    def set_graph(self, graph: nx.DiGraph | CompactGraph) -> None:
+        """Replace the underlying graph (used when loading from disk), converting it to this engine."""
+        if self.engine == "compact" and isinstance(graph, nx.DiGraph):
+            from .compact_graph import CompactGraph
+
+            graph = CompactGraph.from_networkx(graph)
+        elif self.engine == "networkx" and not isinstance(graph, nx.DiGraph):
+            graph = graph.to_networkx()
         self._graph = graph
+        self._recount()
+        self.index.rebuild(self._graph.nodes(data=True))
+        self.text_index.rebuild(self._graph.nodes(data=True))
+        self.resolver.rebuild(self._graph.nodes(data=True))
+        self.timeline.rebuild((n, node_timestamp(attrs)) for n, attrs in self._graph.nodes(data=True))
+        self.journal.reset(self.journal.version)
+        self.publish()
+
+    def adopt(self, other: "GraphBuilder") -> None:
+        """Take over ``other``'s graph, counters and indexes, and publish at its journal version.
+
+        O(1): lets a caller run :meth:`set_graph`'s rebuilds on a staging builder in a worker
+        thread, then swap the result in without blocking. ``other`` must not be used afterwards.
+        """
+        if other.engine != self.engine:
+            raise ValueError(f"Cannot adopt a {other.engine!r} builder into a {self.engine!r} one")
+        self._graph = other._graph
+        self._node_type_counts, self._relation_counts = other._node_type_counts, other._relation_counts
+        self.index, self.text_index = other.index, other.text_index
+        self.resolver, self.timeline = other.resolver, other.timeline
+        self._owned_nodes, self._owned_edges = set(), set()
+        self.journal.reset(other.journal.version)
+        self.publish()
 
     def add_entity(self, entity_id: str, label: str, props: dict[str, Any] | None = None) -> None:
-        """Add or update a node in the graph."""
+        """Add or update a node in the graph.
+
+        A ``date`` prop is normalized to epoch seconds and stored alongside it as ``ts``.
+        """
+        self._writable(entity_id)
+        props = dict(props or {})
+        ts = parse_timestamp(props.get("date")) if "date" in props else None
+        if ts is not None:
+            props["ts"] = ts
+        before = self._node_type(entity_id)
         self._graph.add_node(
             entity_id,
             label=label,
-            **(props or {}),
+            **props,
         )
+        if "date" in props and ts is None:
+            self._graph.nodes[entity_id].pop("ts", None)
+        self._count(self._node_type_counts, before, self._node_type(entity_id))
+        self._index_node(entity_id, self._graph.nodes[entity_id])
+        self._record_node(entity_id)
 
     def add_relation(self, source: str, target: str, relation_type: str, props: dict[str, Any] | None = None) -> None:
         """Add an edge between two entities."""
+        self._writable_edge(source, target)
+        new_nodes = [n for n in (source, target) if not self._graph.has_node(n)]
+        before = self._relation_type(source, target)
         self._graph.add_edge(
             source,
             target,
             relation_type=relation_type,
             **(props or {}),
         )
+        self._count(self._relation_counts, before, relation_type)
+        for n in new_nodes:
+            self._count(self._node_type_counts, None, "unknown")
+            self._index_node(n, {})
+            self._record_node(n)
+        self._record_edge(source, target)
+
+    def remove_entity(self, entity_id: str) -> None:
+        """Remove a node and its incident edges."""
+        if not self._graph.has_node(entity_id):
+            return
+        incident = list(self._graph.in_edges(entity_id)) + list(self._graph.out_edges(entity_id))
+        self._writable(entity_id, *(u for u, _ in incident), *(v for _, v in incident))
+        for u, v in incident:
+            self._count(self._relation_counts, self._relation_type(u, v), None)
+        self._count(self._node_type_counts, self._node_type(entity_id), None)
+        self._unindex_node(entity_id)
+        self._graph.remove_node(entity_id)
+        for u, v in incident:
+            self.journal.record("delete", "edge", (u, v))
+        self.journal.record("delete", "node", entity_id)
+
+    def remove_relation(self, source: str, target: str) -> None:
+        """Remove the edge between two entities if present."""
+        if self._graph.has_edge(source, target):
+            self._writable(source, target)
+            self._count(self._relation_counts, self._relation_type(source, target), None)
+            self._graph.remove_edge(source, target)
+            self.journal.record("delete", "edge", (source, target))
+
+    def commit(self, version: int) -> list[dict[str, Any]]:
+        """Stamp pending journal ops with the graph version, publish it and notify commit hooks."""
+        ops = self.journal.commit(version)
+        self.publish(version)
+        for hook in self._commit_hooks:
+            hook(version, ops)
+        return ops
+
+    def add_commit_hook(self, hook: Callable[[int, list[dict[str, Any]]], None]) -> None:
+        """Register ``hook(version, ops)`` to run after every commit (e.g. WAL append)."""
+        self._commit_hooks.append(hook)
+
+    def remove_commit_hook(self, hook: Callable[[int, list[dict[str, Any]]], None]) -> None:
+        if hook in self._commit_hooks:
+            self._commit_hooks.remove(hook)
+
+    def apply_changes(self, ops: list[dict[str, Any]]) -> None:
+        """Replay journal ops (from a WAL or delta feed) without re-journaling them.
+
+        The result is not published; call :meth:`publish` once the replay is complete.
+        """
+        if ops:
+            self._writable()
+        for op in ops:
+            kind, key, data = op["kind"], op["key"], op.get("data") or {}
+            if kind == "node":
+                if op["op"] == "delete":
+                    if self._graph.has_node(key):
+                        incident = list(self._graph.in_edges(key)) + list(self._graph.out_edges(key))
+                        self._writable(key, *(u for u, _ in incident), *(v for _, v in incident))
+                        for u, v in incident:
+                            self._count(self._relation_counts, self._relation_type(u, v), None)
+                        self._count(self._node_type_counts, self._node_type(key), None)
+                        self._unindex_node(key)
+                        self._graph.remove_node(key)
+                    continue
+                before = self._node_type(key)
+                self._writable(key)
+                self._graph.add_node(key)
+                attrs = self._graph.nodes[key]
+                attrs.clear()
+                attrs.update({k: v for k, v in data.items() if k != "id"})
+                self._count(self._node_type_counts, before, self._node_type(key))
+                self._index_node(key, attrs)
+            else:
+                u, v = key
+                if op["op"] == "delete":
+                    if self._graph.has_edge(u, v):
+                        self._writable(u, v)
+                        self._count(self._relation_counts, self._relation_type(u, v), None)
+                        self._graph.remove_edge(u, v)
+                    continue
+                for n in (u, v):
+                    if not self._graph.has_node(n):
+                        self._count(self._node_type_counts, None, "unknown")
+                        self._index_node(n, {})
+                before = self._relation_type(u, v)
+                self._writable_edge(u, v)
+                self._graph.add_edge(u, v)
+                attrs = self._graph.edges[u, v]
+                attrs.clear()
+                attrs.update({k: val for k, val in data.items() if k not in ("source", "target")})
+                self._count(self._relation_counts, before, self._relation_type(u, v))
+
+    def publish(self, version: int | None = None) -> GraphSnapshot:
+        """Make the live graph the current readable version (``journal.version`` by default).
+
+        O(1) in graph size: the graph object itself becomes the snapshot, along with a copy of the
+        per-type counters, and the next mutation works on a fork (see :meth:`_writable`).
+        """
+        version = self.journal.version if version is None else version
+        snap = self.versions.publish(version, self._graph, self.get_stats())
+        self._shared = True
+        return snap
+
+    def savepoint(self) -> dict[str, Any]:
+        """Mark the current state so :meth:`rollback` can undo the writes that follow.
+
+        The marked graph is treated like a published one: the next write forks it
+        (see :meth:`_writable`) and leaves it intact.
+        """
+        mark = {
+            "graph": self._graph,
+            "shared": self._shared,
+            "owned": (self._owned_nodes, self._owned_edges),
+            "counts": (dict(self._node_type_counts), dict(self._relation_counts)),
+            "journal": self.journal.mark(),
+        }
+        self._shared = True
+        return mark
+
+    def rollback(self, mark: dict[str, Any]) -> None:
+        """Return to ``mark``: restore the graph and counters, drop later journal ops, re-index what they touched."""
+        dropped = self.journal.discard(mark["journal"])
+        self._graph = mark["graph"]
+        self._shared = mark["shared"]
+        self._owned_nodes, self._owned_edges = mark["owned"]
+        self._node_type_counts, self._relation_counts = mark["counts"]
+        touched = {op["key"] for op in dropped if op["kind"] == "node"}
+        touched.update(n for op in dropped if op["kind"] == "edge" for n in op["key"])
+        for n in touched:
+            if self._graph.has_node(n):
+                self._index_node(n, self._graph.nodes[n])
+            else:
+                self._unindex_node(n)
+
+    def snapshot(self) -> GraphSnapshot:
+        """Pin the latest published version; release it (or use ``with``) when the read is done.
+
+        The pinned graph never changes, whatever the writer does meanwhile, so it can be
+        iterated from another thread without locks.
+        """
+        return self.versions.pin()
+
+    def _writable(self, *nodes: str) -> None:
+        """Copy-on-write: never mutate a graph that readers may hold.
+
+        The first write after :meth:`publish` forks the graph. A DiGraph only gets new outer
+        dicts (``_fork``), and ``nodes``, the nodes about to change, get private attribute and
+        adjacency dicts on first touch, so a write costs O(degree) plus one shallow copy per
+        commit instead of a full copy. A CompactGraph fork (``CompactGraph.fork``) copies its
+        id map and edge arrays flat and each attribute column or append-buffer list on first write.
+        """
+        if self._shared:
+            self._graph = self._graph.fork() if self.engine == "compact" else _fork(self._graph)
+            self._owned_nodes = set()
+            self._owned_edges = set()
+            self._shared = False
+        if self.engine == "compact":
+            return
+        g = self._graph
+        for n in nodes:
+            if n in self._owned_nodes:
+                continue
+            if n in g._node:
+                g._node[n] = dict(g._node[n])
+                g._succ[n] = dict(g._succ[n])
+                g._pred[n] = dict(g._pred[n])
+            self._owned_nodes.add(n)
+
+    def _writable_edge(self, source: str, target: str) -> None:
+        """:meth:`_writable` for both endpoints, plus a private attribute dict for the edge."""
+        self._writable(source, target)
+        if self.engine == "compact" or (source, target) in self._owned_edges:
+            return
+        succ, pred = self._graph._succ, self._graph._pred
+        if source in succ and target in succ[source]:
+            # One dict is shared by both adjacency sides; keep it that way.
+            succ[source][target] = pred[target][source] = dict(succ[source][target])
+        self._owned_edges.add((source, target))
+
+    def get_changes(self, since: int) -> list[dict[str, Any]] | None:
+        """Return ops committed after ``since``, or None if a full snapshot is needed."""
+        return self.journal.since(since)
+
+    def _node_type(self, node_id: str) -> str | None:
+        """Type bucket of a node, or None if it does not exist."""
+        if not self._graph.has_node(node_id):
+            return None
+        return self._graph.nodes[node_id].get("type", "unknown")
+
+    def _relation_type(self, source: str, target: str) -> str | None:
+        """Relation bucket of an edge, or None if it does not exist."""
+        if not self._graph.has_edge(source, target):
+            return None
+        return self._graph.edges[source, target].get("relation_type", "unknown")
+
+    def _index_node(self, node_id: str, attrs: Any) -> None:
+        self.index.update(node_id, attrs)
+        self.text_index.update(node_id, attrs)
+        self.resolver.update(node_id, attrs)
+        self.timeline.update(node_id, node_timestamp(attrs))
+
+    def _unindex_node(self, node_id: str) -> None:
+        self.index.remove(node_id)
+        self.text_index.remove(node_id)
+        self.resolver.remove(node_id)
+        self.timeline.remove(node_id)
+
+    @staticmethod
+    def _count(counts: dict[str, int], before: str | None, after: str | None) -> None:
+        """Move one item between count buckets (None = absent)."""
+        if before == after:
+            return
+        if before is not None:
+            remaining = counts.get(before, 0) - 1
+            if remaining > 0:
+                counts[before] = remaining
+            else:
+                counts.pop(before, None)
+        if after is not None:
+            counts[after] = counts.get(after, 0) + 1
+
+    def _recount(self) -> None:
+        """Rebuild the type counters from scratch (only when the whole graph is replaced)."""
+        self._node_type_counts = {}
+        self._relation_counts = {}
+        for _, attrs in self._graph.nodes(data=True):
+            t = attrs.get("type", "unknown")
+            self._node_type_counts[t] = self._node_type_counts.get(t, 0) + 1
+        for _, _, attrs in self._graph.edges(data=True):
+            r = attrs.get("relation_type", "unknown")
+            self._relation_counts[r] = self._relation_counts.get(r, 0) + 1
+
+    def _record_node(self, node_id: str) -> None:
+        self.journal.record("upsert", "node", node_id, {"id": node_id, **dict(self._graph.nodes[node_id])})
+
+    def _record_edge(self, source: str, target: str) -> None:
+        self.journal.record(
+            "upsert", "edge", (source, target), {"source": source, "target": target, **dict(self._graph.edges[source, target])}
+        )
 
     def _slug(self, text: str) -> str:
         t = (text or "").strip().lower()
@@ -42,27 +398,53 @@ class GraphBuilder:
         return t.strip("-") or "unknown"
 
     def person_id(self, email_or_name: str) -> str:
-        return f"person:{(email_or_name or '').strip().lower()}"
+        """Id of the existing person this name/address refers to, else the id a new node would get."""
+        _, address = parse_person(email_or_name)
+        return self.resolve_person(email_or_name) or f"person:{(address or email_or_name or '').strip().lower()}"
 
     def topic_id(self, topic: str) -> str:
-        return f"topic:{self._slug(topic)}"
+        return self.resolve_topic(topic) or f"topic:{self._slug(topic)}"
+
+    def resolve_person(self, email_or_name: str, name: str | None = None) -> str | None:
+        """Existing person node for ``"Name <addr>"``, a bare address or a name (exact, then fuzzy)."""
+        display, address = parse_person(email_or_name)
+        return self.resolver.resolve("person", (name, display, address), email=address)
+
+    def resolve_topic(self, name: str) -> str | None:
+        return self.resolver.resolve("topic", (name,))
 
     def decision_id(self, title: str) -> str:
         return f"decision:{self._slug(title)}"
 
     def add_person(self, email: str, name: str | None = None) -> str:
-        pid = self.person_id(email)
-        self.add_entity(pid, label=name or email, props={"type": "person", "email": email})
+        """Add a person, or enrich the existing node the name/address resolves to; returns its id."""
+        display, address = parse_person(email)
+        label = (parse_person(name)[0] or name) if name else (display or email)
+        pid = self.resolve_person(email, name)
+        if pid is None:
+            pid = f"person:{(address or email or '').strip().lower()}"
+            self.add_entity(pid, label=label, props={"type": "person", "email": address or email})
+            return pid
+        attrs = self._graph.nodes[pid]
+        current = str(attrs.get("label") or "")
+        if current and not ("@" in current and "@" not in label):
+            label = current
+        known = attrs.get("email")
+        self.add_entity(pid, label=label, props={"type": "person", "email": known if "@" in str(known or "") else address or email})
         return pid
 
     def add_topic(self, name: str) -> str:
-        tid = self.topic_id(name)
-        self.add_entity(tid, label=name, props={"type": "topic"})
+        tid = self.resolve_topic(name)
+        if tid is None:
+            tid = f"topic:{self._slug(name)}"
+            self.add_entity(tid, label=name, props={"type": "topic"})
+        else:
+            self.add_entity(tid, label=self._graph.nodes[tid].get("label") or name, props={"type": "topic"})
         return tid
 
-    def add_decision(self, title: str, content: str = "", date: str = "") -> str:
+    def add_decision(self, title: str, content: str = "", date: str = "", props: dict[str, Any] | None = None) -> str:
         did = self.decision_id(title)
-        self.add_entity(did, label=title, props={"type": "decision", "content": content, "date": date})
+        self.add_entity(did, label=title, props={"type": "decision", "content": content, "date": date, **(props or {})})
         return did
 
     def add_communication_edge(self, sender: str, recipient: str, weight: int = 1, props: dict[str, Any] | None = None) -> None:
@@ -74,7 +456,9 @@ class GraphBuilder:
             self.add_person(recipient, name=recipient)
 
         if self._graph.has_edge(sid, rid):
+            self._writable_edge(sid, rid)
             self._graph.edges[sid, rid]["weight"] = int(self._graph.edges[sid, rid].get("weight", 0)) + weight
+            self._record_edge(sid, rid)
         else:
             self.add_relation(sid, rid, "emailed", props={"weight": weight, **(props or {})})
 
@@ -87,10 +471,170 @@ class GraphBuilder:
             self.add_person(person, name=person)
         self.add_relation(pid, topic_node_id, "discussed")
 
-    def get_graph(self) -> nx.DiGraph:
-        """Return the underlying NetworkX graph."""
+    def bulk_add_nodes(self, frame: Any, id_column: str = "id", label_column: str = "label") -> int:
+        """Add or update one node per row of a DataFrame in a single pass; returns the row count.
+
+        Every other column becomes a node attribute (missing cells are skipped), so a frame
+        with ``id``, ``label``, ``type`` and ``email`` columns loads people directly. Ids are
+        used as given - no name resolution - so build them with ``person_id`` / ``topic_id``.
+        """
+        props_columns = [c for c in frame.columns if c not in (id_column, label_column)]
+        gappy = [c for c in props_columns if frame[c].isna().any()]
+        labels = frame[label_column].tolist() if label_column in frame.columns else [None] * len(frame)
+        for node_id, label, *values in zip(frame[id_column].tolist(), labels, *(frame[c].tolist() for c in props_columns)):
+            props = dict(zip(props_columns, values))
+            for k in gappy:
+                if _missing(props[k]):
+                    del props[k]
+            if _missing(label):
+                label = self._graph.nodes[node_id].get("label", node_id) if self._graph.has_node(node_id) else node_id
+            self.add_entity(node_id, label=label, props=props)
+        return len(labels)
+
+    def bulk_add_edges(
+        self,
+        frame: Any,
+        source_column: str = "source",
+        target_column: str = "target",
+        relation_type: str = "related",
+    ) -> int:
+        """Add one edge per row of a pre-aggregated DataFrame in a single pass; returns the row count.
+
+        A ``relation_type`` column overrides the default per row; other columns become edge
+        attributes. Where the edge already exists, ``weight`` is added to and list attributes
+        (e.g. ``email_ids``) are extended; anything else is overwritten. Missing endpoints are
+        created as untyped nodes, as with ``add_relation``.
+        """
+        skip = (source_column, target_column, "relation_type")
+        props_columns = [c for c in frame.columns if c not in skip]
+        # Only columns that actually have gaps pay for a per-cell check.
+        gappy = [c for c in props_columns if frame[c].isna().any()]
+        if "relation_type" in frame.columns:
+            relations = [relation_type if _missing(r) else r for r in frame["relation_type"].tolist()]
+        else:
+            relations = [relation_type] * len(frame)
+        rows = zip(frame[source_column].tolist(), frame[target_column].tolist(), relations, *(frame[c].tolist() for c in props_columns))
+        self._writable()
+        g = self._graph
+        for source, target, relation, *values in rows:
+            props = dict(zip(props_columns, values), relation_type=relation)
+            for k in gappy:
+                if _missing(props[k]):
+                    del props[k]
+            self._writable_edge(source, target)
+            for n in (source, target):
+                if not g.has_node(n):
+                    g.add_node(n)
+                    self._count(self._node_type_counts, None, "unknown")
+                    self._index_node(n, {})
+                    self._record_node(n)
+            if g.has_edge(source, target):
+                attrs = g.edges[source, target]
+                before = attrs.get("relation_type", "unknown")
+                if "weight" in props:
+                    props["weight"] += int(attrs.get("weight", 0))
+                for k, v in props.items():
+                    if isinstance(v, list) and isinstance(attrs.get(k), list):
+                        props[k] = attrs[k] + v
+                attrs.update(props)
+            else:
+                before = None
+                g.add_edge(source, target, **props)
+            self._count(self._relation_counts, before, props["relation_type"])
+            self._record_edge(source, target)
+        return len(relations)
+
+    def merge_duplicates(self) -> dict[str, int]:
+        """Fold person/topic nodes that resolve to each other into one node per entity.
+
+        Edges are rewired to the surviving node (``weight`` is summed where both had the
+        edge) and the duplicates removed, all through the journaled mutators.
+        """
+        report = {"groups": 0, "merged": 0}
+        self._writable()
+        for kind in ("person", "topic"):
+            for group in self.resolver.duplicate_groups(kind):
+                # Prefer a node with a real address, then the best connected one.
+                keep = max(group, key=lambda n: ("@" in str(self._graph.nodes[n].get("email") or ""), self._graph.degree(n)))
+                for dup in group:
+                    if dup != keep:
+                        self._merge_node(dup, keep)
+                        report["merged"] += 1
+                report["groups"] += 1
+        return report
+
+    def _merge_node(self, dup: str, keep: str) -> None:
+        # Always go through self._graph: a published graph is forked on the first write.
+        self._writable()
+        for u, v in list(self._graph.out_edges(dup)) + list(self._graph.in_edges(dup)):
+            data = dict(self._graph.edges[u, v])
+            source = keep if u == dup else u
+            target = keep if v == dup else v
+            if source == target:
+                continue
+            if self._graph.has_edge(source, target):
+                existing = self._graph.edges[source, target]
+                if isinstance(existing.get("weight"), (int, float)) and isinstance(data.get("weight"), (int, float)):
+                    self._writable_edge(source, target)
+                    existing = self._graph.edges[source, target]
+                    existing["weight"] = existing["weight"] + data["weight"]
+                    self._record_edge(source, target)
+                continue
+            relation = data.pop("relation_type", "unknown")
+            self.add_relation(source, target, relation, props=data)
+
+        attrs = dict(self._graph.nodes[keep])
+        for k, val in self._graph.nodes[dup].items():
+            if not attrs.get(k):
+                attrs[k] = val
+        dup_label = str(self._graph.nodes[dup].get("label") or "")
+        if "@" in str(attrs.get("label") or "") and dup_label and "@" not in dup_label:
+            attrs["label"] = dup_label
+        self.remove_entity(dup)
+        self.add_entity(keep, label=attrs.pop("label", keep), props=attrs)
+
+    def get_graph(self) -> nx.DiGraph | CompactGraph:
+        """Return the underlying graph (a DiGraph, or a CompactGraph with the same read API)."""
         return self._graph
 
+    def to_networkx(self) -> nx.DiGraph:
+        """Return a ``networkx.DiGraph`` for algorithms the compact engine does not implement.
+
+        With the networkx engine this is the live graph; with the compact engine it is a copy.
+        """
+        if self.engine == "compact":
+            return self._graph.to_networkx()
+        return self._graph
+
+    def find_nodes(self, limit: int | None = None, **filters: Any) -> list[str]:
+        """Node ids matching every filter, via the bitmap index (no graph scan).
+
+        Filter on ``type``, ``priority``, ``urgency``, ``topic``, ``day`` or ``week``;
+        pass a collection to match any of several values, e.g.
+        ``find_nodes(type="decision", topic=tid, week="2024-W03")``.
+        """
+        return self.index.keys(self.index.query(**filters), limit=limit)
+
+    def search_nodes(self, query: str, k: int = 10, **filters: Any) -> list[tuple[str, float]]:
+        """Top ``k`` ``(node_id, bm25_score)`` for ``query`` over label + content, best first.
+
+        ``filters`` are bitmap-index filters (see :meth:`find_nodes`) applied before ranking.
+        """
+        allowed = set(self.find_nodes(**filters)) if filters else None
+        return self.text_index.search(query, k=k, allowed=allowed)
+
+    def nodes_between(self, start: float | None = None, end: float | None = None, **filters: Any) -> list[str]:
+        """Node ids whose ``ts`` lies in ``[start, end]`` (epoch seconds, open-ended when None), oldest first.
+
+        ``filters`` are bitmap-index filters (see :meth:`find_nodes`), e.g.
+        ``nodes_between(time.time() - 86400, type="decision")``.
+        """
+        ids = self.timeline.between(start, end)
+        if filters:
+            allowed = set(self.find_nodes(**filters))
+            ids = [n for n in ids if n in allowed]
+        return ids
+
     def get_nodes(self) -> list[dict[str, Any]]:
         """Return all nodes with attributes."""
         return [
@@ -106,27 +650,28 @@ class GraphBuilder:
         ]
 
     def get_stats(self) -> dict[str, Any]:
-        nodes_by_type: dict[str, int] = {}
-        for _, attrs in self._graph.nodes(data=True):
-            t = attrs.get("type", "unknown")
-            nodes_by_type[t] = nodes_by_type.get(t, 0) + 1
+        """Node/edge totals and per-type counts; constant time in graph size.
+
+        Counters are kept in sync by the GraphBuilder mutators, so callers must not
+        mutate ``get_graph()`` directly.
+        """
         return {
             "nodes_total": self._graph.number_of_nodes(),
             "edges_total": self._graph.number_of_edges(),
-            "nodes_by_type": nodes_by_type,
+            "nodes_by_type": dict(self._node_type_counts),
+            "edges_by_relation": dict(self._relation_counts),
         }
 
-    def save(self, path: str | Path) -> None:
+    def save(self, path: str | Path, fmt: str | None = None) -> None:
+        """Write the graph as a columnar snapshot (or ``fmt="pickle"``; default ``ORG_GRAPH_FORMAT``)."""
         p = Path(path)
         p.parent.mkdir(parents=True, exist_ok=True)
         with open(p, "wb") as f:
-            pickle.dump(self._graph, f)
+            write_graph(self._graph, f, fmt, version=self.journal.version)
 
     @classmethod
-    def load(cls, path: str | Path) -> "GraphBuilder":
-        p = Path(path)
-        with open(p, "rb") as f:
-            graph = pickle.load(f)
+    def load(cls, path: str | Path, exclude: tuple[str, ...] = ()) -> "GraphBuilder":
+        """Load a columnar or legacy pickle snapshot; ``exclude`` skips attribute columns (e.g. ``content``)."""
         inst = cls()
-        inst.set_graph(graph)
+        inst.set_graph(read_graph(Path(path), exclude=exclude))
         return inst
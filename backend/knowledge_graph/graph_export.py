@@ -6,13 +6,17 @@ import json
 
 import networkx as nx
 from .graph_builder import GraphBuilder
+from .versions import GraphSnapshot
 from typing import Any
 
 
 class GraphExporter:
-    """Export graph to formats consumable by frontend or external tools."""
+    """Export graph to formats consumable by frontend or external tools.
 
-    def __init__(self, builder: GraphBuilder):
+    Pass a pinned ``GraphSnapshot`` instead of the builder to export one committed version.
+    """
+
+    def __init__(self, builder: GraphBuilder | GraphSnapshot):
         self._builder = builder
 
     def to_dict(self) -> dict[str, Any]:
@@ -26,6 +30,13 @@ class GraphExporter:
         """Export as JSON string."""
         return json.dumps(self.to_dict(), indent=indent)
 
+    def to_json_bytes(self, metadata: dict[str, Any] | None = None) -> bytes:
+        """Export as compact UTF-8 JSON bytes, ready to serve without re-encoding."""
+        data = self.to_dict()
+        if metadata is not None:
+            data["metadata"] = metadata
+        return json.dumps(data, separators=(",", ":"), default=str).encode("utf-8")
+
     def to_reactflow_dict(
         self,
         width: int = 1000,
@@ -33,7 +44,7 @@ class GraphExporter:
         seed: int = 42,
     ) -> dict[str, Any]:
         """Export to a ReactFlow-friendly format with positions and styling."""
-        g = self._builder.get_graph()
+        g = self._builder.to_networkx()
         if g.number_of_nodes() == 0:
             return {"nodes": [], "edges": [], "metadata": {"width": width, "height": height}}
 
@@ -0,0 +1,184 @@
+"""Snapshot + write-ahead log persistence for the knowledge graph.
+
+Every commit appends its journal ops to an fsync'd, append-only WAL, so per-write
+cost does not depend on graph size. A background task periodically compacts the
+WAL into an atomically renamed columnar snapshot (see ``columnar``). Startup replays snapshot + WAL.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from .columnar import write_graph
+from .graph_builder import GraphBuilder
+
+logger = logging.getLogger("orgmind.graph_store")
+
+
+class GraphStore:
+    """Durable storage for a GraphBuilder: ``<snapshot>`` + ``<snapshot>.wal``."""
+
+    def __init__(
+        self,
+        snapshot_path: str | Path,
+        max_wal_bytes: int | None = None,
+        max_wal_age: float | None = None,
+    ):
+        self.snapshot_path = Path(snapshot_path)
+        self.wal_path = self.snapshot_path.with_name(self.snapshot_path.name + ".wal")
+        self.compacting_path = self.snapshot_path.with_name(self.snapshot_path.name + ".wal.compacting")
+        self.max_wal_bytes = max_wal_bytes or int(os.getenv("ORG_WAL_MAX_BYTES", str(4 * 1024 * 1024)))
+        self.max_wal_age = max_wal_age or float(os.getenv("ORG_WAL_MAX_AGE", "300"))
+        self.version = 0
+        self.stats = {"appends": 0, "compactions": 0, "replayed_ops": 0, "last_compaction_time": 0.0}
+        self._wal: Any = None
+        self._wal_opened_at = time.time()
+        self._dirty = False
+        self._compacting = False
+
+    # -- startup -----------------------------------------------------------------
+
+    def load(self, builder: GraphBuilder) -> int:
+        """Load the snapshot (if any) into ``builder`` and replay the WAL. Returns the version."""
+        if self.snapshot_path.exists():
+            loaded = GraphBuilder.load(self.snapshot_path)
+            builder.set_graph(loaded.get_graph())
+        for segment in (self.compacting_path, self.wal_path):
+            if segment.exists():
+                self._replay(builder, segment)
+        builder.publish(self.version)
+        return self.version
+
+    def _replay(self, builder: GraphBuilder, segment: Path) -> None:
+        good = 0
+        with open(segment, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("unterminated record")
+                    record = json.loads(line)
+                except ValueError:
+                    # A torn final line from a crash mid-append; everything before it is intact.
+                    logger.warning("Ignoring truncated WAL record in %s", segment)
+                    break
+                good += len(line)
+                if "base_version" in record:
+                    self.version = max(self.version, int(record["base_version"]))
+                    continue
+                builder.apply_changes(record.get("ops", []))
+                self.version = max(self.version, int(record.get("v", 0)))
+                self.stats["replayed_ops"] += len(record.get("ops", []))
+        if good < segment.stat().st_size:
+            # Cut the torn tail off, or the next append would extend it into another bad line.
+            with open(segment, "r+b") as f:
+                f.truncate(good)
+                f.flush()
+                os.fsync(f.fileno())
+
+    # -- write path --------------------------------------------------------------
+
+    def _open_wal(self) -> None:
+        self.wal_path.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not self.wal_path.exists() or self.wal_path.stat().st_size == 0
+        self._wal = open(self.wal_path, "a", encoding="utf-8")
+        self._wal_opened_at = time.time()
+        if is_new:
+            self._write({"base_version": self.version})
+
+    def _write(self, record: dict[str, Any]) -> None:
+        self._wal.write(json.dumps(record, default=str) + "\n")
+        self._wal.flush()
+        os.fsync(self._wal.fileno())
+
+    def append(self, version: int, ops: list[dict[str, Any]]) -> None:
+        """Durably append one commit's ops (GraphBuilder commit hook)."""
+        if not ops:
+            return
+        if self._wal is None:
+            self._open_wal()
+        self._write({"v": version, "ops": [{k: v for k, v in op.items() if k != "seq"} for op in ops]})
+        self.version = max(self.version, version)
+        self._dirty = True
+        self.stats["appends"] += 1
+
+    def wal_size(self) -> int:
+        return self.wal_path.stat().st_size if self.wal_path.exists() else 0
+
+    def needs_compaction(self) -> bool:
+        if not self._dirty or self._compacting:
+            return False
+        return self.wal_size() >= self.max_wal_bytes or (time.time() - self._wal_opened_at) >= self.max_wal_age
+
+    # -- compaction --------------------------------------------------------------
+
+    def write_snapshot(self, graph: Any) -> None:
+        """Atomically replace the snapshot: write temp file, fsync, rename."""
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            write_graph(graph, f, version=self.version)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.snapshot_path)
+        dir_fd = os.open(self.snapshot_path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    async def compact(self, builder: GraphBuilder) -> None:
+        """Fold the WAL into a new snapshot without blocking writers on disk I/O.
+
+        The WAL is rotated and the latest committed version pinned in one synchronous
+        step, so the snapshot reflects exactly the ops in the rotated segment; new
+        commits go to a fresh WAL whose header carries the snapshot's version.
+        """
+        if self._compacting:
+            return
+        self._compacting = True
+        start = time.perf_counter()
+        try:
+            if self.compacting_path.exists():
+                # Left over from an interrupted compaction. Its ops were replayed at load, so
+                # fold them into a snapshot before the rotation below overwrites the segment.
+                with builder.snapshot() as snap:
+                    await asyncio.to_thread(self.write_snapshot, snap.get_graph())
+                self.compacting_path.unlink()
+            if self._wal is not None:
+                self._wal.close()
+                self._wal = None
+            if self.wal_path.exists():
+                os.replace(self.wal_path, self.compacting_path)
+            self._open_wal()
+            self._dirty = False
+            with builder.snapshot() as snap:
+                await asyncio.to_thread(self.write_snapshot, snap.get_graph())
+            if self.compacting_path.exists():
+                self.compacting_path.unlink()
+            self.stats["compactions"] += 1
+            self.stats["last_compaction_time"] = time.perf_counter() - start
+            logger.info("Compacted graph WAL into snapshot (version=%s, %.3fs).", self.version, self.stats["last_compaction_time"])
+        finally:
+            self._compacting = False
+
+    async def run(self, builder: GraphBuilder, interval: float | None = None) -> None:
+        """Background loop: compact whenever the size or age threshold is hit."""
+        interval = interval or float(os.getenv("ORG_WAL_CHECK_INTERVAL", "5"))
+        while True:
+            await asyncio.sleep(interval)
+            if self.needs_compaction():
+                try:
+                    await self.compact(builder)
+                except Exception as e:
+                    logger.error(f"WAL compaction failed: {e}")
+
+    def close(self) -> None:
+        if self._wal is not None:
+            self._wal.close()
+            self._wal = None
@@ -0,0 +1,78 @@
+"""Bounded change journal of node/edge upserts and deletes."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+
+class ChangeJournal:
+    """Records graph mutations and stamps them with the graph version on commit.
+
+    Ops are buffered as pending until ``commit(version)``; committed ops are kept in
+    a bounded deque. Once old ops have been evicted, callers asking for changes
+    older than ``floor`` get ``None`` and must fall back to a full snapshot.
+    """
+
+    def __init__(self, max_ops: int = 10000):
+        self.max_ops = max_ops
+        self.version = 0
+        self.floor = 0
+        self._seq = 0
+        self._ops: deque[dict[str, Any]] = deque()
+        self._pending: list[dict[str, Any]] = []
+
+    def record(self, op: str, kind: str, key: str | tuple[str, str], data: dict[str, Any] | None = None) -> None:
+        """Buffer an ``upsert`` or ``delete`` of a ``node`` or ``edge``."""
+        self._seq += 1
+        entry: dict[str, Any] = {"seq": self._seq, "op": op, "kind": kind, "key": key}
+        if data is not None:
+            entry["data"] = data
+        self._pending.append(entry)
+
+    def mark(self) -> int:
+        """Position in the pending ops, for :meth:`discard`."""
+        return len(self._pending)
+
+    def discard(self, mark: int) -> list[dict[str, Any]]:
+        """Drop (and return) the ops recorded since ``mark``."""
+        dropped = self._pending[mark:]
+        del self._pending[mark:]
+        return dropped
+
+    def commit(self, version: int) -> list[dict[str, Any]]:
+        """Stamp pending ops with ``version`` and return them."""
+        committed = self._pending
+        self._pending = []
+        for entry in committed:
+            entry["version"] = version
+            self._ops.append(entry)
+        while len(self._ops) > self.max_ops:
+            evicted = self._ops.popleft()
+            self.floor = max(self.floor, evicted["version"])
+        self.version = max(self.version, version)
+        return committed
+
+    def reset(self, version: int) -> None:
+        """Drop all history: the current state becomes the baseline for ``version``."""
+        self._ops.clear()
+        self._pending = []
+        self.version = version
+        self.floor = version
+
+    def since(self, version: int) -> list[dict[str, Any]] | None:
+        """Return the latest op per key committed after ``version``, or None if truncated."""
+        if version < self.floor or version > self.version:
+            return None
+        latest: dict[tuple[str, Any], dict[str, Any]] = {}
+        for entry in self._ops:
+            if entry["version"] > version:
+                key = entry["key"]
+                latest[(entry["kind"], tuple(key) if isinstance(key, list) else key)] = entry
+        return [
+            {k: v for k, v in entry.items() if k != "seq"}
+            for entry in sorted(latest.values(), key=lambda e: e["seq"])
+        ]
+
+    def __len__(self) -> int:
+        return len(self._ops)
@@ -0,0 +1,261 @@
+"""Age-based retention for the per-update event nodes.
+
+Every ``/process`` call writes an ``event:<uuid>`` node that carries the full
+message body. ``RetentionEngine`` folds events older than their policy's
+``max_age_days`` into one ``rollup:<type>:<bucket>`` node per day (or per topic):
+
+- the rollup keeps a count, the time span and a few sample labels;
+- the event's edges are re-pointed at the rollup, with weights summed;
+- the body is dropped, or appended to a JSONL archive first.
+
+Graph size then grows with the number of days or topics, not the number of
+messages. Candidates come from the engine's own time index of event nodes (kept
+current by a commit hook), so a pass costs the number of expired events, not the
+size of the history. Work is done in batches of ``batch_size`` so each pause on
+the event loop stays bounded.
+
+Retention is opt-in (``ORG_RETENTION``). Rolled-up event ids leave the graph;
+with an archive, :func:`archived_event_ids` lets ingestion dedup still recognise
+them after a restart.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable
+
+from .graph_builder import GraphBuilder
+from .temporal_index import DAY, TemporalIndex
+
+logger = logging.getLogger("orgmind.retention")
+
+EVENT_PREFIX = "event:"
+ROLLUP_PREFIX = "rollup:"
+GROUP_BY = ("day", "topic")
+SAMPLE_LABELS = 5
+
+
+class RetentionPolicy:
+    """Roll events of one type up once they are ``max_age_days`` old, grouped by ``group_by``."""
+
+    __slots__ = ("max_age_days", "group_by")
+
+    def __init__(self, max_age_days: float, group_by: str = "day"):
+        if group_by not in GROUP_BY:
+            raise ValueError(f"Unknown rollup grouping {group_by!r}; expected one of {GROUP_BY}")
+        self.max_age_days = float(max_age_days)
+        self.group_by = group_by
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, RetentionPolicy) and (self.max_age_days, self.group_by) == (other.max_age_days, other.group_by)
+
+    def __repr__(self) -> str:
+        return f"RetentionPolicy({self.max_age_days:g}, {self.group_by!r})"
+
+
+def parse_policies(spec: str) -> dict[str, RetentionPolicy]:
+    """``"*=30,email=7:topic"`` -> ``{"*": RetentionPolicy(30, "day"), "email": RetentionPolicy(7, "topic")}``.
+
+    Keys are event node types; ``*`` covers every other type. ``off`` (or an empty spec) disables retention.
+    """
+    policies: dict[str, RetentionPolicy] = {}
+    spec = (spec or "").strip()
+    if spec.lower() in ("", "off", "none"):
+        return policies
+    for part in spec.split(","):
+        node_type, _, rule = part.strip().partition("=")
+        days, _, group_by = rule.partition(":")
+        if not node_type or not days:
+            raise ValueError(f"Bad retention policy {part!r}; expected <type>=<days>[:day|topic]")
+        policies[node_type.strip()] = RetentionPolicy(float(days), group_by.strip() or "day")
+    return policies
+
+
+def archived_event_ids(path: str | Path) -> list[str]:
+    """Ids of the events rolled into an archive file (empty if it does not exist yet)."""
+    ids = []
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    ids.append(json.loads(line)["id"])
+                except (ValueError, KeyError):
+                    continue  # a torn last line from a crash mid-append
+    except FileNotFoundError:
+        pass
+    return ids
+
+
+class RetentionEngine:
+    """Incrementally rolls expired event nodes of a GraphBuilder into summary nodes."""
+
+    def __init__(
+        self,
+        builder: GraphBuilder,
+        policies: dict[str, RetentionPolicy],
+        archive_path: str | Path | None = None,
+        batch_size: int = 200,
+    ):
+        self.builder = builder
+        self.policies = policies
+        self.archive_path = Path(archive_path) if archive_path else None
+        self.batch_size = batch_size
+        self.stats = {"rolled_up": 0, "archived": 0, "passes": 0, "last_pass_time": 0.0}
+        # Event node ids by timestamp, one index per event type, so `due` reads each type only
+        # up to its own policy's horizon instead of scanning every dated node.
+        self._events: dict[str, TemporalIndex] = {}
+        self._event_type: dict[str, str] = {}
+        g, timeline = builder.get_graph(), builder.timeline
+        for n in timeline.between():
+            if n.startswith(EVENT_PREFIX):
+                self._index_event(n, g.nodes[n].get("type"), timeline.get(n))
+        builder.add_commit_hook(self._track)
+
+    def _index_event(self, event_id: str, node_type: str | None, ts: float | None) -> None:
+        node_type = node_type or ""
+        if ts is None or self._event_type.get(event_id, node_type) != node_type:
+            self._unindex_event(event_id)
+        if ts is not None:
+            self._events.setdefault(node_type, TemporalIndex()).update(event_id, ts)
+            self._event_type[event_id] = node_type
+
+    def _unindex_event(self, event_id: str) -> None:
+        node_type = self._event_type.pop(event_id, None)
+        if node_type is not None:
+            self._events[node_type].remove(event_id)
+
+    def _track(self, version: int, ops: list[dict[str, Any]]) -> None:
+        """Commit hook: keep the event indexes in step with committed event upserts and deletes."""
+        for op in ops:
+            key = op["key"]
+            if op["kind"] != "node" or not key.startswith(EVENT_PREFIX):
+                continue
+            if op["op"] == "delete":
+                self._unindex_event(key)
+            else:
+                self._index_event(key, (op.get("data") or {}).get("type"), self.builder.timeline.get(key))
+
+    def policy_for(self, node_type: str | None) -> RetentionPolicy | None:
+        return self.policies.get(node_type or "") or self.policies.get("*")
+
+    def due(self, now: float | None = None, limit: int | None = None) -> list[str]:
+        """Expired event ids, oldest first."""
+        if not self.policies:
+            return []
+        now = time.time() if now is None else now
+        g = self.builder.get_graph()
+        per_type = []
+        for node_type, index in self._events.items():
+            policy = self.policy_for(node_type)
+            if policy is None:
+                continue
+            expired = (n for n in index.between(None, now - policy.max_age_days * DAY) if g.has_node(n))
+            # A node missing from the graph was removed by another writer; its delete is not committed yet.
+            per_type.append([(index.get(n), n) for n in islice(expired, limit)])
+        return [n for _, n in islice(heapq.merge(*per_type), limit)]
+
+    def _rollup_target(self, attrs: Any, ts: float, policy: RetentionPolicy) -> tuple[str, str, str]:
+        node_type = attrs.get("type") or "event"
+        if policy.group_by == "topic":
+            g = self.builder.get_graph()
+            topic = attrs.get("topic") or ""
+            about = g.nodes[topic].get("label", topic) if topic and g.has_node(topic) else "other topics"
+            return f"{ROLLUP_PREFIX}{node_type}:topic:{topic or 'none'}", f"{node_type} updates about {about}", topic
+        day = datetime.fromtimestamp(ts).date().isoformat()
+        return f"{ROLLUP_PREFIX}{node_type}:day:{day}", f"{node_type} updates on {day}", day
+
+    def roll_up(self, event_id: str) -> str:
+        """Fold one event into its rollup node and remove it; returns the rollup id."""
+        b = self.builder
+        g = b.get_graph()
+        attrs = dict(g.nodes[event_id])
+        ts = b.timeline.get(event_id) or 0.0
+        policy = self.policy_for(attrs.get("type"))
+        rollup_id, title, bucket = self._rollup_target(attrs, ts, policy)
+
+        existing = dict(g.nodes[rollup_id]) if g.has_node(rollup_id) else {}
+        count = int(existing.get("count", 0)) + 1
+        first_ts = min(existing.get("first_ts", ts), ts)
+        last_ts = max(existing.get("last_ts", ts), ts)
+        samples = [*existing.get("samples", []), attrs.get("label", event_id)][-SAMPLE_LABELS:]
+        props = {
+            "type": "rollup",
+            "rollup_of": attrs.get("type") or "event",
+            "group_by": policy.group_by,
+            "bucket": bucket,
+            "count": count,
+            "first_ts": first_ts,
+            "last_ts": last_ts,
+            "samples": samples,
+            # The day's date for day rollups; the newest event's for topic rollups.
+            "date": bucket if policy.group_by == "day" else datetime.fromtimestamp(last_ts).isoformat(timespec="minutes"),
+        }
+        if policy.group_by == "topic" and bucket:
+            props["topic"] = bucket
+        b.add_entity(rollup_id, label=f"{count} {title}", props=props)
+
+        g = b.get_graph()  # the write above may have swapped in a copy-on-write graph
+        for u, v in list(g.in_edges(event_id)) + list(g.out_edges(event_id)):
+            data = dict(g.edges[u, v])
+            self._move_edge(rollup_id if u == event_id else u, rollup_id if v == event_id else v, data)
+
+        if self.archive_path is not None:
+            self.archive_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.archive_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"id": event_id, "rollup": rollup_id, **attrs}, default=str) + "\n")
+            self.stats["archived"] += 1
+        b.remove_entity(event_id)
+        self._unindex_event(event_id)
+        self.stats["rolled_up"] += 1
+        return rollup_id
+
+    def _move_edge(self, u: str, v: str, data: Any) -> None:
+        if u == v:
+            return
+        g = self.builder.get_graph()
+        props = {k: val for k, val in data.items() if k != "relation_type"}
+        if g.has_edge(u, v):
+            props["weight"] = int(g.edges[u, v].get("weight", 1)) + int(data.get("weight", 1))
+        self.builder.add_relation(u, v, data.get("relation_type", "related"), props=props)
+
+    def run_once(self, now: float | None = None) -> dict[str, Any]:
+        """Roll up at most ``batch_size`` expired events. ``remaining`` tells whether more are due."""
+        start = time.perf_counter()
+        batch = self.due(now, limit=self.batch_size + 1)
+        rollups = {self.roll_up(event_id) for event_id in batch[: self.batch_size]}
+        self.stats["passes"] += 1
+        self.stats["last_pass_time"] = time.perf_counter() - start
+        return {
+            "rolled_up": min(len(batch), self.batch_size),
+            "rollups": len(rollups),
+            "remaining": len(batch) > self.batch_size,
+        }
+
+    async def run(self, on_commit: Callable[[dict[str, Any]], None], interval: float | None = None) -> None:
+        """Background loop: every ``interval`` seconds, drain expired events batch by batch.
+
+        ``on_commit(report)`` is called after each non-empty batch to version and publish it;
+        the loop yields to the event loop between batches.
+        """
+        interval = interval or float(os.getenv("ORG_RETENTION_INTERVAL", "3600"))
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                while True:
+                    report = self.run_once()
+                    if report["rolled_up"]:
+                        on_commit(report)
+                        logger.info("Rolled %s events into %s rollups.", report["rolled_up"], report["rollups"])
+                    if not report["remaining"]:
+                        break
+                    await asyncio.sleep(0)
+            except Exception as e:
+                logger.error(f"Retention pass failed: {e}")
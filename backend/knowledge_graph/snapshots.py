@@ -0,0 +1,174 @@
+"""Versioned read snapshots shared between one writer process and many readers.
+
+The writer publishes ``graph-<version>.pkl`` files into a snapshot directory and
+atomically repoints a ``CURRENT`` file at the newest one. Reader workers poll
+``CURRENT`` (a single ``stat`` when nothing changed), load the new file and swap it
+in. Each reader decodes its own in-memory copy of the graph.
+Files are columnar snapshots (or pickles with ``ORG_GRAPH_FORMAT=pickle``); the
+``.pkl`` suffix is historical and readers detect the format from the contents.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from .columnar import read_graph, write_graph
+from .graph_builder import GraphBuilder
+
+logger = logging.getLogger("orgmind.snapshots")
+
+
+def _fsync_dir(path: Path) -> None:
+    dir_fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+class SnapshotPublisher:
+    """Writer side: publish the graph as an immutable, versioned snapshot file."""
+
+    def __init__(self, directory: str | Path, keep: int = 3, writer_id: str = "writer"):
+        self.directory = Path(directory)
+        self.keep = keep
+        self.writer_id = writer_id
+        self.version = -1
+        self.stats = {"published": 0, "last_publish_time": 0.0}
+
+    @property
+    def current_path(self) -> Path:
+        return self.directory / "CURRENT"
+
+    def publish(self, version: int, graph: Any) -> Path:
+        """Write ``graph-<version>.pkl`` then atomically repoint ``CURRENT`` at it."""
+        start = time.perf_counter()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        name = f"graph-{version}.pkl"
+        target = self.directory / name
+        tmp = self.directory / f".{name}.tmp"
+        with open(tmp, "wb") as f:
+            write_graph(graph, f, version=version)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, target)
+
+        pointer_tmp = self.directory / ".CURRENT.tmp"
+        with open(pointer_tmp, "w", encoding="utf-8") as f:
+            f.write(f"{version} {name} {self.writer_id}\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(pointer_tmp, self.current_path)
+        _fsync_dir(self.directory)
+
+        self.version = version
+        self.stats["published"] += 1
+        self.stats["last_publish_time"] = time.perf_counter() - start
+        self._prune()
+        return target
+
+    def _prune(self) -> None:
+        # Readers that saw an older CURRENT may still be opening its file, so keep a few.
+        snapshots = sorted(
+            self.directory.glob("graph-*.pkl"),
+            key=lambda p: int(p.stem.split("-", 1)[1]),
+        )
+        for old in snapshots[: -self.keep]:
+            try:
+                old.unlink()
+            except FileNotFoundError:
+                pass
+
+    async def run(self, builder: GraphBuilder, get_version: Callable[[], int], interval: float | None = None) -> None:
+        """Background loop: publish whenever the graph version moved (debounced by ``interval``)."""
+        interval = interval or float(os.getenv("ORG_SNAPSHOT_INTERVAL", "1"))
+        while True:
+            await asyncio.sleep(interval)
+            version = get_version()
+            if version == self.version:
+                continue
+            try:
+                with builder.snapshot() as snap:
+                    await asyncio.to_thread(self.publish, snap.version, snap.get_graph())
+            except Exception as e:
+                logger.error(f"Snapshot publish failed: {e}")
+
+
+class SnapshotWatcher:
+    """Reader side: detect a newer published snapshot and load it."""
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self.version = -1
+        self.writer_id = ""
+        self.stats = {"swaps": 0, "last_load_time": 0.0}
+        self._pointer_mtime: int | None = None
+
+    @property
+    def current_path(self) -> Path:
+        return self.directory / "CURRENT"
+
+    def read_current(self) -> tuple[int, Path, str] | None:
+        """Return ``(version, path, writer_id)`` from ``CURRENT``, or None if nothing is published yet."""
+        try:
+            fields = self.current_path.read_text(encoding="utf-8").split()
+        except FileNotFoundError:
+            return None
+        if len(fields) != 3:
+            return None
+        return int(fields[0]), self.directory / fields[1], fields[2]
+
+    def changed(self) -> bool:
+        """Cheap check: has ``CURRENT`` been replaced since the last poll?"""
+        try:
+            mtime = self.current_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if mtime == self._pointer_mtime:
+            return False
+        self._pointer_mtime = mtime
+        return True
+
+    def load(self) -> tuple[int, Any] | None:
+        """Load the published snapshot if it is newer than the one already held."""
+        current = self.read_current()
+        if current is None or current[0] <= self.version:
+            return None
+        version, path, writer_id = current
+        start = time.perf_counter()
+        graph = read_graph(path)
+        self.version = version
+        self.writer_id = writer_id
+        self.stats["swaps"] += 1
+        self.stats["last_load_time"] = time.perf_counter() - start
+        return version, graph
+
+    async def run(
+        self,
+        on_swap: Callable[[int, Any], Awaitable[None] | None],
+        interval: float | None = None,
+    ) -> None:
+        """Background loop: poll ``CURRENT`` and hand each newer graph to ``on_swap``."""
+        interval = interval or float(os.getenv("ORG_SNAPSHOT_POLL_INTERVAL", "0.5"))
+        while True:
+            await asyncio.sleep(interval)
+            if not self.changed():
+                continue
+            try:
+                loaded = await asyncio.to_thread(self.load)
+            except FileNotFoundError:
+                # Pruned between reading CURRENT and opening it; the next poll sees the newer one.
+                self._pointer_mtime = None
+                continue
+            except Exception as e:
+                logger.error(f"Snapshot load failed: {e}")
+                continue
+            if loaded is not None:
+                result = on_swap(*loaded)
+                if asyncio.iscoroutine(result):
+                    await result
@@ -0,0 +1,156 @@
+"""Canonical timestamps for node dates and a sorted time index for range queries."""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from typing import Any, Iterable, Mapping
+
+DAY = 86400.0
+
+_FORMATS = (
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+    "%a, %b %d, %Y, %I:%M %p",
+    "%a, %b %d, %Y",
+)
+# Dates written without a year ("Sat, Feb 7, 10:00 AM") are taken as the most recent such date.
+_NO_YEAR_FORMATS = (
+    "%a, %b %d, %I:%M %p",
+    "%b %d, %I:%M %p",
+    "%a, %b %d",
+    "%b %d",
+)
+
+
+def parse_timestamp(value: Any, now: datetime | None = None) -> float | None:
+    """Epoch seconds for an ISO, RFC 2822 or common human-readable date; None if unparseable.
+
+    Naive values are interpreted in local time, matching ``datetime.now()`` writers.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    text = str(value).strip()
+    try:
+        return datetime.fromisoformat(text).timestamp()
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(text).timestamp()
+    except (TypeError, ValueError, IndexError):
+        pass
+    for fmt in _FORMATS:
+        try:
+            return datetime.strptime(text, fmt).timestamp()
+        except ValueError:
+            continue
+    now = now or datetime.now()
+    for fmt in _NO_YEAR_FORMATS:
+        try:
+            dt = datetime.strptime(f"{now.year} {text}", f"%Y {fmt}")
+        except ValueError:
+            continue
+        if dt > now + timedelta(days=1):
+            dt = dt.replace(year=now.year - 1)
+        return dt.timestamp()
+    return None
+
+
+def parse_window(text: str, now: datetime | None = None) -> tuple[float, float] | None:
+    """``(start, end)`` epoch range for phrases like "today", "last 24h", "this week", "past 3 days"."""
+    t = (text or "").lower()
+    now = now or datetime.now()
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    end = now.timestamp()
+    if match := re.search(r"(?:last|past)\s+(\d+)\s*(h|hours?|d|days?|w|weeks?)\b", t):
+        n, unit = int(match.group(1)), match.group(2)[0]
+        return end - n * {"h": 3600.0, "d": DAY, "w": 7 * DAY}[unit], end
+    if "last 24h" in t or "past day" in t or "last day" in t:
+        return end - DAY, end
+    if "yesterday" in t:
+        return (midnight - timedelta(days=1)).timestamp(), midnight.timestamp()
+    if "today" in t:
+        return midnight.timestamp(), end
+    monday = midnight - timedelta(days=now.weekday())
+    if "last week" in t:
+        return (monday - timedelta(days=7)).timestamp(), monday.timestamp()
+    if "this week" in t:
+        return monday.timestamp(), end
+    if "this month" in t:
+        return midnight.replace(day=1).timestamp(), end
+    return None
+
+
+class TemporalIndex:
+    """Node ids kept sorted by timestamp in parallel arrays.
+
+    Updates are a bisect plus a list insert/delete; ``between`` is two bisects
+    plus a slice, i.e. O(log n + k).
+    """
+
+    def __init__(self):
+        self._times: list[float] = []
+        self._keys: list[str] = []
+        self._ts: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def update(self, key: str, ts: float | None) -> None:
+        old = self._ts.get(key)
+        if old == ts:
+            return
+        if old is not None:
+            self.remove(key)
+        if ts is not None:
+            i = bisect_right(self._times, ts)
+            self._times.insert(i, ts)
+            self._keys.insert(i, key)
+            self._ts[key] = ts
+
+    def remove(self, key: str) -> None:
+        ts = self._ts.pop(key, None)
+        if ts is None:
+            return
+        i = bisect_left(self._times, ts)
+        while self._keys[i] != key:
+            i += 1
+        del self._times[i]
+        del self._keys[i]
+
+    def rebuild(self, items: Iterable[tuple[str, float | None]]) -> None:
+        pairs = sorted((ts, key) for key, ts in items if ts is not None)
+        self._times = [ts for ts, _ in pairs]
+        self._keys = [key for _, key in pairs]
+        self._ts = {key: ts for ts, key in pairs}
+
+    def get(self, key: str) -> float | None:
+        return self._ts.get(key)
+
+    def between(self, start: float | None = None, end: float | None = None) -> list[str]:
+        """Ids with ``start <= ts <= end`` (open-ended when None), oldest first."""
+        lo = 0 if start is None else bisect_left(self._times, start)
+        hi = len(self._times) if end is None else bisect_right(self._times, end)
+        return self._keys[lo:hi]
+
+    def latest(self, k: int) -> list[str]:
+        """The ``k`` most recent ids, newest first."""
+        return self._keys[: -k - 1 : -1] if k > 0 else []
+
+
+def node_timestamp(attrs: Mapping[str, Any]) -> float | None:
+    """A node's canonical ``ts``, falling back to parsing ``date`` for graphs written before it existed."""
+    ts = attrs.get("ts")
+    if isinstance(ts, (int, float)):
+        return float(ts)
+    return parse_timestamp(attrs.get("date"))
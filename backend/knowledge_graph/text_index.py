@@ -0,0 +1,125 @@
+"""Inverted index with BM25 ranking over node labels and content."""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Any, Container, Mapping
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by did do does for from has have how i in is it its of on or that the this "
+    "to was were what when where which who why will with".split()
+)
+
+TEXT_FIELDS = ("label", "content")
+
+
+def stem(term: str) -> str:
+    """Light plural strip: ``policies`` -> ``policy``, ``launches`` -> ``launch``, ``budgets`` -> ``budget``."""
+    if len(term) > 4 and term.endswith("ies"):
+        return term[:-3] + "y"
+    if len(term) > 4 and term.endswith(("ches", "shes", "sses", "xes", "zes")):
+        return term[:-2]
+    if len(term) > 3 and term.endswith("s") and not term.endswith("ss"):
+        return term[:-1]
+    return term
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric terms without stopwords, stemmed."""
+    return [stem(tok) for tok in _TOKEN.findall((text or "").lower()) if len(tok) > 1 and tok not in STOPWORDS]
+
+
+class TextIndex:
+    """Term -> {doc: term frequency} postings, updated incrementally per node.
+
+    Scores are Okapi BM25 (``k1``, ``b``) computed at query time from the
+    postings of the query terms only, so cost scales with how common the
+    query terms are, not with graph size.
+    """
+
+    def __init__(self, fields: tuple[str, ...] = TEXT_FIELDS, k1: float = 1.2, b: float = 0.75):
+        self.fields = fields
+        self.k1 = k1
+        self.b = b
+        self._ids: dict[str, int] = {}
+        self._keys: list[str | None] = []
+        self._postings: dict[str, dict[int, int]] = {}
+        self._doc_terms: dict[int, Counter] = {}
+        self._doc_len: dict[int, int] = {}
+        self._total_len = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_len)
+
+    def _text(self, attrs: Mapping[str, Any]) -> str:
+        return " ".join(str(attrs.get(f) or "") for f in self.fields)
+
+    def update(self, key: str, attrs: Mapping[str, Any]) -> None:
+        """Index (or re-index) node ``key`` from its current text fields."""
+        terms = Counter(tokenize(self._text(attrs)))
+        i = self._ids.get(key)
+        if i is None:
+            if not terms:
+                return
+            i = self._ids[key] = len(self._keys)
+            self._keys.append(key)
+        elif terms == self._doc_terms.get(i):
+            return
+        self._drop(i)
+        if not terms:
+            return
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[i] = tf
+        self._doc_terms[i] = terms
+        length = sum(terms.values())
+        self._doc_len[i] = length
+        self._total_len += length
+
+    def remove(self, key: str) -> None:
+        i = self._ids.pop(key, None)
+        if i is not None:
+            self._drop(i)
+            self._keys[i] = None
+
+    def _drop(self, i: int) -> None:
+        terms = self._doc_terms.pop(i, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings[term]
+            del postings[i]
+            if not postings:
+                del self._postings[term]
+        self._total_len -= self._doc_len.pop(i)
+
+    def rebuild(self, nodes: Any) -> None:
+        self.__init__(self.fields, self.k1, self.b)
+        for key, attrs in nodes:
+            self.update(key, attrs)
+
+    def search(self, query: str, k: int = 10, allowed: Container[str] | None = None) -> list[tuple[str, float]]:
+        """Top ``k`` ``(node_id, score)`` pairs for ``query``, best first; ``allowed`` restricts the candidates."""
+        n = len(self._doc_len)
+        if not n:
+            return []
+        avg_len = self._total_len / n
+        k1, b = self.k1, self.b
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            doc_len = self._doc_len
+            for i, tf in postings.items():
+                norm = k1 * (1 - b + b * doc_len[i] / avg_len)
+                scores[i] = scores.get(i, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+        if allowed is not None:
+            scores = {i: s for i, s in scores.items() if self._keys[i] in allowed}
+        best = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [(self._keys[i], score) for i, score in best]
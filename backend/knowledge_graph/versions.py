@@ -0,0 +1,127 @@
+"""Multi-version graph snapshots for readers that must not see half-applied writes.
+
+``GraphBuilder.commit`` publishes the live graph object as the new current
+version in O(1); the builder forks it before its next mutation
+(copy-on-write), so a published graph is never modified again. Readers pin a
+version for the duration of a request::
+
+    with builder.snapshot() as snap:
+        body = GraphExporter(snap).to_json_bytes()
+
+A superseded version is dropped as soon as its last pin is released.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+import networkx as nx
+
+if TYPE_CHECKING:
+    from .compact_graph import CompactGraph
+
+
+class GraphSnapshot:
+    """One immutable committed graph version with the builder's read API."""
+
+    __slots__ = ("version", "_graph", "_store", "_pins", "_stats")
+
+    def __init__(
+        self,
+        version: int,
+        graph: nx.DiGraph | CompactGraph,
+        store: "VersionStore",
+        stats: dict[str, Any] | None = None,
+    ):
+        self.version = version
+        self._graph = graph
+        self._store = store
+        self._pins = 0
+        self._stats = stats
+
+    def __enter__(self) -> "GraphSnapshot":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.release()
+
+    def release(self) -> None:
+        """Unpin this version (once per ``snapshot()`` call)."""
+        self._store.unpin(self)
+
+    def get_graph(self) -> nx.DiGraph | CompactGraph:
+        """The frozen graph; treat it as read-only."""
+        return self._graph
+
+    def to_networkx(self) -> nx.DiGraph:
+        if not isinstance(self._graph, nx.DiGraph):
+            return self._graph.to_networkx()
+        return self._graph
+
+    def get_nodes(self) -> list[dict[str, Any]]:
+        return [{"id": n, **dict(attrs)} for n, attrs in self._graph.nodes(data=True)]
+
+    def get_edges(self) -> list[dict[str, Any]]:
+        return [{"source": u, "target": v, **dict(attrs)} for u, v, attrs in self._graph.edges(data=True)]
+
+    def get_stats(self) -> dict[str, Any]:
+        """The builder's ``get_stats()`` as of this version (totals only if none were recorded)."""
+        if self._stats is not None:
+            return self._stats
+        return {"nodes_total": self._graph.number_of_nodes(), "edges_total": self._graph.number_of_edges()}
+
+    def __repr__(self) -> str:
+        return f"GraphSnapshot(version={self.version}, pins={self._pins})"
+
+
+class VersionStore:
+    """The current published version plus any older versions that are still pinned."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._current: GraphSnapshot | None = None
+        self._retained: dict[int, GraphSnapshot] = {}
+        self.stats = {"published": 0, "reclaimed": 0}
+
+    def publish(
+        self, version: int, graph: nx.DiGraph | CompactGraph, stats: dict[str, Any] | None = None
+    ) -> GraphSnapshot:
+        """Make ``graph`` the current version; the caller must not mutate it afterwards."""
+        snap = GraphSnapshot(version, graph, self, stats)
+        with self._lock:
+            old, self._current = self._current, snap
+            if old is not None:
+                if old._pins:
+                    self._retained[id(old)] = old
+                else:
+                    self.stats["reclaimed"] += 1
+            self.stats["published"] += 1
+        return snap
+
+    def pin(self) -> GraphSnapshot:
+        with self._lock:
+            snap = self._current
+            if snap is None:
+                raise RuntimeError("No graph version has been published yet")
+            snap._pins += 1
+            return snap
+
+    def unpin(self, snap: GraphSnapshot) -> None:
+        with self._lock:
+            if snap._pins <= 0:
+                raise RuntimeError(f"{snap!r} is not pinned")
+            snap._pins -= 1
+            if not snap._pins and snap is not self._current:
+                del self._retained[id(snap)]
+                self.stats["reclaimed"] += 1
+
+    @property
+    def current_version(self) -> int | None:
+        return self._current.version if self._current is not None else None
+
+    def live_versions(self) -> list[int]:
+        """Versions currently held in memory (the current one plus pinned older ones)."""
+        with self._lock:
+            snaps = list(self._retained.values()) + ([self._current] if self._current else [])
+        return sorted(s.version for s in snaps)
@@ -2,23 +2,40 @@
 
 from __future__ import annotations
 
+import time
+
+_PROCESS_T0 = time.perf_counter()
+
+import asyncio
+import gzip
 import logging
 import os
-import time
 from contextlib import asynccontextmanager
 from typing import Any
+from uuid import uuid4
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query as QueryParam, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.routing import Match
 from pydantic import BaseModel, Field
 
 from agents import Coordinator
-from knowledge_graph import GraphBuilder, GraphExporter
-from data_pipeline import MockDataGenerator, EntityExtractor
+from knowledge_graph import GraphBuilder, GraphExporter, GraphStore, SnapshotPublisher, SnapshotWatcher
+from knowledge_graph.retention import RetentionEngine, archived_event_ids, parse_policies
 from utils import setup_logging
+from utils.admission import AdmissionController, AdmissionRejected
+from utils.answer_cache import AnswerCache
+from utils.event_bus import EventBroadcaster, format_sse
+from utils.job_queue import JobQueue, JobQueueFull, JobStore
+from utils.llm_gateway import get_llm_gateway
+from utils.metrics import get_metrics
+from utils.tts import TTSProviderError, close_tts_client, get_tts_client
 from demo.scenarios import get_scenarios, find_scenario
 
+_IMPORT_SECONDS = time.perf_counter() - _PROCESS_T0
+
 load_dotenv()
 setup_logging(os.getenv("LOG_LEVEL", "INFO"))
 logger = logging.getLogger("orgmind.api")
@@ -27,6 +44,38 @@ logger = logging.getLogger("orgmind.api")
 graph_builder = GraphBuilder()
 _graph_loaded_from_disk = False
 coordinator = Coordinator(graph=graph_builder, config={"critique_enabled": True})
+# ETags embed a per-process id so a restart that reuses a version never matches a stale client copy.
+_BOOT_ID = uuid4().hex[:8]
+_GRAPH_GZIP = os.getenv("ORG_GRAPH_GZIP", "true").lower() != "false"
+# single: one process does everything. writer: single + publishes read snapshots.
+# reader: serves reads from the writer's latest snapshot and rejects writes.
+ROLE = os.getenv("ORGMIND_ROLE", "single").lower()
+events = EventBroadcaster(queue_size=int(os.getenv("ORG_EVENTS_QUEUE_SIZE", "100")))
+metrics = get_metrics()
+admission = AdmissionController.from_env()
+metrics.describe("orgmind_http_request_duration_seconds", "HTTP request latency by route template.")
+metrics.describe("orgmind_http_requests_total", "HTTP requests by route template and status.")
+metrics.describe("orgmind_http_in_flight", "HTTP requests currently being handled, by route template.")
+metrics.describe("orgmind_agent_step_duration_seconds", "Coordinator agent step latency.")
+metrics.describe("orgmind_llm_call_duration_seconds", "LLM completion latency by kind and outcome.")
+metrics.describe("orgmind_llm_in_flight", "LLM completions currently awaiting a response.")
+metrics.describe("orgmind_graph_nodes", "Knowledge graph nodes by type.")
+metrics.describe("orgmind_graph_edges", "Knowledge graph edges.")
+metrics.describe("orgmind_admission_queue_seconds", "Time spent waiting for an admission slot, by route.")
+metrics.describe("orgmind_admission_rejected_total", "Requests shed with 429, by route and reason.")
+metrics.describe("orgmind_admission_waiting", "Requests waiting for an admission slot, by route.")
+metrics.describe("orgmind_startup_seconds", "Seconds from process start (import, live, ready) and graph load duration.")
+metrics.describe("orgmind_singleflight_calls_total", "Coalescable calls by outcome (leader ran the work, coalesced shared it).")
+metrics.gauge_fn(
+    "orgmind_graph_nodes",
+    lambda: [({"type": t}, n) for t, n in graph_builder.get_stats()["nodes_by_type"].items()],
+)
+metrics.gauge_fn("orgmind_graph_edges", lambda: [({}, graph_builder.get_stats()["edges_total"])])
+metrics.gauge_fn(
+    "orgmind_startup_seconds",
+    lambda: [({"phase": k.removesuffix("_seconds")}, v) for k, v in app.state.boot.items() if k.endswith("_seconds") and v is not None],
+)
+metrics.gauge_fn("orgmind_event_subscribers", lambda: [({}, events.subscriber_count)])
 
 
 class NewInformation(BaseModel):
@@ -39,75 +88,169 @@ class NewInformation(BaseModel):
     date: str | None = None
 
 
+class BatchInformation(BaseModel):
+    items: list[NewInformation] = Field(min_length=1, max_length=int(os.getenv("ORG_BATCH_MAX_ITEMS", "100")))
+
+
 class Query(BaseModel):
     question: str
     intent: str | None = None
+    # Accept an answer from an older graph version while a refresh runs in the background.
+    allow_stale: bool = False
 
 
-def _export_graph_cached(app: FastAPI) -> None:
-    exporter = GraphExporter(graph_builder)
-    data = exporter.to_dict()
-    stats = graph_builder.get_stats()
-    version = coordinator.memory.get_graph_state().get("version", 0)
-    
-    # Save to disk if path is available
-    if hasattr(app.state, "graph_path"):
-        try:
-            graph_builder.save(app.state.graph_path)
-        except Exception as e:
-            logger.error(f"Failed to save graph to disk: {e}")
-
-    app.state.graph_cache = {
-        "nodes": data.get("nodes", []),
-        "edges": data.get("edges", []),
-        "metadata": {
+def _encode_graph(builder: GraphBuilder, loaded_from_disk: bool) -> dict[str, Any]:
+    """Pre-encode the /graph payload from a pinned committed snapshot (safe to run in a thread)."""
+    with builder.snapshot() as snap:
+        graph = snap.get_graph()
+        version = snap.version
+        metadata = {
             "version": version,
-            "node_count": stats["nodes_total"],
-            "edge_count": stats["edges_total"],
-            "loaded_from_disk": _graph_loaded_from_disk,
-        },
+            "node_count": graph.number_of_nodes(),
+            "edge_count": graph.number_of_edges(),
+            "loaded_from_disk": loaded_from_disk,
+        }
+        body = GraphExporter(snap).to_json_bytes(metadata)
+
+    return {
+        "version": version,
+        "etag": f'"{_BOOT_ID}-{version}"',
+        # A strong ETag names one exact byte sequence, so the gzip body gets its own.
+        "etag_gzip": f'"{_BOOT_ID}-{version}-gz"',
+        "metadata": metadata,
+        "body": body,
+        "gzip": gzip.compress(body, compresslevel=6) if _GRAPH_GZIP and len(body) > 1024 else None,
     }
+
+
+def _install_graph_cache(app: FastAPI, cache: dict[str, Any]) -> None:
+    """Serve ``cache`` for /graph and announce the new version."""
+    app.state.graph_cache = cache
+    metadata = cache["metadata"]
     app.state.graph_history.append(
         {
             "timestamp": time.time(),
-            "version": version,
-            "nodes": stats["nodes_total"],
-            "edges": stats["edges_total"],
+            "version": cache["version"],
+            "nodes": metadata["node_count"],
+            "edges": metadata["edge_count"],
         }
     )
+    events.publish("graph", {"version": cache["version"], "node_count": metadata["node_count"], "edge_count": metadata["edge_count"]})
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Startup: load saved graph if present, else seed with mock data."""
-    global _graph_loaded_from_disk
+def _export_graph_cached(app: FastAPI) -> None:
+    """Pre-encode the /graph payload once per graph version."""
+    _install_graph_cache(app, _encode_graph(graph_builder, _graph_loaded_from_disk))
 
-    app.state.stats = {
-        "requests_total": 0,
-        "process": {"count": 0, "total_time": 0.0},
-        "query": {"count": 0, "total_time": 0.0},
-        "demo": {"count": 0, "total_time": 0.0},
-    }
-    app.state.graph_history = []
-    app.state.graph_cache = {"nodes": [], "edges": [], "metadata": {}}
 
-    graph_path = os.getenv("ORG_GRAPH_PATH", "data/processed/knowledge_graph.pkl")
-    abs_graph_path = os.path.join(os.path.dirname(__file__), graph_path)
-    app.state.graph_path = abs_graph_path
+def _finish_request(bucket: str, start: float) -> None:
+    """Record a request's latency and push the stats delta to subscribers."""
+    elapsed = time.perf_counter() - start
+    s = app.state.stats
+    s[bucket]["total_time"] += elapsed
+    count = s[bucket]["count"]
+    events.publish(
+        "stats",
+        {
+            "bucket": bucket,
+            "count": count,
+            "last_time": elapsed,
+            "avg_time": s[bucket]["total_time"] / count if count else 0.0,
+            "requests_total": s["requests_total"],
+        },
+    )
+
+
+def _publish_agent_step(event: dict[str, Any]) -> None:
+    events.publish("agent", event)
+
+
+def _require_writer() -> None:
+    """Reject mutations on read replicas; they only ever hold the writer's snapshot."""
+    if ROLE == "reader":
+        raise HTTPException(
+            status_code=409,
+            detail="This worker is a read-only replica (ORGMIND_ROLE=reader); send writes to the writer.",
+        )
+
+
+def _stage_snapshot(version: int, graph: Any) -> tuple[GraphBuilder, dict[str, Any]]:
+    """Reader, in a worker thread: index a published snapshot and pre-encode its /graph payload."""
+    staging = GraphBuilder(graph_builder.engine)
+    staging.journal.reset(version)
+    staging.set_graph(graph)
+    return staging, _encode_graph(staging, loaded_from_disk=True)
+
+
+async def _swap_snapshot(version: int, graph: Any) -> None:
+    """Reader: replace the served graph with a newly published snapshot.
+
+    Index rebuilds and JSON/gzip encoding run off the event loop; the loop only swaps
+    the finished builder state and /graph cache in.
+    """
+    global _graph_loaded_from_disk, _BOOT_ID
+    # Serve the writer's ETags so clients revalidate against any reader worker.
+    _BOOT_ID = app.state.snapshots.writer_id or _BOOT_ID
+    staging, cache = await asyncio.to_thread(_stage_snapshot, version, graph)
+    graph_builder.adopt(staging)
+    coordinator.memory.restore_version(version)
+    _graph_loaded_from_disk = True
+    _install_graph_cache(app, cache)
+    logger.info("Swapped to graph snapshot version %s.", version)
+
 
-    if os.path.exists(abs_graph_path):
-        loaded = GraphBuilder.load(abs_graph_path)
-        graph_builder.set_graph(loaded.get_graph())
-        _graph_loaded_from_disk = True
+async def _warm_up_reader(app: FastAPI, snapshot_dir: str) -> None:
+    watcher = SnapshotWatcher(snapshot_dir)
+    app.state.snapshots = watcher
+    loaded = await asyncio.to_thread(watcher.load)
+    if loaded is not None:
+        await _swap_snapshot(*loaded)
     else:
-        gen = MockDataGenerator(seed=42)
-        events = gen.generate_events(5)
-        extractor = EntityExtractor()
-        data = extractor.extract_from_events(events)
-        for e in data.get("entities", []):
-            graph_builder.add_entity(e["id"], e.get("label", e["id"]), {"type": e.get("type", "entity")})
-        for r in data.get("relations", []):
-            graph_builder.add_relation(r["source"], r["target"], r.get("relation_type", "related"))
+        logger.warning("No published snapshot in %s yet; serving an empty graph until the writer publishes.", snapshot_dir)
+        _export_graph_cached(app)
+    app.state.tasks.append(asyncio.create_task(watcher.run(_swap_snapshot)))
+
+
+def _load_graph(graph_store: GraphStore) -> tuple[GraphBuilder, int, bool]:
+    """Build the startup graph off the event loop: snapshot + WAL, else mock data."""
+    staging = GraphBuilder()
+    if graph_store.snapshot_path.exists() or graph_store.wal_path.exists():
+        return staging, graph_store.load(staging), True
+
+    from data_pipeline import EntityExtractor, MockDataGenerator
+
+    gen = MockDataGenerator(seed=42)
+    events = gen.generate_events(5)
+    extractor = EntityExtractor()
+    data = extractor.extract_from_events(events)
+    for e in data.get("entities", []):
+        staging.add_entity(e["id"], e.get("label", e["id"]), {"type": e.get("type", "entity")})
+    for r in data.get("relations", []):
+        staging.add_relation(r["source"], r["target"], r.get("relation_type", "related"))
+    return staging, 0, False
+
+
+def _commit_retention(report: dict[str, Any]) -> None:
+    """Version one retention batch like any other update and refresh the /graph cache."""
+    coordinator.memory.commit_changes("Rolled up expired events", report)
+    _export_graph_cached(app)
+
+
+async def _warm_up_writer(app: FastAPI, abs_graph_path: str, snapshot_dir: str) -> None:
+    global _graph_loaded_from_disk
+
+    graph_store = GraphStore(abs_graph_path)
+    app.state.graph_store = graph_store
+    load_start = time.perf_counter()
+    staging, version, from_disk = await asyncio.to_thread(_load_graph, graph_store)
+    graph_builder.set_graph(staging.get_graph())
+    coordinator.memory.restore_version(version)
+    # Events retention rolled up are gone from the graph; their archived ids still count as seen.
+    retention_archive = os.getenv("ORG_RETENTION_ARCHIVE") or None
+    archived = await asyncio.to_thread(archived_event_ids, retention_archive) if retention_archive else []
+    coordinator.remember_events(archived)
+    _graph_loaded_from_disk = from_disk
+    app.state.boot["graph_load_seconds"] = time.perf_counter() - load_start
 
     # Seed a baseline fact for demo scenario #2 (budget conflict).
     graph_builder.add_decision("Q2 budget finalized at $3.5M", content="Q2 budget finalized at $3.5M", date="")
@@ -128,17 +271,136 @@ async def lifespan(app: FastAPI):
     graph_builder.add_topic("SLA Docs")
     graph_builder.add_relation("Customer Support", "SLA Docs", "needs_update")
 
+    # The startup graph is the baseline snapshot; clients sync deltas from here on.
+    graph_builder.journal.reset(coordinator.memory.get_graph_state().get("version", 0))
+    graph_builder.publish()
+    # Persist each commit as an O(1) WAL append; snapshots are compacted in the background.
+    graph_builder.add_commit_hook(graph_store.append)
+    app.state.graph_store_attached = True
+    if not graph_store.snapshot_path.exists():
+        with graph_builder.snapshot() as snap:
+            await asyncio.to_thread(graph_store.write_snapshot, snap.get_graph())
+    app.state.tasks.append(asyncio.create_task(graph_store.run(graph_builder)))
+
+    job_db = os.getenv("ORG_JOB_DB") or os.path.join(os.path.dirname(abs_graph_path), "jobs.sqlite3")
+    app.state.jobs = JobQueue(
+        _process_and_refresh,
+        JobStore(job_db),
+        workers=int(os.getenv("ORG_JOB_WORKERS", "2")),
+        max_backlog=int(os.getenv("ORG_JOB_MAX_BACKLOG", "500")),
+    )
+    await app.state.jobs.start()
     _export_graph_cached(app)
+
+    # Opt-in: rolling up deletes event bodies, so nothing runs unless ORG_RETENTION is set.
+    policies = parse_policies(os.getenv("ORG_RETENTION", "off"))
+    if policies:
+        if retention_archive is None:
+            logger.warning(
+                "ORG_RETENTION is set without ORG_RETENTION_ARCHIVE: rolled-up event bodies are dropped, "
+                "and after a restart a replay of a rolled-up update is ingested again."
+            )
+        retention = RetentionEngine(
+            graph_builder,
+            policies,
+            archive_path=retention_archive,
+            batch_size=int(os.getenv("ORG_RETENTION_BATCH", "200")),
+        )
+        app.state.retention = retention
+        app.state.tasks.append(asyncio.create_task(retention.run(_commit_retention)))
+    if ROLE == "writer":
+        publisher = SnapshotPublisher(snapshot_dir, writer_id=_BOOT_ID)
+        app.state.snapshots = publisher
+        with graph_builder.snapshot() as snap:
+            await asyncio.to_thread(publisher.publish, snap.version, snap.get_graph())
+        app.state.tasks.append(
+            asyncio.create_task(publisher.run(graph_builder, lambda: graph_builder.journal.version))
+        )
+
+
+async def _warm_up(app: FastAPI, abs_graph_path: str, snapshot_dir: str) -> None:
+    """Background startup: load the graph and start workers, then flip readiness."""
+    try:
+        if ROLE == "reader":
+            await _warm_up_reader(app, snapshot_dir)
+        else:
+            await _warm_up_writer(app, abs_graph_path, snapshot_dir)
+    except Exception as e:
+        app.state.boot["error"] = str(e)
+        logger.exception("Startup failed; /ready will keep reporting not ready.")
+        return
+    app.state.ready = True
+    app.state.boot["ready_seconds"] = time.perf_counter() - _PROCESS_T0
     stats = graph_builder.get_stats()
     logger.info(
-        "Startup complete (graph_loaded=%s, nodes=%s, edges=%s).",
+        "Startup complete (role=%s, graph_loaded=%s, nodes=%s, edges=%s, ready in %.3fs).",
+        ROLE,
         _graph_loaded_from_disk,
         stats["nodes_total"],
         stats["edges_total"],
+        app.state.boot["ready_seconds"],
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup: accept traffic immediately; load the graph in the background (see /ready)."""
+    app.state.stats = {
+        "requests_total": 0,
+        "process": {"count": 0, "total_time": 0.0},
+        "query": {"count": 0, "total_time": 0.0},
+        "demo": {"count": 0, "total_time": 0.0},
+        "batch": {"count": 0, "total_time": 0.0, "items": 0},
+    }
+    app.state.graph_history = []
+    app.state.answers = AnswerCache(
+        max_entries=int(os.getenv("ORG_ANSWER_CACHE_SIZE", "256")),
+        ttl=float(os.getenv("ORG_ANSWER_CACHE_TTL", "300")),
     )
+    app.state.ready = False
+    app.state.boot = {
+        "import_seconds": _IMPORT_SECONDS,
+        "live_seconds": None,
+        "graph_load_seconds": None,
+        "ready_seconds": None,
+        "error": None,
+    }
+    app.state.tasks = []
+    app.state.jobs = None
+    app.state.graph_store = None
+    app.state.retention = None
+    app.state.graph_store_attached = False
+
+    graph_path = os.getenv("ORG_GRAPH_PATH", "data/processed/knowledge_graph.pkl")
+    abs_graph_path = os.path.join(os.path.dirname(__file__), graph_path)
+    app.state.graph_path = abs_graph_path
+    snapshot_dir = os.getenv("ORG_SNAPSHOT_DIR") or os.path.join(os.path.dirname(abs_graph_path), "snapshots")
+
+    if ROLE != "reader":
+        coordinator.add_step_listener(_publish_agent_step)
+    startup = asyncio.create_task(_warm_up(app, abs_graph_path, snapshot_dir))
+    app.state.boot["live_seconds"] = time.perf_counter() - _PROCESS_T0
+    logger.info("Accepting traffic after %.3fs (imports %.3fs); loading graph in background.", app.state.boot["live_seconds"], _IMPORT_SECONDS)
     yield
     # shutdown
-    pass
+    startup.cancel()
+    await asyncio.gather(startup, return_exceptions=True)
+    for task in app.state.tasks:
+        task.cancel()
+    await asyncio.gather(*app.state.tasks, return_exceptions=True)
+    if app.state.jobs is not None:
+        await app.state.jobs.stop()
+        app.state.jobs.store.close()
+    coordinator.remove_step_listener(_publish_agent_step)
+    graph_store = app.state.graph_store
+    if graph_store is not None:
+        if app.state.graph_store_attached:
+            graph_builder.remove_commit_hook(graph_store.append)
+            if graph_store.needs_compaction() or graph_store.stats["appends"]:
+                await graph_store.compact(graph_builder)
+        graph_store.close()
+    await get_llm_gateway().aclose()
+    await close_tts_client()
 
 
 app = FastAPI(
@@ -157,6 +419,54 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def _route_template(request: Request) -> str:
+    """Resolve the route template (``/jobs/{job_id}``) so label cardinality stays bounded."""
+    for route in request.app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return getattr(route, "path", request.url.path)
+    return "unmatched"
+
+
+# Liveness/observability routes that never touch the graph.
+_AVAILABLE_WHILE_STARTING = {"/", "/health", "/ready", "/metrics", "/docs", "/redoc", "/openapi.json", "unmatched"}
+
+
+@app.middleware("http")
+async def admission_control(request: Request, call_next):
+    """Bound concurrency on expensive routes; shed load with 429 + Retry-After."""
+    route = getattr(request.state, "route", None) or _route_template(request)
+    if not request.app.state.ready and route not in _AVAILABLE_WHILE_STARTING:
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "Starting up: the graph is still loading. Poll /ready."},
+            headers={"Retry-After": "1"},
+        )
+    try:
+        async with admission.admit(route):
+            return await call_next(request)
+    except AdmissionRejected as e:
+        return JSONResponse(status_code=429, content={"detail": str(e)}, headers={"Retry-After": str(e.retry_after)})
+
+
+# Registered last so it wraps admission control and also times shed requests.
+@app.middleware("http")
+async def record_latency(request: Request, call_next):
+    route = _route_template(request)
+    request.state.route = route
+    metrics.gauge_add("orgmind_http_in_flight", 1, route=route)
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        metrics.gauge_add("orgmind_http_in_flight", -1, route=route)
+        metrics.observe("orgmind_http_request_duration_seconds", time.perf_counter() - start, method=request.method, route=route)
+        metrics.inc("orgmind_http_requests_total", method=request.method, route=route, status=status)
+
+
 @app.get("/")
 async def root():
     return {"message": "OrgMind API", "version": app.version, "status": "healthy"}
@@ -164,10 +474,14 @@ async def root():
 
 @app.get("/health")
 async def health():
+    """Liveness: answers as soon as the process accepts traffic, even while loading."""
     graph_stats = graph_builder.get_stats()
     return {
         "status": "ok",
         "service": "orgmind",
+        "role": ROLE,
+        "ready": app.state.ready,
+        "startup": app.state.boot,
         "graph_loaded": _graph_loaded_from_disk,
         "agents_initialized": coordinator is not None,
         "graph": graph_stats,
@@ -176,40 +490,154 @@ async def health():
     }
 
 
+@app.get("/ready")
+async def ready():
+    """Readiness: 200 once the graph is loaded and workers are running, else 503."""
+    body = {"ready": app.state.ready, "role": ROLE, "startup": app.state.boot}
+    return JSONResponse(status_code=200 if app.state.ready else 503, content=body)
+
+
 @app.get("/graph")
-async def get_graph():
-    """Return cached knowledge graph as nodes + edges (+metadata)."""
-    return app.state.graph_cache
+async def get_graph(request: Request):
+    """Return cached knowledge graph as nodes + edges (+metadata).
+
+    Serves pre-encoded bytes with a strong ETag; conditional requests for an
+    unchanged graph get ``304 Not Modified``.
+    """
+    cache = app.state.graph_cache
+    gzipped = cache["gzip"] is not None and _accepts_gzip(request.headers.get("accept-encoding", ""))
+    etag = cache["etag_gzip"] if gzipped else cache["etag"]
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if_none_match = request.headers.get("if-none-match", "")
+    tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",") if t.strip()}
+    if etag in tags or "*" in tags:
+        return Response(status_code=304, headers=headers)
+    if gzipped:
+        return Response(cache["gzip"], media_type="application/json", headers={**headers, "Content-Encoding": "gzip"})
+    return Response(cache["body"], media_type="application/json", headers=headers)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip; ``gzip;q=0`` refuses it."""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[coding] = q
+    return weights.get("gzip", weights.get("x-gzip", weights.get("*", 0.0))) > 0
+
+
+@app.get("/graph/changes")
+async def get_graph_changes(since: int = 0):
+    """Return node/edge ops committed after graph version ``since``.
+
+    Falls back to the full cached graph when the journal no longer covers ``since``.
+    """
+    cache = app.state.graph_cache
+    version = cache["version"]
+    changes = graph_builder.get_changes(since)
+    if changes is None:
+        prefix = f'{{"version":{version},"since":{since},"full":true,"graph":'.encode()
+        return Response(prefix + cache["body"] + b"}", media_type="application/json")
+    return {"version": version, "since": since, "full": False, "changes": changes}
 
 
 @app.post("/agent/process")
 async def agent_process(payload: dict):
     """Process a request through the coordinator."""
+    _require_writer()
     result = await coordinator.process(payload)
     # If this call updated the graph via Phase 3 pipeline, refresh cached graph.
-    if isinstance(result, dict) and result.get("conflict") is False:
+    if isinstance(result, dict) and result.get("conflict") is False and not result.get("deduplicated"):
+        _export_graph_cached(app)
+    return result
+
+
+async def _process_and_refresh(info: dict[str, Any], dedupe: bool = True) -> dict[str, Any]:
+    """Run the critic -> memory -> router pipeline and refresh the graph cache on success."""
+    result = await coordinator.process_new_information(info, dedupe=dedupe)
+    if not result.get("conflict") and not result.get("deduplicated"):
         _export_graph_cached(app)
     return result
 
 
 @app.post("/process")
-async def process_new_information(payload: NewInformation):
+async def process_new_information(payload: NewInformation, run_async: bool = QueryParam(False, alias="async")):
+    """Process new information; with ``?async=true`` enqueue it and return 202 + job id."""
+    _require_writer()
+    if run_async:
+        app.state.stats["requests_total"] += 1
+        try:
+            job = app.state.jobs.submit(payload.model_dump(), priority=payload.priority)
+        except JobQueueFull as e:
+            raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
+        return JSONResponse(
+            status_code=202,
+            content={"job_id": job["id"], "status": job["status"], "priority": job["priority"], "status_url": f"/jobs/{job['id']}"},
+        )
+
     start = time.perf_counter()
     app.state.stats["requests_total"] += 1
     app.state.stats["process"]["count"] += 1
     try:
-        result = await coordinator.process_new_information(payload.model_dump())
-        if not result.get("conflict"):
+        return await _process_and_refresh(payload.model_dump())
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        _finish_request("process", start)
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Return the status (and, once finished, the result) of an async /process job."""
+    _require_writer()
+    job = app.state.jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@app.post("/process/batch")
+async def process_batch(payload: BatchInformation):
+    """Ingest N items with batched LLM prompts, one graph commit and one cache refresh.
+
+    Returns per-item results (``processed`` / ``conflict`` / ``error``); failures are
+    reported per item rather than failing the request.
+    """
+    _require_writer()
+    start = time.perf_counter()
+    app.state.stats["requests_total"] += 1
+    app.state.stats["batch"]["count"] += 1
+    app.state.stats["batch"]["items"] += len(payload.items)
+    try:
+        result = await coordinator.process_batch([item.model_dump() for item in payload.items])
+        if result["summary"]["processed"]:
             _export_graph_cached(app)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     finally:
-        app.state.stats["process"]["total_time"] += (time.perf_counter() - start)
+        _finish_request("batch", start)
+
+
+def _answer_cacheable(answer: Any) -> bool:
+    """Fallback answers given while the LLM failed are served once, never cached."""
+    return not (isinstance(answer, dict) and answer.get("llm_error"))
 
 
 @app.post("/query")
-async def query_knowledge(payload: Query):
+async def query_knowledge(payload: Query, response: Response):
+    """Answer a question; repeats against an unchanged graph come from the answer cache."""
     start = time.perf_counter()
     app.state.stats["requests_total"] += 1
     app.state.stats["query"]["count"] += 1
@@ -220,16 +648,33 @@ async def query_knowledge(payload: Query):
         # Check for explicit intelligence intent or keywords
         q = payload.question.lower()
         if payload.intent == "intelligence" or any(k in q for k in ["brief", "situation", "risk", "health", "overview"]):
-             res = await coordinator.process({"intent": "intelligence", "query": payload.question})
-             # Extract the result payload from the coordinator structure
-             return res.get("result", res)
-
-        # Legacy direct query
-        return coordinator.memory.query_knowledge(payload.question)
+            async def compute():
+                res = await coordinator.process({"intent": "intelligence", "query": payload.question})
+                # Extract the result payload from the coordinator structure
+                return res.get("result", res)
+            intent = "intelligence"
+        else:
+            # Legacy direct query
+            async def compute():
+                return await coordinator.coalesce(
+                    "memory", {"question": payload.question}, lambda: coordinator.memory.query_knowledge(payload.question)
+                )
+            intent = "memory"
+
+        answer, status = await app.state.answers.get_or_compute(
+            payload.question,
+            intent,
+            app.state.graph_cache["version"],
+            compute,
+            allow_stale=payload.allow_stale,
+            cacheable=_answer_cacheable,
+        )
+        response.headers["X-Answer-Cache"] = status
+        return answer
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     finally:
-        app.state.stats["query"]["total_time"] += (time.perf_counter() - start)
+        _finish_request("query", start)
 
 
 @app.get("/agents/status")
@@ -237,6 +682,39 @@ async def agents_status():
     return coordinator.get_agent_status()
 
 
+@app.get("/events")
+async def event_stream():
+    """Server-Sent Events push channel for graph version bumps, agent steps and stats deltas.
+
+    Each client gets a bounded queue; clients that fall behind receive a final
+    ``dropped`` event and should reconnect (EventSource does this automatically).
+    """
+    sub = events.subscribe()
+    metadata = app.state.graph_cache["metadata"]
+
+    async def stream():
+        try:
+            yield format_sse({"id": 0, "event": "hello", "data": metadata})
+            while True:
+                try:
+                    message = await asyncio.wait_for(sub.queue.get(), timeout=15.0)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if message is None:
+                    yield "event: dropped\ndata: {}\n\n"
+                    break
+                yield format_sse(message)
+        finally:
+            events.unsubscribe(sub)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/agents")
 async def list_agents():
     """List registered agents and capabilities."""
@@ -262,20 +740,24 @@ async def demo_run(scenario_id: int):
         raise HTTPException(status_code=404, detail="Scenario not found")
 
     data = scenario.get("data", {})
+    if data.get("type") != "query":
+        _require_writer()
     try:
         if data.get("type") == "query":
             question = str(data.get("question") or data.get("content") or "")
-            result = coordinator.memory.query_knowledge(question)
+            result = await coordinator.coalesce(
+                "demo", {"scenario": scenario_id}, lambda: coordinator.memory.query_knowledge(question)
+            )
             return {"scenario": scenario, "result": result}
 
-        result = await coordinator.process_new_information(data)
-        if not result.get("conflict"):
-            _export_graph_cached(app)
+        # Scenarios carry no date or sender, so each one hashes to a fixed event id; skip
+        # dedup so a re-run still shows the critic, memory and routing output.
+        result = await _process_and_refresh(data, dedupe=False)
         return {"scenario": scenario, "result": result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     finally:
-        app.state.stats["demo"]["total_time"] += (time.perf_counter() - start)
+        _finish_request("demo", start)
 
 
 @app.get("/stats")
@@ -290,10 +772,33 @@ async def stats():
         "process": {**s["process"], "avg_time": avg("process")},
         "query": {**s["query"], "avg_time": avg("query")},
         "demo": {**s["demo"], "avg_time": avg("demo")},
+        "batch": {**s["batch"], "avg_time": avg("batch")},
         "graph_history": app.state.graph_history[-50:],
+        "answer_cache": app.state.answers.snapshot(),
+        "coalescing": coordinator.flights.snapshot(),
+        "dedup": coordinator.seen.snapshot(),
+        "admission": admission.snapshot(),
+        "retention": app.state.retention.stats if app.state.retention is not None else None,
+        "latency": {
+            "routes": metrics.summaries("orgmind_http_request_duration_seconds"),
+            "agents": metrics.summaries("orgmind_agent_step_duration_seconds"),
+            "llm": metrics.summaries("orgmind_llm_call_duration_seconds"),
+        },
     }
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Expose latency summaries, counters and gauges in Prometheus text format."""
+    jobs = app.state.jobs
+    if jobs is not None:
+        metrics.gauge_set("orgmind_job_backlog", jobs.backlog)
+        metrics.gauge_set("orgmind_jobs_running", jobs.stats["running"])
+    if app.state.ready:
+        metrics.gauge_set("orgmind_graph_version", app.state.graph_cache["version"])
+    return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
 class VoiceRequest(BaseModel):
     text: str
     voice_id: str = "JBFqnCBsd6RMkjVDRZzb"  # Default to 'George' (British, Professional)
@@ -301,39 +806,25 @@ class VoiceRequest(BaseModel):
 
 @app.post("/tts")
 async def text_to_speech(req: VoiceRequest):
-    """Proxy TTS request to ElevenLabs to protect API Key."""
-    import httpx
-    
-    api_key = os.getenv("ELEVENLABS_API_KEY")
-    if not api_key:
+    """Proxy TTS request to ElevenLabs to protect API Key.
+
+    Repeat requests are served from the disk audio cache (``X-Cache: HIT``); misses
+    stream from the provider while being written to the cache.
+    """
+    tts = get_tts_client()
+    if not tts.api_key:
         raise HTTPException(status_code=500, detail="ElevenLabs API Key not configured")
 
-    url = f"https://api.elevenlabs.io/v1/text-to-speech/{req.voice_id}/stream"
-    headers = {
-        "Accept": "audio/mpeg",
-        "Content-Type": "application/json",
-        "xi-api-key": api_key
-    }
-    data = {
-        "text": req.text,
-        "model_id": "eleven_monolingual_v1",
-        "voice_settings": {
-            "stability": 0.5,
-            "similarity_boost": 0.5
-        }
-    }
+    cached = tts.cache.get(tts.key(req.voice_id, req.text))
+    if cached is not None:
+        return FileResponse(cached, media_type="audio/mpeg", headers={"X-Cache": "HIT"})
 
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(url, json=data, headers=headers, timeout=60.0) # Increased timeout for audio generation
-            if resp.status_code != 200:
-                logger.error(f"ElevenLabs Error: {resp.text}")
-                raise HTTPException(status_code=resp.status_code, detail=f"ElevenLabs Provider Error: {resp.text}")
-            
-            # Return raw audio bytes
-            from fastapi.responses import Response
-            return Response(content=resp.content, media_type="audio/mpeg")
-            
+        chunks = await tts.open_stream(req.voice_id, req.text)
+    except TTSProviderError as e:
+        logger.error(f"ElevenLabs Error: {e.detail}")
+        raise HTTPException(status_code=e.status_code, detail=f"ElevenLabs Provider Error: {e.detail}")
     except Exception as e:
         logger.error(f"TTS Failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    return StreamingResponse(chunks, media_type="audio/mpeg", headers={"X-Cache": "MISS"})
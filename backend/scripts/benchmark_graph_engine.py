@@ -0,0 +1,78 @@
+"""Compare memory, neighbor-scan speed and per-write cost of the networkx and compact graph engines."""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from knowledge_graph.graph_builder import GRAPH_ENGINES, GraphBuilder  # noqa: E402
+
+
+def build(engine: str, people: int, edges: int, seed: int) -> GraphBuilder:
+    rnd = random.Random(seed)
+    g = GraphBuilder(engine=engine)
+    emails = [f"user{i}@company.com" for i in range(people)]
+    for email in emails:
+        g.add_person(email, name=email.split("@")[0])
+    for _ in range(edges):
+        g.add_communication_edge(rnd.choice(emails), rnd.choice(emails))
+    g.journal.reset(0)
+    return g
+
+
+def write_cost(g: GraphBuilder, writes: int, seed: int) -> float:
+    """Median seconds for one write + commit, with a reader pinning the previous version throughout."""
+    rnd = random.Random(seed)
+    people = g.find_nodes(type="person")
+    version = g.journal.version
+    times = []
+    for _ in range(writes):
+        with g.snapshot():
+            start = time.perf_counter()
+            g.add_communication_edge(rnd.choice(people), rnd.choice(people))
+            version += 1
+            g.commit(version)
+            times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--people", type=int, default=20_000)
+    parser.add_argument("--edges", type=int, default=200_000)
+    parser.add_argument("--writes", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    for engine in GRAPH_ENGINES:
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        g = build(engine, args.people, args.edges, args.seed)
+        build_s = time.perf_counter() - start
+        gc.collect()
+        mem, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        graph = g.get_graph()
+        start = time.perf_counter()
+        scanned = sum(1 for n in graph.nodes for _ in graph.successors(n))
+        scan_s = time.perf_counter() - start
+        write_s = write_cost(g, args.writes, args.seed)
+        print(
+            f"{engine:9s} nodes={graph.number_of_nodes()} edges={graph.number_of_edges()} "
+            f"memory={mem / 1e6:.1f}MB build={build_s:.2f}s scan={scan_s * 1000:.0f}ms ({scanned} edges) "
+            f"write+commit={write_s * 1000:.1f}ms"
+        )
+        del g, graph
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Compare cold-load time and peak RSS of pickle and columnar graph snapshots.
+
+Each load runs in a fresh interpreter so peak RSS is not polluted by the build.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from knowledge_graph.columnar import read_graph, write_graph  # noqa: E402
+from knowledge_graph.graph_builder import GraphBuilder  # noqa: E402
+
+
+def build(people: int, edges: int, decisions: int, seed: int) -> GraphBuilder:
+    rnd = random.Random(seed)
+    g = GraphBuilder(engine="networkx")
+    emails = [f"user{i}@company.com" for i in range(people)]
+    for email in emails:
+        g.add_entity(f"person:{email}", email.split("@")[0], {"type": "person", "email": email})
+    for i in range(edges):
+        u, v = rnd.choice(emails), rnd.choice(emails)
+        g.add_relation(f"person:{u}", f"person:{v}", "emailed", {"weight": rnd.randint(1, 20), "email_id": i})
+    words = "budget launch hiring roadmap vendor pricing delay risk review approval".split()
+    for i in range(decisions):
+        body = " ".join(rnd.choice(words) for _ in range(120))
+        g.add_entity(
+            f"decision:{i}",
+            f"Decision {i}",
+            {"type": "decision", "content": body, "date": f"2024-01-{i % 28 + 1:02d}", "priority": rnd.choice(["high", "low"])},
+        )
+    return g
+
+
+def peak_rss_mb() -> float:
+    # VmHWM resets on exec; ru_maxrss can carry over the parent's peak from fork.
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def load(path: str, exclude: list[str]) -> None:
+    before = peak_rss_mb()
+    start = time.perf_counter()
+    graph = read_graph(path, exclude=exclude)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({"seconds": elapsed, "peak_rss_mb": peak_rss_mb() - before, "nodes": graph.number_of_nodes()}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--people", type=int, default=20_000)
+    parser.add_argument("--edges", type=int, default=200_000)
+    parser.add_argument("--decisions", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--load", help=argparse.SUPPRESS)
+    parser.add_argument("--exclude", nargs="*", default=[], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.load:
+        load(args.load, args.exclude)
+        return
+
+    graph = build(args.people, args.edges, args.decisions, args.seed).get_graph()
+    print(f"nodes={graph.number_of_nodes()} edges={graph.number_of_edges()} (peak RSS is the growth during the load)")
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = []
+        for fmt in ("pickle", "columnar"):
+            path = Path(tmp) / f"graph.{fmt}"
+            start = time.perf_counter()
+            with open(path, "wb") as f:
+                write_graph(graph, f, fmt)
+            cases.append((fmt, path, [], time.perf_counter() - start))
+        cases.append(("columnar -content", cases[1][1], ["content"], cases[1][3]))
+
+        for name, path, exclude, save_s in cases:
+            out = subprocess.run(
+                [sys.executable, __file__, "--load", str(path), "--exclude", *exclude],
+                capture_output=True, text=True, check=True,
+            )
+            result = json.loads(out.stdout)
+            print(
+                f"{name:18s} size={path.stat().st_size / 1e6:6.1f}MB save={save_s:5.2f}s "
+                f"load={result['seconds']:5.2f}s peak_rss={result['peak_rss_mb']:6.0f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -20,13 +20,50 @@ import pandas as pd
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+from data_pipeline.graph_frames import aggregate_edges  # noqa: E402
+from knowledge_graph.entity_resolver import name_key, parse_person  # noqa: E402
 from knowledge_graph.graph_builder import GraphBuilder  # noqa: E402
 
 
-def _split_recipients(value: str) -> list[str]:
-    if not value:
-        return []
-    return [r.strip() for r in str(value).split(",") if r.strip()]
+def _text(frame: pd.DataFrame, column: str) -> pd.Series:
+    if column not in frame.columns:
+        return pd.Series("", index=frame.index)
+    return frame[column].fillna("").astype(str).str.strip()
+
+
+def communication_frames(g: GraphBuilder, emails: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """People rows and sender -> recipient edge rows for all emails, one edge row per address pair."""
+    pairs = pd.DataFrame(
+        {
+            "email_id": _text(emails, "id"),
+            "sender": _text(emails, "sender"),
+            "recipient": (_text(emails, "to") + "," + _text(emails, "cc")).str.split(","),
+        }
+    ).explode("recipient")
+    pairs["recipient"] = pairs["recipient"].str.strip()
+    pairs = pairs[pairs["recipient"] != ""]
+
+    # Resolve each distinct address once instead of once per email. No person node exists
+    # yet, so a bare name is paired with the address it appears with elsewhere in the frame.
+    addresses = [a for a in pd.unique(pd.concat([_text(emails, "sender"), pairs["recipient"]])) if a]
+    parsed = [parse_person(a) for a in addresses]
+    known = {name_key("person", display): address for display, address in parsed if display and address}
+    resolved = [address or known.get(name_key("person", display)) for display, address in parsed]
+    ids = {a: g.person_id(address or a) for a, address in zip(addresses, resolved)}
+    people = pd.DataFrame(
+        {
+            "id": [ids[a] for a in addresses],
+            "label": [display or a for a, (display, _) in zip(addresses, parsed)],
+            "type": "person",
+            "email": [address or a for a, address in zip(addresses, resolved)],
+            "named": [bool(display) for display, _ in parsed],
+        }
+    )
+    # Where one person appears both ways, keep the row with a display name for its label.
+    people = people.sort_values("named", ascending=False, kind="stable").drop_duplicates("id").drop(columns="named")
+
+    pairs = pairs[pairs["sender"] != ""]
+    return people, aggregate_edges(pairs.assign(source=pairs["sender"].map(ids), target=pairs["recipient"].map(ids)))
 
 
 def main() -> None:
@@ -44,20 +81,16 @@ def main() -> None:
 
     g = GraphBuilder()
 
-    for _, row in emails.iterrows():
+    # One pass each over pre-aggregated people and address pairs; entities come per email below.
+    people, edges = communication_frames(g, emails)
+    g.bulk_add_nodes(people)
+    g.bulk_add_edges(edges, relation_type="emailed")
+    # Fold the people the frame could not pair up (e.g. "Chen, Sarah" and sarah.chen@...).
+    g.merge_duplicates()
+
+    for _, row in emails[_text(emails, "id").isin(per_email.keys())].iterrows():
         email_id = str(row.get("id", ""))
         sender = str(row.get("sender", "") or "").strip()
-        to_list = _split_recipients(str(row.get("to", "") or ""))
-        cc_list = _split_recipients(str(row.get("cc", "") or ""))
-        recipients = [r for r in (to_list + cc_list) if r]
-
-        if sender:
-            g.add_person(sender, name=sender)
-        for r in recipients:
-            g.add_person(r, name=r)
-            if sender:
-                g.add_communication_edge(sender, r, weight=1, props={"email_id": email_id})
-
         info = per_email.get(email_id) or {}
         for p in info.get("people", []) or []:
             if isinstance(p, str):
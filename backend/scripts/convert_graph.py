@@ -0,0 +1,37 @@
+"""Convert a pickled knowledge graph to the columnar snapshot format (or back)."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from knowledge_graph.columnar import SNAPSHOT_FORMATS, is_columnar, read_graph, write_graph  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--graph", default="backend/data/processed/knowledge_graph.pkl")
+    parser.add_argument("--output", default=None, help="defaults to overwriting --graph")
+    parser.add_argument("--format", choices=SNAPSHOT_FORMATS, default="columnar")
+    args = parser.parse_args()
+
+    source = Path(args.graph)
+    before = "columnar" if is_columnar(source) else "pickle"
+    graph = read_graph(source)
+    output = Path(args.output or source)
+    tmp = output.with_name(output.name + ".tmp")
+    with open(tmp, "wb") as f:
+        write_graph(graph, f, args.format)
+    tmp.replace(output)
+    print(
+        f"{source} ({before}, {source.stat().st_size if source.exists() else 0} bytes) -> "
+        f"{output} ({args.format}, {output.stat().st_size} bytes): "
+        f"{graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Merge duplicate person/topic nodes in a pickled knowledge graph."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from knowledge_graph.graph_builder import GraphBuilder  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--graph", default="backend/data/processed/knowledge_graph.pkl")
+    parser.add_argument("--output", default=None, help="defaults to overwriting --graph")
+    parser.add_argument("--dry-run", action="store_true", help="report duplicate groups without writing")
+    args = parser.parse_args()
+
+    g = GraphBuilder.load(args.graph)
+    before = g.get_stats()["nodes_total"]
+    if args.dry_run:
+        for kind in ("person", "topic"):
+            for group in g.resolver.duplicate_groups(kind):
+                print(f"{kind}: {', '.join(group)}")
+        return
+
+    report = g.merge_duplicates()
+    output = args.output or args.graph
+    g.save(output)
+    print(f"Merged {report['merged']} nodes in {report['groups']} groups ({before} -> {g.get_stats()['nodes_total']} nodes)")
+    print(f"Saved: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ Output: backend/data/processed/enron_entities.json
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import os
 import sys
@@ -37,7 +38,7 @@ def main() -> None:
     df = pd.read_csv(args.input).head(args.limit)
     extractor = EntityExtractor()
 
-    results = extractor.batch_extract(df, batch_size=args.batch_size, sleep_seconds=args.sleep)
+    results = asyncio.run(extractor.batch_extract(df, batch_size=args.batch_size, sleep_seconds=args.sleep))
 
     Path(args.output).parent.mkdir(parents=True, exist_ok=True)
     with open(args.output, "w", encoding="utf-8") as f:
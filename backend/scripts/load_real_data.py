@@ -11,7 +11,9 @@ import pandas as pd
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from data_pipeline.graph_frames import aggregate_edges  # noqa: E402
 from knowledge_graph import GraphBuilder  # noqa: E402
+from knowledge_graph.entity_resolver import normalize_email  # noqa: E402
 
 
 def _split_recipients(value: str | None) -> list[str]:
@@ -44,6 +46,12 @@ def _extract_topic(subject: str) -> str:
     return text
 
 
+def _column(df: pd.DataFrame, column: str) -> pd.Series:
+    if column not in df.columns:
+        return pd.Series("", index=df.index)
+    return df[column].fillna("").astype(str)
+
+
 def load_emails_to_graph(csv_path: str, graph_path: str) -> GraphBuilder:
     """Load emails from CSV and build a connected knowledge graph."""
     df = pd.read_csv(csv_path)
@@ -53,37 +61,75 @@ def load_emails_to_graph(csv_path: str, graph_path: str) -> GraphBuilder:
 
     decision_keywords = ["approved", "finalized", "decided", "announcement", "update", "timeline", "launch"]
 
-    for _, row in df.iterrows():
-        sender_email = _clean_email(row.get("sender"))
-        if not sender_email:
-            continue
-
-        sender_name = _name_from_email(sender_email)
-        graph.add_person(sender_email, name=sender_name)
-
-        recipients = _split_recipients(row.get("to")) + _split_recipients(row.get("cc"))
-        recipients = [r for r in (_clean_email(r) for r in recipients) if r]
-
-        for r in recipients:
-            graph.add_person(r, name=_name_from_email(r))
-            graph.add_communication_edge(sender_email, r, weight=1, props={"email_id": row.get("id")})
-
-        subject = str(row.get("subject") or "")
-        body = str(row.get("body") or "")
-        date = str(row.get("date") or "")
-
-        topic = _extract_topic(subject)
-        if topic:
-            tid = graph.add_topic(topic)
-            graph.add_discussion_edge(sender_email, tid)
-
-        if any(kw in subject.lower() or kw in body.lower() for kw in decision_keywords):
-            title = subject.strip() or f"Decision {row.get('id')}"
-            did = graph.add_decision(title, content=f"{subject}: {body[:200]}...", date=date)
-            graph.add_relation(did, graph.person_id(sender_email), "made_by")
-            for r in recipients:
-                pid = graph.person_id(r)
-                graph.add_impact_edge(did, pid)
+    # Rows are normalized and aggregated with pandas, then inserted with one bulk pass per
+    # node/edge kind rather than a has_node/has_edge round trip per recipient.
+    emails = pd.DataFrame(
+        {
+            "email_id": df["id"] if "id" in df.columns else pd.Series(range(len(df)), index=df.index),
+            "sender": _column(df, "sender").map(_clean_email),
+            "recipients": [
+                [r for r in (_clean_email(r) for r in _split_recipients(to) + _split_recipients(cc)) if r]
+                for to, cc in zip(_column(df, "to"), _column(df, "cc"))
+            ],
+            "subject": _column(df, "subject"),
+            "body": _column(df, "body"),
+            "date": _column(df, "date"),
+        }
+    )
+    emails = emails[emails["sender"] != ""]
+    pairs = emails[["email_id", "sender", "recipients"]].explode("recipients").dropna(subset=["recipients"])
+
+    addresses = pd.unique(pd.concat([emails["sender"], pairs["recipients"]]))
+    person_ids = {a: graph.person_id(a) for a in addresses}
+    graph.bulk_add_nodes(
+        pd.DataFrame(
+            {
+                "id": [person_ids[a] for a in addresses],
+                "label": [_name_from_email(a) for a in addresses],
+                "type": "person",
+                "email": [normalize_email(a) or a for a in addresses],
+            }
+        )
+    )
+    graph.bulk_add_edges(
+        aggregate_edges(pairs.assign(source=pairs["sender"].map(person_ids), target=pairs["recipients"].map(person_ids))),
+        relation_type="emailed",
+    )
+
+    # Topics go through add_topic once per distinct subject prefix, so near-duplicates still merge.
+    topics = emails["subject"].map(_extract_topic)
+    topic_ids = {t: graph.add_topic(t) for t in pd.unique(topics) if t}
+    discussed = pd.DataFrame({"source": emails["sender"].map(person_ids), "target": topics.map(topic_ids)})
+    graph.bulk_add_edges(discussed.dropna().drop_duplicates(), relation_type="discussed")
+
+    text = (emails["subject"] + "\n" + emails["body"]).str.lower()
+    decisions = emails[text.str.contains("|".join(decision_keywords), regex=True)]
+    titles = [
+        subject.strip() or f"Decision {email_id}"
+        for subject, email_id in zip(decisions["subject"], decisions["email_id"])
+    ]
+    decision_ids = [graph.decision_id(t) for t in titles]
+    graph.bulk_add_nodes(
+        pd.DataFrame(
+            {
+                "id": decision_ids,
+                "label": titles,
+                "type": "decision",
+                "content": [f"{subject}: {body[:200]}..." for subject, body in zip(decisions["subject"], decisions["body"])],
+                "date": decisions["date"].tolist(),
+            }
+        )
+    )
+    # made_by the sender, then impacts on each recipient; the last write per pair wins, as before.
+    decision_edges = pd.DataFrame(
+        [
+            (did, person_ids[person], relation)
+            for did, sender, recipients in zip(decision_ids, decisions["sender"], decisions["recipients"])
+            for person, relation in [(sender, "made_by"), *((r, "impacts") for r in recipients)]
+        ],
+        columns=["source", "target", "relation_type"],
+    )
+    graph.bulk_add_edges(decision_edges.drop_duplicates(["source", "target"], keep="last"))
 
     output_path = Path(graph_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -8,24 +8,57 @@ from datetime import datetime, timezone
 # Configuration
 DATA_FILE = "data/simulation_emails.json"
 API_URL = os.getenv("API_URL", "https://orgmind.onrender.com/process")
+BATCH_URL = os.getenv("BATCH_URL", API_URL.rstrip("/") + "/batch")
 
-async def send_email(client, email):
-    """Send a single email to the backend."""
-    # Overwrite date to be "now" so it appears in "Today" on frontend
+def build_payload(email):
+    # Keep the original date: it is part of the event id, so a re-sent email is deduplicated.
+    # "received_at" (ignored by the id) is what puts it under "Today" on the frontend.
     now_str = datetime.now().strftime("%a, %b %d, %I:%M %p")
-    payload = {
+    return {
         "type": "email",
         "content": email["content"],
-        "date": now_str,
+        "date": email.get("date"),
         "metadata": {
             "sender": email["sender"],
-            "subject": email["subject"]
+            "subject": email["subject"],
+            "received_at": now_str
         }
     }
+
+async def post_with_backoff(client, url, payload, timeout, attempts=4):
+    """POST, honouring 429 + Retry-After from the server's admission control."""
+    for attempt in range(attempts):
+        resp = await client.post(url, json=payload, timeout=timeout)
+        if resp.status_code != 429 or attempt == attempts - 1:
+            return resp
+        await asyncio.sleep(float(resp.headers.get("Retry-After", "1")))
+    return resp
+
+async def send_batch(client, emails):
+    """Send the whole batch in one /process/batch call. Returns None if unsupported."""
+    print(f"Sending batch of {len(emails)} emails to {BATCH_URL}")
+    try:
+        resp = await post_with_backoff(client, BATCH_URL, {"items": [build_payload(e) for e in emails]}, timeout=120.0)
+        if resp.status_code in (404, 405):
+            return None
+        resp.raise_for_status()
+    except httpx.HTTPError as e:
+        print(f"❌ Batch failed: {e}")
+        return [False] * len(emails)
+    results = resp.json().get("results", [])
+    for email, item in zip(emails, results):
+        status = item.get("status")
+        mark = "✅" if status in ("processed", "duplicate", "conflict") else "❌"
+        print(f"{mark} {email['subject']} - {status}")
+    return [item.get("status") in ("processed", "duplicate", "conflict") for item in results]
+
+async def send_email(client, email):
+    """Send a single email to the backend."""
+    payload = build_payload(email)
     
     print(f"Sending: {email['subject']}")
     try:
-        resp = await client.post(API_URL, json=payload, timeout=30.0)
+        resp = await post_with_backoff(client, API_URL, payload, timeout=30.0)
         resp.raise_for_status()
         print(f"✅ Sent: {email['subject']} - Status: {resp.status_code}")
         return True
@@ -58,10 +91,12 @@ async def main():
     print(f"--- Simulation Run: Hour {current_hour} (UTC) ---")
     print(f"Targeting Batch #{batch_index} with {len(emails)} emails.")
     
-    # Send all emails in the batch concurrently
+    # Send the batch in one request; fall back to concurrent single sends on older backends
     async with httpx.AsyncClient() as client:
-        tasks = [send_email(client, email) for email in emails]
-        results = await asyncio.gather(*tasks)
+        results = await send_batch(client, emails)
+        if results is None:
+            tasks = [send_email(client, email) for email in emails]
+            results = await asyncio.gather(*tasks)
     
     success_count = sum(results)
     print(f"--- Completed: {success_count}/{len(emails)} sent successfully. ---")
@@ -0,0 +1,79 @@
+"""Integration tests for the graph read endpoints."""
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """App client backed by a throwaway graph snapshot (no LLM key)."""
+    monkeypatch.setenv("ORG_GRAPH_PATH", str(tmp_path / "graph.pkl"))
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    import main
+
+    with TestClient(main.app) as c:
+        # The graph loads in the background after the server starts accepting traffic.
+        deadline = time.monotonic() + 10
+        while c.get("/ready").status_code != 200:
+            assert time.monotonic() < deadline, "app never became ready"
+            time.sleep(0.02)
+        yield c
+
+
+@pytest.mark.integration
+class TestGraphEndpoints:
+    """Tests for /graph and /graph/changes."""
+
+    def test_graph_etag_round_trip(self, client):
+        first = client.get("/graph")
+        assert first.status_code == 200
+        assert "nodes" in first.json()
+
+        etag = first.headers["etag"]
+        cached = client.get("/graph", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        client.post("/process", json={"type": "email", "content": "Hiring plan approved", "topic": "hiring"})
+        changed = client.get("/graph", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+    def test_gzip_body_has_its_own_etag(self, client):
+        client.post("/process", json={"type": "email", "content": "Hiring plan approved " * 100, "topic": "hiring"})
+        gz = client.get("/graph", headers={"Accept-Encoding": "gzip"})
+        plain = client.get("/graph", headers={"Accept-Encoding": "gzip;q=0, identity"})
+
+        assert gz.headers["content-encoding"] == "gzip"
+        assert "content-encoding" not in plain.headers
+        assert gz.headers["etag"] == plain.headers["etag"][:-1] + '-gz"'
+        stale = client.get("/graph", headers={"Accept-Encoding": "identity", "If-None-Match": gz.headers["etag"]})
+        assert stale.status_code == 200 and stale.json() == plain.json()
+
+    def test_graph_changes_since_version(self, client):
+        version = client.get("/graph").json()["metadata"]["version"]
+        client.post("/process", json={"type": "email", "content": "Hiring plan approved", "topic": "hiring"})
+
+        delta = client.get("/graph/changes", params={"since": version}).json()
+        assert delta["full"] is False
+        assert delta["version"] == version + 1
+        assert any(c["key"] == "topic:hiring" for c in delta["changes"])
+
+        fallback = client.get("/graph/changes", params={"since": -1}).json()
+        assert fallback["full"] is True
+        assert "nodes" in fallback["graph"]
+
+
+@pytest.mark.integration
+class TestStartup:
+    """Tests for liveness vs readiness."""
+
+    def test_ready_reports_startup_timings(self, client):
+        body = client.get("/ready").json()
+        assert body["ready"] is True
+        startup = body["startup"]
+        assert startup["import_seconds"] > 0
+        assert startup["live_seconds"] <= startup["ready_seconds"]
+        assert client.get("/health").json()["ready"] is True
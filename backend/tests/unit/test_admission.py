@@ -0,0 +1,62 @@
+"""Unit tests for admission control."""
+
+import asyncio
+
+import pytest
+
+from utils.admission import DEFAULT_LIMITS, AdmissionController, AdmissionRejected
+
+
+def _controller(**kwargs) -> AdmissionController:
+    return AdmissionController({"/query": (1, 1)}, **kwargs)
+
+
+class TestAdmissionController:
+    """Tests for per-route limits, bounded queues and the read reserve."""
+
+    def test_queue_full_fails_fast(self):
+        async def run():
+            ctl = _controller()
+            release = asyncio.Event()
+
+            async def hold():
+                async with ctl.admit("/query"):
+                    await release.wait()
+
+            holder = asyncio.create_task(hold())
+            waiter = asyncio.create_task(hold())
+            await asyncio.sleep(0)
+            with pytest.raises(AdmissionRejected) as exc:
+                async with ctl.admit("/query"):
+                    pass
+            release.set()
+            await asyncio.gather(holder, waiter)
+            return ctl, exc.value
+
+        ctl, rejected = asyncio.run(run())
+        assert rejected.reason == "queue_full" and rejected.retry_after == 2
+        assert ctl.stats == {"admitted": 2, "queued": 1, "rejected": 1}
+        assert ctl.inflight == 0
+
+    def test_reads_keep_reserved_share(self):
+        async def run():
+            ctl = _controller(max_inflight=2, read_reserved=1)
+            async with ctl.admit("/graph"):
+                with pytest.raises(AdmissionRejected) as exc:
+                    async with ctl.admit("/query"):
+                        pass
+                async with ctl.admit("/health"):
+                    pass
+            return exc.value
+
+        assert asyncio.run(run()).reason == "reserved_for_reads"
+
+    def test_env_overrides_merge_over_defaults(self, monkeypatch):
+        monkeypatch.setenv("ORG_ADMISSION_LIMITS", '{"/query": [16, 128]}')
+        monkeypatch.setenv("ORG_ADMISSION_RETRY_AFTER", "5")
+        ctl = AdmissionController.from_env()
+
+        assert (ctl.limiters["/query"].max_concurrent, ctl.limiters["/query"].max_queue) == (16, 128)
+        assert set(ctl.limiters) == set(DEFAULT_LIMITS)
+        assert ctl.limiters["/process"].max_concurrent == DEFAULT_LIMITS["/process"][0]
+        assert ctl.retry_after == 5
@@ -1,5 +1,7 @@
 """Unit tests for Agents."""
 
+import asyncio
+
 import pytest
 from agents.coordinator import Coordinator
 from agents.memory_agent import MemoryAgent
@@ -30,6 +32,26 @@ class TestMemoryAgent:
         assert "status" in result
         assert result["status"] in ["updated", "acknowledged"]
 
+    def test_query_reads_one_committed_version(self, graph_builder, monkeypatch):
+        agent = MemoryAgent(graph=graph_builder)
+        graph_builder.add_decision("Budget approved", content="Q3 budget approved")
+        graph_builder.add_relation("person:alice", "decision:budget-approved", "approved")
+        graph_builder.commit(1)
+        # Uncommitted writes: in the live graph and indexes, not in the published version.
+        graph_builder.add_decision("Budget cut", content="Q3 budget cut by 10%")
+        graph_builder.add_relation("person:bob", "decision:budget-cut", "approved")
+
+        async def llm(system, user):
+            return "ok"
+
+        monkeypatch.setattr(agent, "openai_text", llm)
+        context = asyncio.run(agent.query_knowledge("What happened to the budget?"))["context"]
+
+        assert [n["id"] for n in context["nodes"]] == ["decision:budget-approved"]
+        assert [(e["source"], e["target"]) for e in context["edges"]] == [("person:alice", "decision:budget-approved")]
+        assert context["stats"]["nodes_total"] == 2 and context["stats"]["nodes_by_type"]["decision"] == 1
+        assert graph_builder.versions.live_versions() == [1]
+
 
 class TestCoordinator:
     """Tests for Coordinator class."""
@@ -51,3 +73,151 @@ class TestCoordinator:
         result = coordinator.process(info)
         assert "memory" in result
         assert "router" in result or "agents_used" in result
+
+
+class TestBatchProcessing:
+    """Tests for Coordinator.process_batch."""
+
+    def test_batch_commits_once_with_per_item_results(self, graph_builder):
+        coordinator = Coordinator(graph=graph_builder, config={"llm_enabled": False, "batch_chunk_size": 2})
+        graph_builder.add_decision("Q2 budget finalized at $3.5M", content="Q2 budget finalized at $3.5M")
+        items = [
+            {"type": "email", "content": f"Roadmap update {i}", "topic": f"topic {i}"}
+            for i in range(5)
+        ]
+
+        result = asyncio.run(coordinator.process_batch(items))
+
+        assert result["summary"] == {"total": 5, "processed": 5, "deduplicated": 0, "conflicts": 0, "failed": 0}
+        assert [r["index"] for r in result["results"]] == list(range(5))
+        assert result["version"] == 1
+        assert all(r["memory"]["version"] == 1 for r in result["results"])
+        assert graph_builder.get_stats()["nodes_by_type"]["topic"] == 5
+
+    def test_memory_failure_is_isolated(self, graph_builder, monkeypatch):
+        coordinator = Coordinator(graph=graph_builder, config={"llm_enabled": False})
+        original = coordinator.memory._apply_extraction
+
+        def flaky(item, extracted):
+            if item["content"] == "bad":
+                raise ValueError("boom")
+            return original(item, extracted)
+
+        monkeypatch.setattr(coordinator.memory, "_apply_extraction", flaky)
+        result = asyncio.run(
+            coordinator.process_batch([{"content": "good", "topic": "a"}, {"content": "bad", "topic": "b"}])
+        )
+
+        assert [r["status"] for r in result["results"]] == ["processed", "error"]
+        assert "boom" in result["results"][1]["error"]
+
+    def test_failed_item_writes_are_rolled_back(self, graph_builder, monkeypatch):
+        coordinator = Coordinator(graph=graph_builder, config={"llm_enabled": False})
+        graph_builder.add_topic("Shared")
+        graph_builder.commit(1)
+        before = graph_builder.get_stats()
+        original = coordinator.memory._apply_extraction
+
+        def half_done(item, extracted):
+            if item["content"] != "bad":
+                return original(item, extracted)
+            graph_builder.add_topic("Orphan")
+            graph_builder.add_entity("topic:shared", "Renamed", {"type": "topic"})
+            raise ValueError("boom")
+
+        monkeypatch.setattr(coordinator.memory, "_apply_extraction", half_done)
+        result = asyncio.run(
+            coordinator.process_batch([{"content": "bad", "topic": "b"}, {"content": "good", "topic": "Shared"}])
+        )
+
+        assert [r["status"] for r in result["results"]] == ["error", "processed"]
+        g = graph_builder.get_graph()
+        assert not g.has_node("topic:orphan") and g.nodes["topic:shared"]["label"] == "Shared"
+        assert graph_builder.find_nodes(type="topic") == ["topic:shared"]
+        assert graph_builder.search_nodes("orphan") == [] and graph_builder.search_nodes("renamed") == []
+        changed = {c["key"] for c in graph_builder.get_changes(1)}
+        assert "topic:orphan" not in changed
+        assert graph_builder.get_stats()["nodes_by_type"]["topic"] == before["nodes_by_type"]["topic"]
+
+
+class TestDeduplication:
+    """Tests for idempotent ingestion of replayed updates."""
+
+    EMAIL = {
+        "type": "email",
+        "content": "Launch moved to Friday",
+        "topic": "launch",
+        "date": "2024-03-01 10:00",
+        "metadata": {"sender": "alice@corp.com", "subject": "Launch date"},
+    }
+
+    def test_replay_skips_the_pipeline(self, graph_builder, monkeypatch):
+        coordinator = Coordinator(graph=graph_builder, config={"llm_enabled": False})
+        calls = {"critic": 0}
+        original = coordinator.critic.process
+
+        async def counting(payload):
+            calls["critic"] += 1
+            return await original(payload)
+
+        monkeypatch.setattr(coordinator.critic, "process", counting)
+        first = asyncio.run(coordinator.process_new_information(dict(self.EMAIL)))
+        nodes = graph_builder.get_stats()["nodes_total"]
+        again = asyncio.run(coordinator.process_new_information(dict(self.EMAIL)))
+
+        assert first["deduplicated"] is False
+        assert again["deduplicated"] is True
+        assert again["event_id"] == first["event_id"]
+        assert graph_builder.get_graph().has_node(first["event_id"])
+        assert calls["critic"] == 1
+        assert graph_builder.get_stats()["nodes_total"] == nodes
+        assert coordinator.memory.get_graph_state()["version"] == 1
+
+        # A fresh coordinator over the same graph (a restart) still recognizes the replay.
+        restarted = Coordinator(graph=graph_builder, config={"llm_enabled": False})
+        restarted.remember_events()
+        assert asyncio.run(restarted.process_new_information(dict(self.EMAIL)))["deduplicated"] is True
+
+    def test_simulated_traffic_resend_is_deduplicated(self, graph_builder, monkeypatch):
+        from datetime import datetime as real_datetime
+
+        from scripts import simulate_traffic
+
+        email = {
+            "type": "email",
+            "sender": "Linn <lbieske@mit.edu>",
+            "subject": "Kickoff",
+            "content": "Kickoff at 10",
+            "date": "Sat, Feb 7, 10:00 AM",
+        }
+        coordinator = Coordinator(graph=graph_builder, config={"llm_enabled": False})
+        results = []
+        for day in (7, 8):
+            clock = type("Clock", (), {"now": staticmethod(lambda day=day: real_datetime(2026, 2, day, 9, 0))})
+            monkeypatch.setattr(simulate_traffic, "datetime", clock)
+            results.append(asyncio.run(coordinator.process_new_information(simulate_traffic.build_payload(email))))
+
+        assert results[0]["deduplicated"] is False and results[1]["deduplicated"] is True
+        node = graph_builder.get_graph().nodes[results[0]["event_id"]]
+        assert node["date"] == "Sat, Feb 07, 09:00 AM"
+
+    def test_demo_reruns_bypass_dedup(self, graph_builder):
+        coordinator = Coordinator(graph=graph_builder, config={"llm_enabled": False})
+        scenario = {"type": "email", "content": "Budget cut to $40k", "priority": "high"}
+        first = asyncio.run(coordinator.process_new_information(dict(scenario), dedupe=False))
+        again = asyncio.run(coordinator.process_new_information(dict(scenario), dedupe=False))
+
+        assert again["deduplicated"] is False and again["event_id"] == first["event_id"]
+        assert "memory" in again and "routing" in again
+        assert asyncio.run(coordinator.process_new_information(dict(scenario)))["deduplicated"] is True
+
+    def test_batch_dedups_replays_and_repeats(self, graph_builder):
+        coordinator = Coordinator(graph=graph_builder, config={"llm_enabled": False})
+        asyncio.run(coordinator.process_new_information(dict(self.EMAIL)))
+        other = {**self.EMAIL, "content": "Launch checklist attached"}
+
+        result = asyncio.run(coordinator.process_batch([dict(self.EMAIL), other, dict(other)]))
+
+        assert [r["status"] for r in result["results"]] == ["duplicate", "processed", "duplicate"]
+        assert [r["deduplicated"] for r in result["results"]] == [True, False, True]
+        assert result["summary"]["deduplicated"] == 2
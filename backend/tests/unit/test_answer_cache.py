@@ -0,0 +1,94 @@
+"""Unit tests for the graph-version-keyed answer cache."""
+
+import asyncio
+
+from utils.answer_cache import AnswerCache, normalize_question
+
+
+def _counter():
+    calls = {"n": 0}
+
+    async def compute():
+        calls["n"] += 1
+        return {"answer": calls["n"]}
+
+    return calls, compute
+
+
+class TestAnswerCache:
+    """Tests for hit/miss/stale behaviour."""
+
+    def test_hit_requires_same_version(self):
+        async def run():
+            cache = AnswerCache()
+            calls, compute = _counter()
+            first = await cache.get_or_compute("Who owns Budget?", "memory", 1, compute)
+            second = await cache.get_or_compute("  who owns budget ", "memory", 1, compute)
+            third = await cache.get_or_compute("who owns budget", "memory", 2, compute)
+            return calls["n"], first, second, third
+
+        n, first, second, third = asyncio.run(run())
+        assert n == 2
+        assert first[1] == "miss" and second == ({"answer": 1}, "hit")
+        assert third == ({"answer": 2}, "miss")
+
+    def test_stale_while_revalidate(self):
+        async def run():
+            cache = AnswerCache()
+            calls, compute = _counter()
+            await cache.get_or_compute("brief", "intelligence", 1, compute)
+            stale = await cache.get_or_compute("brief", "intelligence", 2, compute, allow_stale=True)
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            fresh = await cache.get_or_compute("brief", "intelligence", 2, compute)
+            return stale, fresh, cache.snapshot()
+
+        stale, fresh, stats = asyncio.run(run())
+        assert stale == ({"answer": 1}, "stale")
+        assert fresh == ({"answer": 2}, "hit")
+        assert stats["refreshes"] == 1
+
+    def test_lru_and_ttl(self):
+        async def run():
+            cache = AnswerCache(max_entries=2, ttl=0.0)
+            _, compute = _counter()
+            for q in ("a", "b", "c"):
+                await cache.get_or_compute(q, "memory", 1, compute)
+            status = (await cache.get_or_compute("c", "memory", 1, compute))[1]
+            return cache, status
+
+        cache, status = asyncio.run(run())
+        assert len(cache) == 2 and cache.stats["evictions"] == 1
+        assert status == "miss"
+
+    def test_normalize_question(self):
+        assert normalize_question("  What's   the RISK?? ") == "what's the risk"
+
+    def test_failed_llm_answer_is_not_cached(self, graph_builder, monkeypatch):
+        from agents.memory_agent import MemoryAgent
+
+        agent = MemoryAgent(graph=graph_builder)
+        replies = iter([RuntimeError("upstream timeout"), "Alice owns Budget."])
+
+        async def flaky_llm(system, user):
+            reply = next(replies)
+            if isinstance(reply, Exception):
+                raise reply
+            return reply
+
+        monkeypatch.setattr(agent, "openai_text", flaky_llm)
+
+        async def run():
+            cache = AnswerCache()
+            cacheable = lambda answer: not answer.get("llm_error")
+            compute = lambda: agent.query_knowledge("Who owns Budget?")
+            failed = await cache.get_or_compute("Who owns Budget?", "memory", 1, compute, cacheable=cacheable)
+            retried = await cache.get_or_compute("Who owns Budget?", "memory", 1, compute, cacheable=cacheable)
+            repeat = await cache.get_or_compute("Who owns Budget?", "memory", 1, compute, cacheable=cacheable)
+            return failed, retried, repeat, cache
+
+        failed, retried, repeat, cache = asyncio.run(run())
+        assert failed[1] == "miss" and failed[0]["llm_error"] == "upstream timeout"
+        assert retried[1] == "miss" and retried[0]["answer"] == "Alice owns Budget."
+        assert repeat == (retried[0], "hit")
+        assert cache.stats["uncacheable"] == 1
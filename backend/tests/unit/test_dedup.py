@@ -0,0 +1,49 @@
+"""Unit tests for content-hash event ids and the ingestion seen-set."""
+
+from utils.dedup import BloomFilter, SeenSet, event_id_for
+
+
+class TestEventIds:
+    """Tests for deterministic event ids."""
+
+    def test_same_update_same_id(self):
+        email = {
+            "type": "email",
+            "content": "Pricing v2 ships Monday",
+            "date": "Mon, Jan 06, 09:00 AM",
+            "metadata": {"sender": "Alice@corp.com", "subject": "Pricing"},
+        }
+        retry = {**email, "metadata": {"sender": "alice@corp.com", "subject": "Pricing"}, "priority": "high"}
+
+        assert event_id_for(email) == event_id_for(retry)
+        assert event_id_for(email).startswith("event:")
+        assert event_id_for({**email, "date": "Tue, Jan 07, 09:00 AM"}) != event_id_for(email)
+        assert event_id_for({"content": "   "}) is None
+
+
+class TestSeenSet:
+    """Tests for the Bloom filter + exact set."""
+
+    def test_bloom_has_no_false_negatives(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        keys = [f"event:{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        assert all(key in bloom for key in keys)
+        false_positives = sum(f"other:{i}" in bloom for i in range(10_000))
+        assert false_positives < 300
+
+    def test_exact_set_confirms_bloom_hits(self):
+        seen = SeenSet(capacity=100)
+        seen.rebuild(["event:a", "event:b"])
+        seen.add("event:c")
+
+        assert "event:a" in seen and "event:c" in seen
+        assert "event:z" not in seen
+        seen.discard("event:c")
+        assert "event:c" not in seen
+        stats = seen.snapshot()
+        assert stats["duplicates"] == 2
+        assert stats["false_positives"] == 1
+        assert stats["size"] == 2
@@ -0,0 +1,39 @@
+"""Unit tests for the push-event broadcaster."""
+
+import asyncio
+
+from utils.event_bus import EventBroadcaster, format_sse
+
+
+class TestEventBroadcaster:
+    """Tests for EventBroadcaster fan-out and slow-consumer dropping."""
+
+    def test_fan_out_to_all_subscribers(self):
+        async def run():
+            bus = EventBroadcaster(queue_size=10)
+            subs = [bus.subscribe() for _ in range(3)]
+            bus.publish("graph", {"version": 1})
+            return [await s.queue.get() for s in subs]
+
+        messages = asyncio.run(run())
+        assert [m["data"] for m in messages] == [{"version": 1}] * 3
+
+    def test_slow_consumer_is_dropped(self):
+        async def run():
+            bus = EventBroadcaster(queue_size=2)
+            fast, slow = bus.subscribe(), bus.subscribe()
+            for i in range(3):
+                bus.publish("stats", {"count": i})
+                if i < 2:
+                    await fast.queue.get()
+            return bus, fast, slow
+
+        bus, fast, slow = asyncio.run(run())
+        assert slow.dropped and slow.queue.get_nowait() is None
+        assert not fast.dropped and fast.queue.get_nowait()["data"] == {"count": 2}
+        assert bus.subscriber_count == 1
+        assert bus.stats["dropped_subscribers"] == 1
+
+    def test_format_sse(self):
+        frame = format_sse({"id": 7, "event": "agent", "data": {"agent": "memory"}})
+        assert frame == 'id: 7\nevent: agent\ndata: {"agent":"memory"}\n\n'
@@ -1,7 +1,13 @@
 """Unit tests for GraphBuilder."""
 
+import asyncio
+from datetime import datetime, timezone
+
 import pytest
 from knowledge_graph.graph_builder import GraphBuilder
+from knowledge_graph.graph_store import GraphStore
+from knowledge_graph.snapshots import SnapshotPublisher, SnapshotWatcher
+from knowledge_graph.temporal_index import parse_timestamp, parse_window
 
 
 class TestGraphBuilder:
@@ -52,7 +58,27 @@ class TestGraphBuilder:
         assert "person" in stats["nodes_by_type"]
         assert "decision" in stats["nodes_by_type"]
         assert "topic" in stats["nodes_by_type"]
-    
+
+    def test_stats_counters_track_mutations(self, populated_graph):
+        """Incremental counters match a full recount after adds, retypes and removes."""
+        def recount(builder):
+            fresh = GraphBuilder()
+            fresh.set_graph(builder.get_graph())
+            return fresh.get_stats()
+
+        populated_graph.add_entity("x", "X", {"type": "team"})
+        populated_graph.add_entity("x", "X", {"type": "dependency"})
+        populated_graph.add_relation("x", "ghost", "blocked_by")
+        populated_graph.add_relation("x", "ghost", "waiting_for")
+        assert populated_graph.get_stats()["edges_by_relation"].get("blocked_by") is None
+        populated_graph.remove_entity("ghost")
+        populated_graph.apply_changes([
+            {"op": "upsert", "kind": "edge", "key": ["y", "x"], "data": {"relation_type": "owns"}},
+            {"op": "upsert", "kind": "node", "key": "y", "data": {"type": "team"}},
+        ])
+        assert populated_graph.get_stats() == recount(populated_graph)
+        assert populated_graph.get_stats()["nodes_by_type"]["dependency"] == 1
+
     def test_save_and_load(self, populated_graph, tmp_path):
         """Test saving and loading graph."""
         save_path = tmp_path / "test_graph.pkl"
@@ -70,3 +96,684 @@ class TestGraphBuilder:
         loaded_stats = loaded.get_stats()
         assert original_stats["nodes_total"] == loaded_stats["nodes_total"]
         assert original_stats["edges_total"] == loaded_stats["edges_total"]
+
+
+class TestChangeJournal:
+    """Tests for the GraphBuilder change journal."""
+
+    def test_changes_since_version(self, graph_builder):
+        graph_builder.add_person("alice@company.com", name="Alice")
+        graph_builder.commit(1)
+        tid = graph_builder.add_topic("Budget")
+        graph_builder.add_discussion_edge("alice@company.com", tid)
+        graph_builder.commit(2)
+
+        changes = graph_builder.get_changes(1)
+        assert [(c["op"], c["kind"]) for c in changes] == [("upsert", "node"), ("upsert", "edge")]
+        assert all(c["version"] == 2 for c in changes)
+        assert graph_builder.get_changes(2) == []
+
+    def test_deletes_are_journaled(self, populated_graph):
+        populated_graph.journal.reset(0)
+        populated_graph.remove_entity("topic_1")
+        populated_graph.commit(1)
+
+        changes = populated_graph.get_changes(0)
+        assert {"op": "delete", "kind": "edge", "key": ("person_1", "topic_1"), "version": 1} in changes
+        assert changes[-1] == {"op": "delete", "kind": "node", "key": "topic_1", "version": 1}
+
+    def test_truncated_journal_requires_snapshot(self, graph_builder):
+        graph_builder.journal.max_ops = 2
+        for i in range(1, 4):
+            graph_builder.add_entity(f"n{i}", f"Node {i}", {"type": "topic"})
+            graph_builder.commit(i)
+
+        assert graph_builder.get_changes(0) is None
+        assert len(graph_builder.get_changes(1)) == 2
+        assert graph_builder.get_changes(99) is None
+
+
+class TestGraphStore:
+    """Tests for WAL + snapshot persistence."""
+
+    def test_wal_replay_restores_commits(self, populated_graph, tmp_path):
+        store = GraphStore(tmp_path / "graph.pkl")
+        store.write_snapshot(populated_graph.get_graph())
+        populated_graph.add_commit_hook(store.append)
+
+        populated_graph.add_topic("Budget")
+        populated_graph.commit(1)
+        populated_graph.remove_entity("person_2")
+        populated_graph.commit(2)
+        store.close()
+
+        restored = GraphBuilder()
+        assert GraphStore(tmp_path / "graph.pkl").load(restored) == 2
+        assert restored.get_stats() == populated_graph.get_stats()
+        assert not restored.get_graph().has_node("person_2")
+
+    def test_compaction_folds_wal_into_snapshot(self, populated_graph, tmp_path):
+        store = GraphStore(tmp_path / "graph.pkl")
+        populated_graph.add_commit_hook(store.append)
+        populated_graph.add_topic("Hiring")
+        populated_graph.commit(1)
+        assert store.wal_size() > 0
+
+        asyncio.run(store.compact(populated_graph))
+        assert not store.compacting_path.exists()
+        assert not store.needs_compaction()
+        assert GraphBuilder.load(store.snapshot_path).get_stats()["nodes_total"] == 5
+
+        populated_graph.add_topic("Roadmap")
+        populated_graph.commit(2)
+        store.close()
+
+        restored = GraphBuilder()
+        assert GraphStore(tmp_path / "graph.pkl").load(restored) == 2
+        assert restored.get_graph().has_node("topic:roadmap")
+
+    def test_torn_tail_is_cut_before_new_appends(self, populated_graph, tmp_path):
+        store = GraphStore(tmp_path / "graph.pkl")
+        populated_graph.add_commit_hook(store.append)
+        populated_graph.add_topic("Budget")
+        populated_graph.commit(1)
+        store.close()
+        with open(store.wal_path, "a", encoding="utf-8") as f:
+            f.write('{"v": 2, "ops": [{"op": "ups')
+
+        restarted = GraphBuilder()
+        store = GraphStore(tmp_path / "graph.pkl")
+        assert store.load(restarted) == 1
+        restarted.add_commit_hook(store.append)
+        restarted.add_topic("Hiring")
+        restarted.commit(3)
+        restarted.add_topic("Roadmap")
+        restarted.commit(4)
+        store.close()
+
+        restored = GraphBuilder()
+        assert GraphStore(tmp_path / "graph.pkl").load(restored) == 4
+        assert all(restored.get_graph().has_node(t) for t in ("topic:budget", "topic:hiring", "topic:roadmap"))
+
+    def test_leftover_compacting_segment_is_folded_first(self, populated_graph, tmp_path):
+        store = GraphStore(tmp_path / "graph.pkl")
+        populated_graph.add_commit_hook(store.append)
+        populated_graph.add_topic("Budget")
+        populated_graph.commit(1)
+        store.close()
+        # Crash after rotating the WAL but before the snapshot was written.
+        store.wal_path.rename(store.compacting_path)
+
+        restarted = GraphBuilder()
+        store = GraphStore(tmp_path / "graph.pkl")
+        assert store.load(restarted) == 1
+        restarted.add_commit_hook(store.append)
+        restarted.add_topic("Hiring")
+        restarted.commit(2)
+        asyncio.run(store.compact(restarted))
+        store.close()
+
+        assert not store.compacting_path.exists()
+        restored = GraphBuilder()
+        assert GraphStore(tmp_path / "graph.pkl").load(restored) == 2
+        assert restored.get_graph().has_node("topic:budget") and restored.get_graph().has_node("topic:hiring")
+
+
+class TestSnapshots:
+    """Tests for writer-published, reader-loaded graph snapshots."""
+
+    def test_reader_swaps_to_newer_version(self, populated_graph, tmp_path):
+        publisher = SnapshotPublisher(tmp_path, keep=2, writer_id="w1")
+        watcher = SnapshotWatcher(tmp_path)
+        assert watcher.load() is None
+
+        publisher.publish(1, populated_graph.get_graph())
+        assert watcher.changed()
+        version, graph = watcher.load()
+        assert (version, watcher.writer_id) == (1, "w1")
+        assert graph.number_of_nodes() == 4
+        assert watcher.load() is None
+
+        populated_graph.add_topic("Hiring")
+        publisher.publish(2, populated_graph.get_graph())
+        publisher.publish(3, populated_graph.get_graph())
+        version, graph = watcher.load()
+        assert version == 3
+        assert graph.has_node("topic:hiring")
+        assert sorted(p.name for p in tmp_path.glob("graph-*.pkl")) == ["graph-2.pkl", "graph-3.pkl"]
+
+    def test_adopt_swaps_in_a_staged_builder(self, populated_graph, graph_builder):
+        populated_graph.add_topic("Hiring")
+        staging = GraphBuilder(graph_builder.engine)
+        staging.journal.reset(7)
+        staging.set_graph(populated_graph.get_graph())
+
+        with graph_builder.snapshot() as old:
+            graph_builder.adopt(staging)
+            assert old.get_graph().number_of_nodes() == 0
+        assert graph_builder.versions.current_version == 7
+        assert sorted(graph_builder.find_nodes(type="topic")) == ["topic:hiring", "topic_1"]
+        assert graph_builder.get_stats()["nodes_total"] == populated_graph.get_stats()["nodes_total"]
+        graph_builder.add_topic("Budget")
+        assert not staging.get_graph().has_node("topic:budget")
+
+
+class TestCompactGraph:
+    """Tests for the array-backed graph engine."""
+
+    def test_matches_networkx_after_mutations(self):
+        import networkx as nx
+        from knowledge_graph.compact_graph import CompactGraph
+
+        reference = nx.DiGraph()
+        compact = CompactGraph(compact_min=2, compact_ratio=0.0)
+        for g in (reference, compact):
+            g.add_node("a", type="person", label="A")
+            g.add_edge("a", "b", relation_type="emailed", weight=1)
+            g.add_edge("b", "c", relation_type="discussed")
+            g.add_edge("c", "a", relation_type="impacts")
+            g.edges["a", "b"]["weight"] = 3
+            g.remove_edge("b", "c")
+            g.add_edge("b", "c", relation_type="owns")
+            g.remove_node("a")
+            g.add_edge("c", "d", relation_type="emailed")
+
+        assert nx.utils.graphs_equal(reference, compact.to_networkx())
+        assert dict(reference.degree()) == dict(compact.degree())
+        assert list(compact.in_edges("c")) == [("b", "c")]
+        assert not compact.has_edge("a", "b")
+
+    def test_builder_engine_roundtrip(self, tmp_path, monkeypatch):
+        from knowledge_graph.compact_graph import CompactGraph
+
+        monkeypatch.setenv("ORG_GRAPH_ENGINE", "networkx")
+        compact = GraphBuilder(engine="compact")
+        compact.add_person("alice@company.com", name="Alice")
+        compact.add_communication_edge("alice@company.com", "bob@company.com")
+        compact.add_communication_edge("alice@company.com", "bob@company.com")
+        tid = compact.add_topic("Budget")
+        compact.add_discussion_edge("bob@company.com", tid)
+        assert isinstance(compact.get_graph(), CompactGraph)
+        assert compact.get_graph().edges["person:alice@company.com", "person:bob@company.com"]["weight"] == 2
+
+        compact.save(tmp_path / "g.pkl")
+        loaded = GraphBuilder.load(tmp_path / "g.pkl")
+        assert loaded.engine == "networkx"
+        assert loaded.get_stats() == compact.get_stats()
+        assert sorted(map(str, loaded.get_edges())) == sorted(map(str, compact.get_edges()))
+
+    def test_networkx_engine_does_not_load_numpy(self):
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        code = (
+            "import sys; from knowledge_graph import GraphBuilder; g = GraphBuilder(engine='networkx'); "
+            "g.add_person('a@corp.com'); g.commit(1); g.find_nodes(type='person'); print('numpy' in sys.modules)"
+        )
+        backend = Path(__file__).resolve().parents[2]
+        out = subprocess.run([sys.executable, "-c", code], cwd=backend, capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "False"
+
+
+class TestAttributeIndex:
+    """Tests for the bitmap indexes GraphBuilder keeps over node attributes."""
+
+    def test_roaring_bitmap_set_ops(self):
+        from knowledge_graph.bitmap_index import RoaringBitmap
+
+        evens = RoaringBitmap(range(0, 200_000, 2))
+        low = RoaringBitmap(range(5, 70_000, 7))
+        assert len(evens) == 100_000
+        assert set(evens & low) == set(range(0, 200_000, 2)) & set(range(5, 70_000, 7))
+        assert set(low - evens) == set(range(5, 70_000, 7)) - set(range(0, 200_000, 2))
+        assert len(evens | low) == len(set(range(0, 200_000, 2)) | set(range(5, 70_000, 7)))
+        for v in range(0, 200_000, 2):
+            evens.discard(v)
+        assert not evens
+
+    def test_find_nodes_tracks_mutations(self, graph_builder):
+        budget = graph_builder.add_topic("Budget")
+        graph_builder.add_decision("Cut spend", date="2024-01-15", props={"topic": budget, "priority": "high"})
+        graph_builder.add_decision("Hire two", date="2024-01-16", props={"topic": "topic:hiring", "priority": "high"})
+        graph_builder.add_decision("Freeze travel", date="2024-02-20", props={"topic": budget})
+        graph_builder.add_relation("decision:cut-spend", "ghost", "impacts")
+
+        assert graph_builder.find_nodes(type="decision", topic=budget, week="2024-W03") == ["decision:cut-spend"]
+        assert graph_builder.find_nodes(priority="high", day=["2024-01-16", "2024-02-20"]) == ["decision:hire-two"]
+        assert graph_builder.find_nodes(type="unknown") == ["ghost"]
+
+        graph_builder.add_entity("decision:cut-spend", "Cut spend", {"type": "decision", "priority": "low"})
+        graph_builder.remove_entity("decision:hire-two")
+        assert graph_builder.find_nodes(priority="high") == []
+        graph_builder.apply_changes([{"op": "upsert", "kind": "node", "key": "decision:freeze-travel", "data": {"type": "risk"}}])
+        assert graph_builder.find_nodes(type="risk") == ["decision:freeze-travel"]
+
+        rebuilt = GraphBuilder()
+        rebuilt.set_graph(graph_builder.get_graph())
+        for field in ("type", "priority", "topic", "week"):
+            assert rebuilt.index.values(field) == graph_builder.index.values(field)
+
+
+class TestTextIndex:
+    """Tests for BM25 retrieval over node labels and content."""
+
+    def test_search_ranks_and_tracks_mutations(self, graph_builder):
+        graph_builder.add_decision("Budget freeze", content="Freeze the Q3 budget until the budget review")
+        graph_builder.add_decision("Hiring plan", content="Open two roles; budget pending")
+        graph_builder.add_entity("event:1", "Standup notes", {"type": "email", "content": "Budgets look fine"})
+        graph_builder.add_person("budget.owner@company.com", name="Pat")
+
+        ranked = [nid for nid, _ in graph_builder.search_nodes("What is the budget?", k=3)]
+        assert ranked[0] == "decision:budget-freeze"
+        assert set(ranked) == {"decision:budget-freeze", "decision:hiring-plan", "event:1"}
+        assert [nid for nid, _ in graph_builder.search_nodes("budget", type="email")] == ["event:1"]
+
+        graph_builder.add_entity("decision:budget-freeze", "Travel freeze", {"type": "decision", "content": "No travel"})
+        graph_builder.remove_entity("event:1")
+        assert [nid for nid, _ in graph_builder.search_nodes("budget")] == ["decision:hiring-plan"]
+        assert graph_builder.search_nodes("nothing matches this") == []
+
+
+class TestEntityResolver:
+    """Tests for person/topic resolution and the bulk merge pass."""
+
+    def test_mentions_resolve_to_one_person(self, graph_builder):
+        pid = graph_builder.add_person("Sarah Chen")
+        assert graph_builder.add_person("sarah.chen@corp.com") == pid
+        assert graph_builder.add_person("Sarah Chen <Sarah.Chen+lists@corp.com>") == pid
+        assert graph_builder.person_id("Chen, Sarah") == pid
+        assert graph_builder.get_graph().nodes[pid]["email"] == "sarah.chen@corp.com"
+        assert graph_builder.get_graph().nodes[pid]["label"] == "Sarah Chen"
+
+        assert graph_builder.add_person("sarah.chen@other.com") != pid
+        assert graph_builder.add_topic("Q3 Budgets") == graph_builder.add_topic("q3 budget")
+        assert graph_builder.add_topic("Topic 1") != graph_builder.add_topic("Topic 2")
+        assert graph_builder.get_stats()["nodes_by_type"] == {"person": 2, "topic": 3}
+
+    def test_merge_duplicates_rewires_edges(self, graph_builder):
+        # Nodes written directly, as an older graph built without resolution would have them.
+        graph_builder.add_entity("person:sarah chen", "Sarah Chen", {"type": "person", "email": "Sarah Chen"})
+        graph_builder.add_entity("person:sarah.chen@corp.com", "sarah.chen@corp.com", {"type": "person", "email": "sarah.chen@corp.com"})
+        graph_builder.add_entity("person:bob@corp.com", "Bob", {"type": "person", "email": "bob@corp.com"})
+        graph_builder.add_entity("topic:roadmaps", "Roadmaps", {"type": "topic"})
+        graph_builder.add_entity("topic:roadmap", "Roadmap", {"type": "topic"})
+        graph_builder.add_relation("person:sarah chen", "person:bob@corp.com", "emailed", {"weight": 2})
+        graph_builder.add_relation("person:sarah.chen@corp.com", "person:bob@corp.com", "emailed", {"weight": 3})
+        graph_builder.add_relation("person:sarah chen", "topic:roadmaps", "discussed")
+
+        assert graph_builder.merge_duplicates() == {"groups": 2, "merged": 2}
+        g = graph_builder.get_graph()
+        assert sorted(g.nodes) == ["person:bob@corp.com", "person:sarah.chen@corp.com", "topic:roadmaps"]
+        assert g.edges["person:sarah.chen@corp.com", "person:bob@corp.com"]["weight"] == 5
+        assert g.has_edge("person:sarah.chen@corp.com", "topic:roadmaps")
+        assert g.nodes["person:sarah.chen@corp.com"]["label"] == "Sarah Chen"
+        assert graph_builder.merge_duplicates() == {"groups": 0, "merged": 0}
+
+    def test_merge_after_publish_leaves_snapshot_alone(self, graph_builder):
+        graph_builder.add_entity("person:sarah chen", "Sarah Chen", {"type": "person", "email": "Sarah Chen"})
+        graph_builder.add_entity("person:sarah.chen@corp.com", "sarah.chen@corp.com", {"type": "person", "email": "sarah.chen@corp.com"})
+        graph_builder.add_entity("person:bob@corp.com", "Bob", {"type": "person", "email": "bob@corp.com"})
+        graph_builder.add_relation("person:bob@corp.com", "person:sarah chen", "emailed", {"weight": 2})
+        graph_builder.add_relation("person:bob@corp.com", "person:sarah.chen@corp.com", "emailed", {"weight": 3})
+        graph_builder.commit(1)
+
+        with graph_builder.snapshot() as snap:
+            assert graph_builder.merge_duplicates() == {"groups": 1, "merged": 1}
+            old = snap.get_graph()
+            assert old.edges["person:bob@corp.com", "person:sarah.chen@corp.com"]["weight"] == 3
+            assert old.has_node("person:sarah chen")
+        g = graph_builder.get_graph()
+        assert g.edges["person:bob@corp.com", "person:sarah.chen@corp.com"]["weight"] == 5
+        assert not g.has_node("person:sarah chen")
+        graph_builder.commit(2)
+        assert graph_builder.get_changes(1)[-1]["data"]["label"] == "Sarah Chen"
+
+
+class TestTemporalIndex:
+    """Tests for canonical timestamps and time-window queries."""
+
+    def test_parse_timestamp_formats(self):
+        utc = parse_timestamp("2024-01-15T09:30:00Z")
+        assert utc == datetime(2024, 1, 15, 9, 30, tzinfo=timezone.utc).timestamp()
+        assert parse_timestamp("Mon, 15 Jan 2024 09:30:00 +0000") == utc
+        assert parse_timestamp("2024-01-15 09:30") == datetime(2024, 1, 15, 9, 30).timestamp()
+        now = datetime(2024, 3, 1)
+        assert parse_timestamp("Sat, Feb 7, 10:00 AM", now=now) == datetime(2024, 2, 7, 10).timestamp()
+        assert parse_timestamp("Dec 24", now=now) == datetime(2023, 12, 24).timestamp()
+        assert parse_timestamp("soon") is None and parse_timestamp("") is None
+
+    def test_range_queries_follow_updates(self, graph_builder):
+        graph_builder.add_decision("Old", date="2024-01-01T00:00:00Z")
+        graph_builder.add_decision("New", date="2024-01-10T00:00:00Z")
+        graph_builder.add_entity("event:1", "Sync", {"type": "event", "date": "2024-01-05T00:00:00Z"})
+        graph_builder.add_decision("Undated")
+        day = parse_timestamp("2024-01-02T00:00:00Z")
+
+        assert graph_builder.get_graph().nodes["decision:new"]["ts"] == parse_timestamp("2024-01-10T00:00:00Z")
+        assert graph_builder.nodes_between(day) == ["event:1", "decision:new"]
+        assert graph_builder.nodes_between(day, type="decision") == ["decision:new"]
+        assert graph_builder.timeline.latest(2) == ["decision:new", "event:1"]
+
+        graph_builder.add_decision("Old", date="2024-01-20T00:00:00Z")
+        graph_builder.remove_entity("event:1")
+        assert graph_builder.nodes_between(day) == ["decision:new", "decision:old"]
+        assert len(graph_builder.timeline) == 2
+
+    def test_parse_window(self):
+        now = datetime(2024, 1, 17, 15, 0)  # a Wednesday
+        assert parse_window("What decisions were made this week?", now) == (
+            datetime(2024, 1, 15).timestamp(),
+            now.timestamp(),
+        )
+        assert parse_window("what changed in the last 24h", now) == (now.timestamp() - 86400, now.timestamp())
+        assert parse_window("past 3 days", now)[0] == now.timestamp() - 3 * 86400
+        assert parse_window("who owns the budget?", now) is None
+
+
+class TestGraphVersions:
+    """Tests for pinned copy-on-write graph versions."""
+
+    def test_pinned_version_is_isolated_from_writes(self, populated_graph):
+        populated_graph.commit(1)
+        snap = populated_graph.snapshot()
+        nodes_before = snap.get_graph().number_of_nodes()
+
+        populated_graph.add_topic("Hiring")
+        populated_graph.add_entity("person_1", "Alice", {"type": "person", "team": "core"})
+        populated_graph.remove_entity("person_2")
+        assert snap.get_graph().number_of_nodes() == nodes_before
+        assert "team" not in snap.get_graph().nodes["person_1"]
+        assert populated_graph.snapshot().version == 1  # uncommitted writes stay invisible
+        populated_graph.versions.unpin(snap)
+
+        populated_graph.commit(2)
+        with populated_graph.snapshot() as latest:
+            assert latest.version == 2
+            assert latest.get_graph().has_node("topic:hiring")
+        assert populated_graph.versions.live_versions() == [1, 2]
+        snap.release()
+        assert populated_graph.versions.live_versions() == [2]
+
+    def test_copy_only_on_first_write_after_publish(self, graph_builder):
+        graph_builder.add_topic("Budget")
+        graph_builder.commit(1)
+        published = graph_builder.get_graph()
+        graph_builder.add_topic("Hiring")
+        copied = graph_builder.get_graph()
+        graph_builder.add_topic("Roadmap")
+        assert copied is not published and graph_builder.get_graph() is copied
+        assert published.number_of_nodes() == 1
+
+    def test_fork_copies_only_touched_dicts(self):
+        g = GraphBuilder(engine="networkx")
+        for n in ("a", "b", "c", "d"):
+            g.add_entity(n, n.upper(), {"type": "person"})
+        g.add_relation("a", "b", "emailed", {"weight": 1})
+        g.add_relation("b", "c", "emailed", {"weight": 1})
+        g.commit(1)
+
+        with g.snapshot() as snap:
+            old = snap.get_graph()
+            g.add_relation("a", "b", "emailed", {"weight": 5})
+            g.add_entity("a", "Alice", {"type": "person"})
+            g.apply_changes([{"op": "upsert", "kind": "edge", "key": ("b", "c"), "data": {"relation_type": "cc"}}])
+            g.remove_entity("c")
+            live = g.get_graph()
+
+            assert old.edges["a", "b"]["weight"] == 1 and old.nodes["a"]["label"] == "A"
+            assert old.edges["b", "c"]["relation_type"] == "emailed" and old.has_node("c")
+            assert live.edges["a", "b"]["weight"] == 5 and not live.has_node("c")
+            # Both adjacency sides still see one attribute dict.
+            assert live.pred["b"]["a"] is live.succ["a"]["b"]
+            assert live.nodes["d"] is old.nodes["d"] and live._succ["d"] is old._succ["d"]
+
+    def test_compact_fork_copies_only_touched_columns(self):
+        g = GraphBuilder(engine="compact")
+        for n in ("a", "b", "c", "d"):
+            g.add_entity(n, n.upper(), {"type": "person", "email": f"{n}@corp.com"})
+        g.add_relation("a", "b", "emailed", {"weight": 1})
+        g.add_relation("b", "c", "emailed", {"weight": 1})
+        g.commit(1)
+
+        with g.snapshot() as snap:
+            old = snap.get_graph()
+            g.add_relation("a", "b", "emailed", {"weight": 5})
+            g.add_relation("c", "d", "cc")
+            g.remove_relation("b", "c")
+            g.add_entity("e", "E", {"type": "person"})
+            live = g.get_graph()
+
+            assert old.edges["a", "b"]["weight"] == 1 and old.has_edge("b", "c")
+            assert not old.has_edge("c", "d") and not old.has_node("e")
+            assert live.has_edge("c", "d") and not live.has_edge("b", "c") and live.nodes["e"]["label"] == "E"
+            # Only written columns were copied; the rest are still the published ones.
+            assert live._node_attrs.columns["email"] is old._node_attrs.columns["email"]
+            assert live._edge_attrs.columns["weight"] is not old._edge_attrs.columns["weight"]
+            assert live._buf_out[1] == [] and old._buf_out[1] == [1]
+            assert live._buf_out[0] is old._buf_out[0]
+
+
+class TestColumnarFormat:
+    """Tests for the columnar snapshot format."""
+
+    def test_roundtrip_and_projection(self, populated_graph, tmp_path):
+        from knowledge_graph.columnar import is_columnar, read_header
+
+        populated_graph.add_entity("x", "X", {"type": "team", "tags": ["a", "b"], "active": True, "score": 0.5, "note": None})
+        populated_graph.add_relation("x", "person_1", "owns", {"weight": 3})
+        path = tmp_path / "graph.pkl"
+        populated_graph.save(path)
+
+        assert is_columnar(path)
+        kinds = {c["name"]: c["kind"] for c in read_header(path)["nodes"]["columns"]}
+        assert kinds["tags"] == "json" and kinds["active"] == "bool" and kinds["score"] == "float"
+        loaded = GraphBuilder.load(path).get_graph()
+        original = populated_graph.get_graph()
+        assert dict(loaded.nodes(data=True)) == dict(original.nodes(data=True))
+        assert list(loaded.edges(data=True)) == list(original.edges(data=True))
+        assert sorted(loaded.predecessors("person_1")) == sorted(original.predecessors("person_1"))
+
+        slim = GraphBuilder.load(path, exclude=("content", "tags")).get_graph()
+        assert all("content" not in attrs and "tags" not in attrs for _, attrs in slim.nodes(data=True))
+        assert slim.number_of_edges() == original.number_of_edges()
+
+    def test_non_json_values_keep_their_type(self, graph_builder, tmp_path):
+        stamp = datetime(2024, 1, 5, 9, 30, tzinfo=timezone.utc)
+        graph_builder.add_entity("x", "X", {"span": (1, 2), "tags": {"a"}, "seen": stamp, "meta": {"at": [stamp.date()]}})
+        graph_builder.save(tmp_path / "graph.pkl")
+        attrs = GraphBuilder.load(tmp_path / "graph.pkl").get_graph().nodes["x"]
+        assert attrs["span"] == (1, 2) and attrs["tags"] == {"a"} and attrs["seen"] == stamp
+        assert attrs["meta"] == {"at": [stamp.date()]}
+
+        graph_builder.add_entity("y", "Y", {"blob": object()})
+        with pytest.raises(TypeError):
+            graph_builder.save(tmp_path / "bad.pkl")
+
+    def test_loaded_graph_matches_public_api(self, populated_graph, tmp_path):
+        import networkx as nx
+
+        from knowledge_graph.columnar import read_columnar
+
+        populated_graph.save(tmp_path / "graph.pkl")
+        loaded = read_columnar(tmp_path / "graph.pkl")
+        rebuilt = nx.DiGraph()
+        rebuilt.add_nodes_from(populated_graph.get_graph().nodes(data=True))
+        rebuilt.add_edges_from(populated_graph.get_graph().edges(data=True))
+
+        assert nx.utils.graphs_equal(loaded, rebuilt)
+        assert loaded._adj is loaded._succ
+        assert loaded.pred["topic_1"]["person_1"] is loaded.succ["person_1"]["topic_1"]
+        loaded.remove_node("person_1")
+        assert "person_1" not in loaded.pred["topic_1"]
+
+    def test_legacy_pickle_still_loads(self, populated_graph, tmp_path):
+        path = tmp_path / "legacy.pkl"
+        populated_graph.save(path, fmt="pickle")
+        assert GraphBuilder.load(path).get_stats() == populated_graph.get_stats()
+        GraphBuilder().save(tmp_path / "empty.pkl")
+        assert GraphBuilder.load(tmp_path / "empty.pkl").get_stats()["nodes_total"] == 0
+
+
+class TestRetention:
+    """Tests for rolling expired event nodes into summary nodes."""
+
+    def _event(self, builder, i, date, node_type="email", topic=""):
+        props = {"type": node_type, "date": date, "content": f"body {i}"}
+        if topic:
+            props["topic"] = topic
+        builder.add_entity(f"event:{i}", f"Subject {i}", props)
+        return f"event:{i}"
+
+    def test_rolls_expired_events_into_daily_rollups(self, graph_builder, tmp_path):
+        from knowledge_graph.retention import RetentionEngine, parse_policies
+
+        now = datetime(2024, 3, 1, 12).timestamp()
+        old = [self._event(graph_builder, i, f"2024-01-15 0{i}:00") for i in range(3)]
+        recent = self._event(graph_builder, 9, "2024-02-28 10:00")
+        graph_builder.add_person("alice@corp.com", name="Alice")
+        graph_builder.add_relation("person:alice@corp.com", old[0], "sent", {"weight": 1})
+        graph_builder.add_relation("person:alice@corp.com", old[1], "sent", {"weight": 2})
+
+        engine = RetentionEngine(graph_builder, parse_policies("*=30"), archive_path=tmp_path / "archive.jsonl", batch_size=2)
+        assert engine.run_once(now) == {"rolled_up": 2, "rollups": 1, "remaining": True}
+        assert engine.run_once(now)["remaining"] is False
+
+        g = graph_builder.get_graph()
+        rollup = g.nodes["rollup:email:day:2024-01-15"]
+        assert rollup["count"] == 3 and rollup["type"] == "rollup" and "content" not in rollup
+        assert rollup["label"] == "3 email updates on 2024-01-15"
+        assert g.edges["person:alice@corp.com", "rollup:email:day:2024-01-15"]["weight"] == 3
+        assert not any(g.has_node(e) for e in old) and g.has_node(recent)
+        assert len((tmp_path / "archive.jsonl").read_text().splitlines()) == 3
+        assert engine.run_once(now)["rolled_up"] == 0
+
+    def test_policies_per_type(self, graph_builder):
+        from knowledge_graph.retention import RetentionEngine, RetentionPolicy, parse_policies
+
+        assert parse_policies("off") == {}
+        policies = parse_policies("email=7:topic,slack=1")
+        assert policies == {"email": RetentionPolicy(7, "topic"), "slack": RetentionPolicy(1)}
+        tid = graph_builder.add_topic("Budget")
+        self._event(graph_builder, 1, "2024-02-20 10:00", topic=tid)
+        self._event(graph_builder, 2, "2024-02-20 10:00", node_type="announcement")
+
+        engine = RetentionEngine(graph_builder, policies)
+        assert engine.due(datetime(2024, 3, 1).timestamp()) == ["event:1"]
+        engine.run_once(datetime(2024, 3, 1).timestamp())
+        assert graph_builder.get_graph().nodes["rollup:email:topic:topic:budget"]["label"] == "1 email updates about Budget"
+
+    def test_due_reads_only_committed_events(self, graph_builder, monkeypatch):
+        from knowledge_graph.retention import RetentionEngine, parse_policies
+
+        now = datetime(2024, 3, 1).timestamp()
+        for i in range(3):
+            graph_builder.add_decision(f"Decision {i}", date="2023-06-01")
+        self._event(graph_builder, 1, "2024-01-01 10:00")
+        engine = RetentionEngine(graph_builder, parse_policies("*=30,slack=1"))
+        # The engine never scans the builder's full time index.
+        monkeypatch.setattr(graph_builder, "nodes_between", None)
+
+        self._event(graph_builder, 2, "2023-12-01 10:00")
+        self._event(graph_builder, 3, "2024-02-27 10:00", node_type="slack")
+        assert engine.due(now) == ["event:1"]
+        graph_builder.commit(1)
+        assert engine.due(now) == ["event:2", "event:1", "event:3"]
+        assert engine.due(now, limit=2) == ["event:2", "event:1"]
+
+        graph_builder.remove_entity("event:2")
+        graph_builder.add_entity("event:3", "Subject 3", {"type": "email"})
+        graph_builder.commit(2)
+        assert engine.due(now) == ["event:1"]
+
+    def test_archived_ids_keep_replays_deduplicated(self, graph_builder, tmp_path):
+        from agents.coordinator import Coordinator
+        from knowledge_graph.retention import RetentionEngine, archived_event_ids, parse_policies
+
+        email = {"type": "email", "content": "Offsite booked", "date": "2024-01-10 09:00", "metadata": {"sender": "a@corp.com"}}
+        coordinator = Coordinator(graph=graph_builder, config={"llm_enabled": False})
+        event_id = asyncio.run(coordinator.process_new_information(dict(email)))["event_id"]
+        engine = RetentionEngine(graph_builder, parse_policies("*=30"), archive_path=tmp_path / "archive.jsonl")
+        assert engine.run_once(datetime(2024, 3, 1).timestamp())["rolled_up"] == 1
+        assert not graph_builder.get_graph().has_node(event_id)
+        with open(tmp_path / "archive.jsonl", "a", encoding="utf-8") as f:
+            f.write('{"id": "event:torn')
+
+        restarted = Coordinator(graph=graph_builder, config={"llm_enabled": False})
+        restarted.remember_events(archived_event_ids(tmp_path / "archive.jsonl"))
+        assert asyncio.run(restarted.process_new_information(dict(email)))["deduplicated"] is True
+        assert archived_event_ids(tmp_path / "missing.jsonl") == []
+
+
+class TestBulkLoad:
+    """Tests for GraphBuilder.bulk_add_nodes / bulk_add_edges."""
+
+    def test_bulk_nodes_match_add_entity(self, graph_builder):
+        pd = pytest.importorskip("pandas")
+        people = pd.DataFrame(
+            {
+                "id": ["person:a@corp.com", "person:b@corp.com"],
+                "label": ["Alice", None],
+                "type": "person",
+                "email": ["a@corp.com", "b@corp.com"],
+                "date": ["2024-01-02", None],
+            }
+        )
+
+        assert graph_builder.bulk_add_nodes(people) == 2
+
+        g = graph_builder.get_graph()
+        assert g.nodes["person:a@corp.com"]["label"] == "Alice"
+        assert g.nodes["person:b@corp.com"]["label"] == "person:b@corp.com"
+        assert "date" not in g.nodes["person:b@corp.com"]
+        assert "ts" in g.nodes["person:a@corp.com"]
+        assert graph_builder.get_stats()["nodes_by_type"] == {"person": 2}
+        assert graph_builder.resolve_person("b@corp.com") == "person:b@corp.com"
+        assert graph_builder.nodes_between(None, None) == ["person:a@corp.com"]
+
+    def test_bulk_edges_merge_into_existing(self, graph_builder):
+        pd = pytest.importorskip("pandas")
+        graph_builder.add_communication_edge("a@corp.com", "b@corp.com", weight=2, props={"email_ids": ["m0"]})
+        edges = pd.DataFrame(
+            {
+                "source": ["person:a@corp.com", "person:a@corp.com"],
+                "target": ["person:b@corp.com", "person:c@corp.com"],
+                "weight": [3, 1],
+                "email_ids": [["m1", "m2", "m3"], ["m4"]],
+            }
+        )
+
+        assert graph_builder.bulk_add_edges(edges, relation_type="emailed") == 2
+
+        g = graph_builder.get_graph()
+        assert g.edges["person:a@corp.com", "person:b@corp.com"]["weight"] == 5
+        assert g.edges["person:a@corp.com", "person:b@corp.com"]["email_ids"] == ["m0", "m1", "m2", "m3"]
+        assert g.edges["person:a@corp.com", "person:c@corp.com"]["relation_type"] == "emailed"
+        stats = graph_builder.get_stats()
+        assert stats["edges_by_relation"] == {"emailed": 2}
+        assert stats["nodes_by_type"] == {"person": 2, "unknown": 1}
+        ops = graph_builder.commit(1)
+        assert {tuple(op["key"]) for op in ops if op["kind"] == "edge"} == {
+            ("person:a@corp.com", "person:b@corp.com"),
+            ("person:a@corp.com", "person:c@corp.com"),
+        }
+
+    def test_build_script_pairs_names_with_addresses(self, graph_builder):
+        pd = pytest.importorskip("pandas")
+        from scripts.build_graph import communication_frames
+
+        emails = pd.DataFrame(
+            {
+                "id": ["m1", "m2", "m3"],
+                "sender": ["s@x.com", "Sarah Chen <s@x.com>", "Bob <b@x.com>"],
+                "to": ["Bob <b@x.com>", "b@x.com", "Sarah Chen"],
+                "cc": [None, None, None],
+            }
+        )
+
+        people, edges = communication_frames(graph_builder, emails)
+
+        assert sorted(people["id"]) == ["person:b@x.com", "person:s@x.com"]
+        assert dict(zip(people["id"], people["label"])) == {"person:s@x.com": "Sarah Chen", "person:b@x.com": "Bob"}
+        weights = {(s, t): w for s, t, w in zip(edges["source"], edges["target"], edges["weight"])}
+        assert weights == {("person:s@x.com", "person:b@x.com"): 2, ("person:b@x.com", "person:s@x.com"): 1}
@@ -0,0 +1,66 @@
+"""Unit tests for the async job queue."""
+
+import asyncio
+
+import pytest
+
+from utils.job_queue import JobQueue, JobQueueFull, JobStore
+
+
+class TestJobQueue:
+    """Tests for JobQueue priority lanes, backpressure and recovery."""
+
+    def test_high_priority_runs_first(self, tmp_path):
+        order = []
+
+        async def handler(payload):
+            order.append(payload["n"])
+            return {"ok": payload["n"]}
+
+        async def run():
+            queue = JobQueue(handler, JobStore(tmp_path / "jobs.db"), workers=1)
+            low = queue.submit({"n": "low"}, priority="low")
+            high = queue.submit({"n": "high"}, priority="high")
+            await queue.start()
+            await asyncio.sleep(0.05)
+            await queue.stop()
+            return queue.get(low["id"]), queue.get(high["id"])
+
+        low, high = asyncio.run(run())
+        assert order == ["high", "low"]
+        assert high["status"] == "done" and high["result"] == {"ok": "high"}
+        assert low["status"] == "done"
+
+    def test_backlog_limit_rejects(self, tmp_path):
+        async def handler(payload):
+            return {}
+
+        async def run():
+            queue = JobQueue(handler, JobStore(tmp_path / "jobs.db"), max_backlog=2)
+            queue.submit({})
+            queue.submit({})
+            with pytest.raises(JobQueueFull):
+                queue.submit({})
+            return queue.stats["rejected"]
+
+        assert asyncio.run(run()) == 1
+
+    def test_unfinished_jobs_survive_restart(self, tmp_path):
+        async def handler(payload):
+            return {"seen": payload["n"]}
+
+        async def submit_only():
+            queue = JobQueue(handler, JobStore(tmp_path / "jobs.db"))
+            return queue.submit({"n": 1})["id"]
+
+        async def restart(job_id):
+            queue = JobQueue(handler, JobStore(tmp_path / "jobs.db"))
+            await queue.start()
+            await asyncio.sleep(0.05)
+            await queue.stop()
+            return queue.stats["recovered"], queue.get(job_id)
+
+        job_id = asyncio.run(submit_only())
+        recovered, job = asyncio.run(restart(job_id))
+        assert recovered == 1
+        assert job["status"] == "done" and job["result"] == {"seen": 1}
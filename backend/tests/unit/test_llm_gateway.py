@@ -0,0 +1,88 @@
+"""Unit tests for the shared async LLM gateway."""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from agents.memory_agent import MemoryAgent
+from knowledge_graph.graph_builder import GraphBuilder
+from utils.llm_gateway import LLMGateway, set_llm_gateway
+
+
+def _stub_transport(delay: float = 0.0, content: str = "{}") -> httpx.MockTransport:
+    """A local OpenAI-compatible chat completions stub."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(delay)
+        body = json.loads(request.content)
+        return httpx.Response(
+            200,
+            json={
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [
+                    {"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}
+                ],
+            },
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def _gateway(**kwargs) -> LLMGateway:
+    transport = kwargs.pop("transport")
+    return LLMGateway(
+        api_key="test-key",
+        base_url="http://stub.local/v1",
+        http_client=httpx.AsyncClient(transport=transport),
+        **kwargs,
+    )
+
+
+class TestLLMGateway:
+    """Tests for LLMGateway."""
+
+    def test_chat_json(self):
+        gateway = _gateway(transport=_stub_transport(content='{"conflict": false}'))
+        result = asyncio.run(gateway.chat_json(system="s", user="u"))
+        assert result == {"conflict": False}
+
+    def test_concurrent_calls_do_not_serialize(self):
+        gateway = _gateway(transport=_stub_transport(delay=0.2, content="ok"), max_concurrency=8)
+
+        async def run():
+            return await asyncio.gather(*(gateway.chat_text(system="s", user=str(i)) for i in range(8)))
+
+        start = time.perf_counter()
+        answers = asyncio.run(run())
+        assert answers == ["ok"] * 8
+        assert time.perf_counter() - start < 1.0
+        assert gateway.stats["max_in_flight"] == 8
+
+    def test_concurrency_is_bounded(self):
+        gateway = _gateway(transport=_stub_transport(delay=0.05, content="ok"), max_concurrency=2)
+
+        async def run():
+            await asyncio.gather(*(gateway.chat_text(system="s", user=str(i)) for i in range(6)))
+
+        asyncio.run(run())
+        assert gateway.stats["calls"] == 6
+        assert gateway.stats["max_in_flight"] == 2
+
+    def test_agents_share_gateway(self):
+        gateway = _gateway(transport=_stub_transport(content="Alice owns the API migration."))
+        set_llm_gateway(gateway)
+        try:
+            graph = GraphBuilder()
+            graph.add_person("alice@company.com", name="Alice")
+            agent = MemoryAgent(graph=graph)
+            result = asyncio.run(agent.query_knowledge("Who is Alice?"))
+        finally:
+            set_llm_gateway(None)
+        assert result["answer"] == "Alice owns the API migration."
+        assert gateway.stats["calls"] == 1
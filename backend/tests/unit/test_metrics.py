@@ -0,0 +1,48 @@
+"""Unit tests for the metrics registry."""
+
+from utils.metrics import Histogram, MetricsRegistry
+
+
+class TestHistogram:
+    """Tests for log-bucketed quantiles."""
+
+    def test_quantiles_track_the_tail(self):
+        hist = Histogram()
+        for _ in range(980):
+            hist.observe(0.010)
+        for _ in range(20):
+            hist.observe(2.0)
+        assert hist.count == 1000
+        assert 0.009 <= hist.quantile(0.50) <= 0.012
+        assert 0.009 <= hist.quantile(0.95) <= 0.012
+        assert 1.7 <= hist.quantile(0.99) <= 2.0
+
+    def test_empty_histogram(self):
+        assert Histogram().summary()["p99"] == 0.0
+
+
+class TestMetricsRegistry:
+    """Tests for series bookkeeping and Prometheus rendering."""
+
+    def test_render_prometheus(self):
+        registry = MetricsRegistry()
+        registry.describe("req_seconds", "Request latency.")
+        registry.observe("req_seconds", 0.05, route="/graph")
+        registry.inc("req_total", route="/graph", status=200)
+        registry.gauge_add("in_flight", 1, route="/graph")
+        registry.gauge_fn("nodes", lambda: [({"type": "person"}, 3)])
+
+        text = registry.render_prometheus()
+        assert "# HELP req_seconds Request latency." in text
+        assert "# TYPE req_seconds summary" in text
+        assert 'req_seconds{route="/graph",quantile="0.99"}' in text
+        assert 'req_seconds_count{route="/graph"} 1' in text
+        assert 'req_total{route="/graph",status="200"} 1' in text
+        assert 'in_flight{route="/graph"} 1' in text
+        assert 'nodes{type="person"} 3' in text
+
+    def test_summaries_keyed_by_labels(self):
+        registry = MetricsRegistry()
+        registry.observe("agent_seconds", 0.2, agent="critic")
+        summaries = registry.summaries("agent_seconds")
+        assert summaries["agent=critic"]["count"] == 1
@@ -38,3 +38,27 @@ class TestEntityExtractor:
         assert "entities" in result
         assert "relations" in result
         assert len(result["entities"]) > 0
+
+
+class TestGraphFrames:
+    """Tests for pre-aggregating email rows for the bulk graph loaders."""
+
+    def test_aggregate_edges(self):
+        pd = pytest.importorskip("pandas")
+        from data_pipeline.graph_frames import aggregate_edges
+
+        pairs = pd.DataFrame(
+            {
+                "email_id": ["m1", "m2", "m3", "m4"],
+                "source": ["a", "b", "a", "a"],
+                "target": ["b", "a", "b", "c"],
+            }
+        )
+
+        edges = aggregate_edges(pairs)
+
+        assert edges.to_dict("records") == [
+            {"source": "a", "target": "b", "weight": 2, "email_ids": ["m1", "m3"]},
+            {"source": "b", "target": "a", "weight": 1, "email_ids": ["m2"]},
+            {"source": "a", "target": "c", "weight": 1, "email_ids": ["m4"]},
+        ]
@@ -0,0 +1,63 @@
+"""Unit tests for single-flight request coalescing."""
+
+import asyncio
+
+import pytest
+
+from utils.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for sharing one in-flight call among concurrent callers."""
+
+    def test_concurrent_callers_share_one_call(self):
+        async def run():
+            flight = SingleFlight("test")
+            calls = {"n": 0}
+
+            async def work():
+                calls["n"] += 1
+                await asyncio.sleep(0.01)
+                return {"brief": calls["n"]}
+
+            results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+            again = await flight.do("k", work)
+            return flight, calls["n"], results, again
+
+        flight, n, results, again = asyncio.run(run())
+        assert n == 2
+        assert results == [{"brief": 1}] * 5
+        assert again == {"brief": 2}
+        assert flight.snapshot()["coalesced"] == 4
+        assert flight.inflight == 0
+
+    def test_errors_propagate_to_all_callers(self):
+        async def run():
+            flight = SingleFlight("test")
+
+            async def boom():
+                await asyncio.sleep(0)
+                raise ValueError("llm down")
+
+            return await asyncio.gather(flight.do("k", boom), flight.do("k", boom), return_exceptions=True)
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, ValueError) for r in results)
+
+    def test_cancelled_caller_does_not_cancel_shared_work(self):
+        async def run():
+            flight = SingleFlight("test")
+
+            async def work():
+                await asyncio.sleep(0.02)
+                return "done"
+
+            first = asyncio.create_task(flight.do("k", work))
+            second = asyncio.create_task(flight.do("k", work))
+            await asyncio.sleep(0)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        assert asyncio.run(run()) == "done"
@@ -0,0 +1,87 @@
+"""Unit tests for the TTS proxy client and audio cache."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from utils import tts as tts_module
+from utils.tts import AudioCache, TTSClient, TTSProviderError, close_tts_client, set_tts_client
+
+
+def _stub_tts(calls: list[str], status: int = 200) -> httpx.MockTransport:
+    """A local stand-in for the ElevenLabs streaming endpoint."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if status != 200:
+            return httpx.Response(status, text="quota exceeded")
+        return httpx.Response(200, content=b"ID3" + b"\x00" * 4096, headers={"Content-Type": "audio/mpeg"})
+
+    return httpx.MockTransport(handler)
+
+
+def _client(tmp_path, calls, status=200, max_bytes=1 << 20) -> TTSClient:
+    return TTSClient(
+        api_key="test-key",
+        base_url="http://tts.local",
+        cache=AudioCache(tmp_path, max_bytes=max_bytes),
+        http_client=httpx.AsyncClient(transport=_stub_tts(calls, status)),
+    )
+
+
+async def _synthesize(tts: TTSClient, voice_id: str, text: str) -> bytes:
+    return b"".join([c async for c in await tts.open_stream(voice_id, text)])
+
+
+class TestTTSClient:
+    """Tests for streaming synthesis with cache fill."""
+
+    def test_miss_streams_and_fills_cache(self, tmp_path):
+        calls: list[str] = []
+        tts = _client(tmp_path, calls)
+
+        audio = asyncio.run(_synthesize(tts, "voice-1", "Daily brief"))
+        assert calls == ["/v1/text-to-speech/voice-1/stream"]
+        cached = tts.cache.get(tts.key("voice-1", "Daily brief"))
+        assert cached is not None and cached.read_bytes() == audio
+        assert tts.cache.get(tts.key("voice-2", "Daily brief")) is None
+        assert list(tmp_path.glob("*.part")) == []
+
+    def test_provider_error_raised_before_streaming(self, tmp_path):
+        tts = _client(tmp_path, [], status=429)
+        with pytest.raises(TTSProviderError) as exc:
+            asyncio.run(tts.open_stream("voice-1", "Daily brief"))
+        assert exc.value.status_code == 429
+        assert list(tmp_path.iterdir()) == []
+
+    def test_close_never_creates_a_client(self, tmp_path):
+        set_tts_client(None)
+        asyncio.run(close_tts_client())
+        assert tts_module._tts_client is None
+
+        set_tts_client(_client(tmp_path, []))
+        asyncio.run(close_tts_client())
+        assert tts_module._tts_client is None
+
+
+class TestAudioCache:
+    """Tests for LRU eviction under the size cap."""
+
+    def _put(self, cache, key, size):
+        tmp, f = cache.open_temp()
+        f.write(b"x" * size)
+        f.close()
+        cache.commit(key, tmp)
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = AudioCache(tmp_path, max_bytes=250)
+        self._put(cache, "a", 100)
+        self._put(cache, "b", 100)
+        assert cache.get("a") is not None
+        self._put(cache, "c", 100)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+        assert cache.stats["bytes"] == 200
+        assert AudioCache(tmp_path, max_bytes=250).stats["bytes"] == 200
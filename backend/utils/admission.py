@@ -0,0 +1,146 @@
+"""Admission control: per-route concurrency limits with bounded wait queues.
+
+Expensive (LLM-bound or mutating) routes each get a concurrency limit and a small
+wait queue; when the queue is full they fail fast instead of piling up work. A
+global in-flight budget keeps a reserved share that only cheap read routes may
+use, so ``/graph`` and ``/health`` stay responsive under a write burst.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from .metrics import get_metrics
+
+
+# Route template -> (max concurrent, max waiting).
+DEFAULT_LIMITS: dict[str, tuple[int, int]] = {
+    "/process": (8, 64),
+    "/process/batch": (2, 8),
+    "/query": (8, 64),
+    "/agent/process": (4, 32),
+    "/demo/run/{scenario_id}": (4, 16),
+}
+
+
+class AdmissionRejected(Exception):
+    """The request was shed; respond 429 with ``Retry-After``."""
+
+    def __init__(self, route: str, reason: str, retry_after: int):
+        super().__init__(f"Server busy ({reason} on {route}); retry after {retry_after}s.")
+        self.route = route
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class RouteLimiter:
+    """At most ``max_concurrent`` running and ``max_queue`` waiting requests."""
+
+    def __init__(self, max_concurrent: int, max_queue: int):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.active = 0
+        self.waiting = 0
+        self.slots = asyncio.Semaphore(max_concurrent)
+
+
+class AdmissionController:
+    """Per-route limiters plus a global in-flight budget with a read-only reserve."""
+
+    def __init__(
+        self,
+        limits: dict[str, tuple[int, int]],
+        max_inflight: int = 256,
+        read_reserved: int = 32,
+        retry_after: int = 2,
+    ):
+        self.limiters = {route: RouteLimiter(c, q) for route, (c, q) in limits.items()}
+        self.max_inflight = max_inflight
+        self.read_reserved = min(read_reserved, max_inflight)
+        self.retry_after = retry_after
+        self.inflight = 0
+        self.stats = {"admitted": 0, "queued": 0, "rejected": 0}
+
+    @classmethod
+    def from_env(cls) -> "AdmissionController":
+        """Controller configured by ``ORG_ADMISSION_*``.
+
+        ``ORG_ADMISSION_LIMITS`` is a JSON object of per-route overrides, merged over
+        DEFAULT_LIMITS, e.g. ``{"/query": [16, 128]}``.
+        """
+        limits = dict(DEFAULT_LIMITS)
+        overrides = json.loads(os.getenv("ORG_ADMISSION_LIMITS") or "{}")
+        limits.update({route: (int(c), int(q)) for route, (c, q) in overrides.items()})
+        return cls(
+            limits,
+            max_inflight=int(os.getenv("ORG_ADMISSION_MAX_INFLIGHT", "256")),
+            read_reserved=int(os.getenv("ORG_ADMISSION_READ_RESERVED", "32")),
+            retry_after=int(os.getenv("ORG_ADMISSION_RETRY_AFTER", "2")),
+        )
+
+    def _reject(self, route: str, reason: str) -> AdmissionRejected:
+        self.stats["rejected"] += 1
+        get_metrics().inc("orgmind_admission_rejected_total", route=route, reason=reason)
+        return AdmissionRejected(route, reason, self.retry_after)
+
+    @asynccontextmanager
+    async def admit(self, route: str) -> AsyncIterator[None]:
+        """Hold an admission slot for ``route`` for the duration of the block.
+
+        Raises AdmissionRejected without waiting when the route's queue or the
+        global budget is exhausted.
+        """
+        limiter = self.limiters.get(route)
+        if limiter is None:
+            # Cheap read: may use the whole budget, including the reserved share.
+            if self.inflight >= self.max_inflight:
+                raise self._reject(route, "inflight_limit")
+            self.inflight += 1
+            try:
+                yield
+            finally:
+                self.inflight -= 1
+            return
+
+        if self.inflight >= self.max_inflight - self.read_reserved:
+            raise self._reject(route, "reserved_for_reads")
+        if limiter.active >= limiter.max_concurrent and limiter.waiting >= limiter.max_queue:
+            raise self._reject(route, "queue_full")
+
+        metrics = get_metrics()
+        start = time.perf_counter()
+        limiter.waiting += 1
+        if limiter.active >= limiter.max_concurrent:
+            self.stats["queued"] += 1
+        metrics.gauge_set("orgmind_admission_waiting", limiter.waiting, route=route)
+        try:
+            await limiter.slots.acquire()
+        finally:
+            limiter.waiting -= 1
+            metrics.gauge_set("orgmind_admission_waiting", limiter.waiting, route=route)
+        metrics.observe("orgmind_admission_queue_seconds", time.perf_counter() - start, route=route)
+
+        limiter.active += 1
+        self.inflight += 1
+        self.stats["admitted"] += 1
+        try:
+            yield
+        finally:
+            limiter.active -= 1
+            self.inflight -= 1
+            limiter.slots.release()
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            **self.stats,
+            "inflight": self.inflight,
+            "routes": {
+                route: {"active": l.active, "waiting": l.waiting, "limit": l.max_concurrent, "queue": l.max_queue}
+                for route, l in self.limiters.items()
+            },
+        }
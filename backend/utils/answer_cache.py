@@ -0,0 +1,110 @@
+"""TTL + LRU cache of query answers, scoped to the graph version they were computed on."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger("orgmind.answer_cache")
+
+
+def normalize_question(question: str) -> str:
+    """Case-, whitespace- and trailing-punctuation-insensitive form of a question."""
+    return re.sub(r"\s+", " ", (question or "").strip().lower()).rstrip("?!. ")
+
+
+class AnswerCache:
+    """One entry per (normalized question, intent), valid for one graph version.
+
+    An entry is fresh while its graph version is current and it is younger than
+    ``ttl`` seconds. With ``allow_stale`` a caller gets an outdated entry back
+    immediately while a single background task recomputes it. Values rejected by
+    the ``cacheable`` predicate (e.g. an answer produced while the LLM was down)
+    are returned but never stored.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+        self._refreshing: dict[tuple[str, str], asyncio.Task] = {}
+        self.stats = {"hits": 0, "misses": 0, "stale_served": 0, "refreshes": 0, "evictions": 0, "uncacheable": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _is_fresh(self, entry: dict[str, Any], version: int) -> bool:
+        return entry["version"] == version and (time.monotonic() - entry["created_at"]) < self.ttl
+
+    def _store(
+        self, key: tuple[str, str], version: int, value: Any, cacheable: Callable[[Any], bool] | None = None
+    ) -> bool:
+        if cacheable is not None and not cacheable(value):
+            self.stats["uncacheable"] += 1
+            return False
+        self._entries[key] = {"version": version, "value": value, "created_at": time.monotonic()}
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+        return True
+
+    async def get_or_compute(
+        self,
+        question: str,
+        intent: str,
+        version: int,
+        compute: Callable[[], Awaitable[Any]],
+        allow_stale: bool = False,
+        cacheable: Callable[[Any], bool] | None = None,
+    ) -> tuple[Any, str]:
+        """Return ``(answer, status)`` where status is ``hit``, ``stale`` or ``miss``."""
+        key = (normalize_question(question), intent)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            if self._is_fresh(entry, version):
+                self.stats["hits"] += 1
+                return entry["value"], "hit"
+            if allow_stale:
+                self.stats["stale_served"] += 1
+                self._refresh(key, version, compute, cacheable)
+                return entry["value"], "stale"
+
+        self.stats["misses"] += 1
+        value = await compute()
+        self._store(key, version, value, cacheable)
+        return value, "miss"
+
+    def _refresh(
+        self,
+        key: tuple[str, str],
+        version: int,
+        compute: Callable[[], Awaitable[Any]],
+        cacheable: Callable[[Any], bool] | None = None,
+    ) -> None:
+        if key in self._refreshing:
+            return
+
+        async def run() -> None:
+            try:
+                if self._store(key, version, await compute(), cacheable):
+                    self.stats["refreshes"] += 1
+            except Exception as e:
+                logger.warning(f"Background answer refresh failed: {e}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(run())
+
+    def snapshot(self) -> dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"] + self.stats["stale_served"]
+        return {
+            **self.stats,
+            "size": len(self._entries),
+            "hit_rate": (self.stats["hits"] + self.stats["stale_served"]) / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,108 @@
+"""Content-hash ids and a seen-set for idempotent ingestion.
+
+An update's event id is derived from a hash of its sender, subject, date and
+body, so a replayed email (a client retry, or a re-sent traffic batch) maps to
+the same ``event:<hash>`` node. ``SeenSet`` answers "was this already
+ingested?" before any LLM call: a Bloom filter rejects new ids in a few bit
+probes, and only its positives are confirmed against the exact set, so a
+false positive never drops a genuinely new update.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from typing import Any, Iterable
+
+EVENT_PREFIX = "event:"
+
+
+def content_key(info: dict[str, Any]) -> str | None:
+    """Hex digest of an update's sender, subject, date and body (None without a body)."""
+    content = str(info.get("content") or "").strip()
+    if not content:
+        return None
+    metadata = info.get("metadata") or {}
+    sender = str(metadata.get("sender") or metadata.get("from") or "").strip().lower()
+    subject = str(metadata.get("subject") or "").strip()
+    date = str(info.get("date") or "").strip()
+    return hashlib.sha256("\x1f".join((sender, subject, date, content)).encode("utf-8")).hexdigest()[:32]
+
+
+def event_id_for(info: dict[str, Any]) -> str | None:
+    """The deterministic ``event:<hash>`` node id for an update (None without a body)."""
+    key = content_key(info)
+    return f"{EVENT_PREFIX}{key}" if key else None
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter sized for ``capacity`` keys at ``error_rate`` false positives."""
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.01):
+        self.size = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> Iterable[int]:
+        # Double hashing: k probes from two 64-bit halves of one digest.
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class SeenSet:
+    """Ids of ingested updates: a Bloom filter in front of an exact set.
+
+    ``discard`` only clears the exact set (a Bloom filter cannot forget), which is
+    enough to let a released id through again.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.01):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._exact: set[str] = set()
+        self.stats = {"checks": 0, "bloom_rejects": 0, "false_positives": 0, "duplicates": 0}
+
+    def __contains__(self, key: str) -> bool:
+        self.stats["checks"] += 1
+        if key not in self._bloom:
+            self.stats["bloom_rejects"] += 1
+            return False
+        if key not in self._exact:
+            self.stats["false_positives"] += 1
+            return False
+        self.stats["duplicates"] += 1
+        return True
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def add(self, key: str) -> None:
+        if key not in self._exact:
+            self._exact.add(key)
+            self._bloom.add(key)
+
+    def discard(self, key: str) -> None:
+        self._exact.discard(key)
+
+    def rebuild(self, keys: Iterable[str]) -> None:
+        """Replace the contents with ``keys`` (e.g. the event ids of a freshly loaded graph)."""
+        self._exact = set(keys)
+        # Grow past the configured capacity rather than let the false-positive rate climb.
+        self._bloom = BloomFilter(max(self.capacity, 2 * len(self._exact)), self.error_rate)
+        for key in self._exact:
+            self._bloom.add(key)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {**self.stats, "size": len(self._exact), "bloom_bits": self._bloom.size, "bloom_hashes": self._bloom.hashes}
@@ -0,0 +1,68 @@
+"""In-process fan-out of compact server events to push subscribers."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any
+
+
+class Subscriber:
+    """One push client: a bounded queue plus a dropped flag."""
+
+    def __init__(self, queue_size: int):
+        self.queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(maxsize=queue_size)
+        self.dropped = False
+
+
+class EventBroadcaster:
+    """Single-producer, many-subscriber broadcaster with slow-consumer dropping.
+
+    ``publish`` never blocks: an event goes into every subscriber's bounded queue,
+    and a subscriber whose queue is full is disconnected (its queue is replaced by a
+    single ``None`` sentinel) so one stalled client cannot hold back the others.
+    """
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers: set[Subscriber] = set()
+        self._seq = 0
+        self.stats = {"published": 0, "delivered": 0, "dropped_subscribers": 0}
+
+    def subscribe(self) -> Subscriber:
+        sub = Subscriber(self.queue_size)
+        self._subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscriber) -> None:
+        self._subscribers.discard(sub)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, event: str, data: dict[str, Any]) -> None:
+        self._seq += 1
+        message = {"id": self._seq, "event": event, "data": data, "ts": time.time()}
+        self.stats["published"] += 1
+        for sub in list(self._subscribers):
+            try:
+                sub.queue.put_nowait(message)
+                self.stats["delivered"] += 1
+            except asyncio.QueueFull:
+                self._drop(sub)
+
+    def _drop(self, sub: Subscriber) -> None:
+        self._subscribers.discard(sub)
+        sub.dropped = True
+        while not sub.queue.empty():
+            sub.queue.get_nowait()
+        sub.queue.put_nowait(None)
+        self.stats["dropped_subscribers"] += 1
+
+
+def format_sse(message: dict[str, Any]) -> str:
+    """Encode a broadcaster message as a Server-Sent Events frame."""
+    payload = json.dumps(message["data"], separators=(",", ":"), default=str)
+    return f"id: {message['id']}\nevent: {message['event']}\ndata: {payload}\n\n"
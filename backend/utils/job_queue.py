@@ -0,0 +1,164 @@
+"""In-process job queue with priority lanes and a SQLite-backed job store.
+
+Jobs survive restarts: anything still queued or running when the process stopped
+is re-enqueued on ``start()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+
+logger = logging.getLogger("orgmind.jobs")
+
+PRIORITY_LANES = {"critical": 0, "high": 0, "medium": 1, "low": 2}
+
+
+class JobQueueFull(Exception):
+    """Raised when the backlog limit is reached; callers should retry later."""
+
+
+class JobStore:
+    """Durable job records in a local SQLite file."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY, status TEXT NOT NULL, priority TEXT NOT NULL,"
+            " payload TEXT NOT NULL, result TEXT, error TEXT,"
+            " created_at REAL NOT NULL, started_at REAL, finished_at REAL)"
+        )
+
+    def insert(self, job: dict[str, Any]) -> None:
+        self._db.execute(
+            "INSERT INTO jobs (id, status, priority, payload, created_at) VALUES (?, ?, ?, ?, ?)",
+            (job["id"], job["status"], job["priority"], json.dumps(job["payload"], default=str), job["created_at"]),
+        )
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        if "result" in fields:
+            fields["result"] = json.dumps(fields["result"], default=str)
+        cols = ", ".join(f"{k} = ?" for k in fields)
+        self._db.execute(f"UPDATE jobs SET {cols} WHERE id = ?", (*fields.values(), job_id))
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        row = self._db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def unfinished(self) -> list[dict[str, Any]]:
+        rows = self._db.execute(
+            "SELECT id, priority, created_at FROM jobs WHERE status IN ('queued', 'running') ORDER BY created_at"
+        ).fetchall()
+        return [dict(r) for r in rows]
+
+    def prune(self, older_than: float) -> int:
+        cur = self._db.execute(
+            "DELETE FROM jobs WHERE status IN ('done', 'failed') AND finished_at < ?", (older_than,)
+        )
+        return cur.rowcount
+
+    def close(self) -> None:
+        self._db.close()
+
+
+class JobQueue:
+    """Bounded priority queue drained by a fixed pool of async workers."""
+
+    def __init__(
+        self,
+        handler: Callable[[dict[str, Any]], Awaitable[dict[str, Any]]],
+        store: JobStore,
+        workers: int = 2,
+        max_backlog: int = 500,
+        retention_seconds: float = 24 * 3600,
+    ):
+        self.handler = handler
+        self.store = store
+        self.workers = workers
+        self.max_backlog = max_backlog
+        self.retention_seconds = retention_seconds
+        self._queue: asyncio.PriorityQueue[tuple[int, int, str]] = asyncio.PriorityQueue()
+        self._seq = 0
+        self._tasks: list[asyncio.Task] = []
+        self.stats = {"submitted": 0, "rejected": 0, "done": 0, "failed": 0, "recovered": 0, "running": 0}
+
+    @property
+    def backlog(self) -> int:
+        return self._queue.qsize()
+
+    def _enqueue(self, job_id: str, priority: str) -> None:
+        self._seq += 1
+        self._queue.put_nowait((PRIORITY_LANES.get(priority, PRIORITY_LANES["medium"]), self._seq, job_id))
+
+    async def start(self) -> None:
+        """Re-enqueue unfinished jobs from the store and start the worker pool."""
+        self.store.prune(time.time() - self.retention_seconds)
+        for job in self.store.unfinished():
+            self.store.update(job["id"], status="queued", started_at=None)
+            self._enqueue(job["id"], job["priority"])
+            self.stats["recovered"] += 1
+        if self.stats["recovered"]:
+            logger.info("Recovered %s unfinished jobs from %s", self.stats["recovered"], self.store.path)
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, payload: dict[str, Any], priority: str = "medium") -> dict[str, Any]:
+        """Persist and enqueue a job; raises JobQueueFull when the backlog is at its limit."""
+        if self.backlog >= self.max_backlog:
+            self.stats["rejected"] += 1
+            raise JobQueueFull(f"Job backlog is full ({self.max_backlog} queued).")
+        priority = priority if priority in PRIORITY_LANES else "medium"
+        job = {"id": uuid4().hex, "status": "queued", "priority": priority, "payload": payload, "created_at": time.time()}
+        self.store.insert(job)
+        self._enqueue(job["id"], priority)
+        self.stats["submitted"] += 1
+        return job
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        job = self.store.get(job_id)
+        if job is not None:
+            job.pop("payload", None)
+        return job
+
+    async def _worker(self, worker_id: int) -> None:
+        while True:
+            _, _, job_id = await self._queue.get()
+            job = self.store.get(job_id)
+            if job is None or job["status"] not in ("queued", "running"):
+                continue
+            self.store.update(job_id, status="running", started_at=time.time())
+            self.stats["running"] += 1
+            try:
+                result = await self.handler(job["payload"])
+                self.store.update(job_id, status="done", result=result, finished_at=time.time())
+                self.stats["done"] += 1
+            except asyncio.CancelledError:
+                # Shutdown mid-job: leave it 'running' so the next start() re-enqueues it.
+                raise
+            except Exception as e:
+                logger.error(f"Job {job_id} failed on worker {worker_id}: {e}")
+                self.store.update(job_id, status="failed", error=str(e), finished_at=time.time())
+                self.stats["failed"] += 1
+            finally:
+                self.stats["running"] -= 1
@@ -0,0 +1,134 @@
+"""Shared async LLM gateway for OrgMind agents and pipelines.
+
+One gateway per process owns a single ``AsyncOpenAI`` client backed by a pooled
+keep-alive HTTP connection set, so agents never block the event loop and never
+open their own connections.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from dotenv import load_dotenv
+
+from .metrics import get_metrics
+
+if TYPE_CHECKING:
+    # The openai SDK costs ~0.3s to import; it is loaded on the first completion.
+    from openai import AsyncOpenAI
+
+
+class LLMGateway:
+    """Async chat-completions gateway with bounded concurrency."""
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str | None = None,
+        base_url: str | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ):
+        load_dotenv()
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.model = model or os.getenv("OPENAI_MODEL", "gpt-4o")
+        self.base_url = base_url or os.getenv("OPENAI_BASE_URL") or None
+        self.max_concurrency = max_concurrency or int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+        self.timeout = timeout or float(os.getenv("LLM_TIMEOUT", "60"))
+        self._http_client = http_client
+        self._client: AsyncOpenAI | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self.in_flight = 0
+        self.stats = {"calls": 0, "errors": 0, "max_in_flight": 0}
+
+    def _ensure_client(self) -> AsyncOpenAI:
+        if not self.api_key:
+            raise RuntimeError("OPENAI_API_KEY is not set (create backend/.env).")
+        if self._client is None:
+            from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+            http_client = self._http_client or DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                    keepalive_expiry=60.0,
+                ),
+                timeout=self.timeout,
+            )
+            self._client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, http_client=http_client)
+        return self._client
+
+    async def _complete(self, messages: list[dict[str, str]], kind: str = "text", **kwargs: Any) -> str:
+        client = self._ensure_client()
+        metrics = get_metrics()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            self.in_flight += 1
+            self.stats["calls"] += 1
+            self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self.in_flight)
+            metrics.gauge_add("orgmind_llm_in_flight", 1)
+            outcome = "ok"
+            start = time.perf_counter()
+            try:
+                response = await client.chat.completions.create(
+                    model=kwargs.pop("model", None) or self.model,
+                    messages=messages,
+                    **kwargs,
+                )
+                return response.choices[0].message.content or ""
+            except Exception:
+                self.stats["errors"] += 1
+                outcome = "error"
+                raise
+            finally:
+                self.in_flight -= 1
+                metrics.gauge_add("orgmind_llm_in_flight", -1)
+                metrics.observe("orgmind_llm_call_duration_seconds", time.perf_counter() - start, kind=kind, outcome=outcome)
+
+    async def chat_json(self, *, system: str, user: str, temperature: float = 0.2) -> dict[str, Any]:
+        """Run a JSON-mode completion and parse the result."""
+        content = await self._complete(
+            [{"role": "system", "content": system}, {"role": "user", "content": user}],
+            kind="json",
+            response_format={"type": "json_object"},
+            temperature=temperature,
+        )
+        return json.loads(content or "{}")
+
+    async def chat_text(self, *, system: str, user: str, temperature: float = 0.7) -> str:
+        """Run a plain-text completion."""
+        content = await self._complete(
+            [{"role": "system", "content": system}, {"role": "user", "content": user}],
+            temperature=temperature,
+        )
+        return content.strip()
+
+    async def aclose(self) -> None:
+        """Close pooled connections (call on shutdown)."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+_gateway: LLMGateway | None = None
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Return the process-wide gateway, creating it on first use."""
+    global _gateway
+    if _gateway is None:
+        _gateway = LLMGateway()
+    return _gateway
+
+
+def set_llm_gateway(gateway: LLMGateway | None) -> None:
+    """Replace the process-wide gateway (tests, custom endpoints)."""
+    global _gateway
+    _gateway = gateway
@@ -0,0 +1,156 @@
+"""Process-wide metrics: log-bucketed latency histograms, counters and gauges.
+
+Recording is a bisect plus a couple of integer increments, cheap enough to leave on
+in production. ``render_prometheus`` exposes everything in Prometheus text format.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from typing import Any, Callable, Iterable
+
+# Log-spaced bucket bounds (seconds): 4 buckets per doubling (~19% wide) from 100us to ~30min.
+_BUCKET_BOUNDS: list[float] = [1e-4 * 2 ** (i / 4) for i in range(0, 4 * 25)]
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def _labels(labels: dict[str, Any]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(labels: Labels, extra: dict[str, str] | None = None) -> str:
+    pairs = list(labels) + list((extra or {}).items())
+    if not pairs:
+        return ""
+    inner = ",".join(f'{k}="{v.replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"' for k, v in pairs)
+    return "{" + inner + "}"
+
+
+class Histogram:
+    """Fixed log-bucketed histogram with approximate quantiles."""
+
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(_BUCKET_BOUNDS, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation (capped at the max seen)."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank:
+                bound = _BUCKET_BOUNDS[i] if i < len(_BUCKET_BOUNDS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "avg": self.sum / self.count if self.count else 0.0,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+
+class MetricsRegistry:
+    """Named histograms, counters and gauges keyed by label sets."""
+
+    def __init__(self):
+        self._histograms: dict[str, dict[Labels, Histogram]] = {}
+        self._counters: dict[str, dict[Labels, float]] = {}
+        self._gauges: dict[str, dict[Labels, float]] = {}
+        self._gauge_fns: dict[str, Callable[[], Iterable[tuple[dict[str, Any], float]]]] = {}
+        self._help: dict[str, str] = {}
+
+    def describe(self, name: str, help_text: str) -> None:
+        self._help[name] = help_text
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        series = self._histograms.setdefault(name, {})
+        key = _labels(labels)
+        hist = series.get(key)
+        if hist is None:
+            hist = series[key] = Histogram()
+        hist.observe(value)
+
+    def inc(self, name: str, amount: float = 1, **labels: Any) -> None:
+        series = self._counters.setdefault(name, {})
+        key = _labels(labels)
+        series[key] = series.get(key, 0) + amount
+
+    def gauge_add(self, name: str, amount: float, **labels: Any) -> None:
+        series = self._gauges.setdefault(name, {})
+        key = _labels(labels)
+        series[key] = series.get(key, 0) + amount
+
+    def gauge_set(self, name: str, value: float, **labels: Any) -> None:
+        self._gauges.setdefault(name, {})[_labels(labels)] = value
+
+    def gauge_fn(self, name: str, fn: Callable[[], Iterable[tuple[dict[str, Any], float]]]) -> None:
+        """Register a gauge computed at scrape time; ``fn`` yields ``(labels, value)`` pairs."""
+        self._gauge_fns[name] = fn
+
+    def histogram(self, name: str, **labels: Any) -> Histogram | None:
+        return self._histograms.get(name, {}).get(_labels(labels))
+
+    def summaries(self, name: str) -> dict[str, dict[str, float]]:
+        """p50/p95/p99 per series, keyed by a compact label string (for JSON /stats)."""
+        return {
+            ",".join(f"{k}={v}" for k, v in key) or "all": hist.summary()
+            for key, hist in self._histograms.get(name, {}).items()
+        }
+
+    def render_prometheus(self) -> str:
+        lines: list[str] = []
+
+        def header(name: str, kind: str) -> None:
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for name, series in sorted(self._histograms.items()):
+            header(name, "summary")
+            for key, hist in series.items():
+                for q in ("0.5", "0.95", "0.99"):
+                    lines.append(f"{name}{_format_labels(key, {'quantile': q})} {hist.quantile(float(q)):.6g}")
+                lines.append(f"{name}_sum{_format_labels(key)} {hist.sum:.6g}")
+                lines.append(f"{name}_count{_format_labels(key)} {hist.count}")
+        for name, series in sorted(self._counters.items()):
+            header(name, "counter")
+            for key, value in series.items():
+                lines.append(f"{name}{_format_labels(key)} {value:g}")
+        for name, series in sorted(self._gauges.items()):
+            header(name, "gauge")
+            for key, value in series.items():
+                lines.append(f"{name}{_format_labels(key)} {value:g}")
+        for name, fn in sorted(self._gauge_fns.items()):
+            header(name, "gauge")
+            for labels, value in fn():
+                lines.append(f"{name}{_format_labels(_labels(labels))} {value:g}")
+        return "\n".join(lines) + "\n"
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Return the process-wide metrics registry."""
+    return _registry
@@ -0,0 +1,43 @@
+"""Coalesce identical concurrent async calls into one shared in-flight task."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+from .metrics import get_metrics
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent callers share its result.
+
+    The shared call runs as its own task, so a caller that is cancelled (e.g. a
+    client disconnect) does not cancel the work the other callers are waiting on.
+    """
+
+    def __init__(self, name: str = "default"):
+        self.name = name
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.stats = {"calls": 0, "coalesced": 0}
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        self.stats["calls"] += 1
+        task = self._inflight.get(key)
+        if task is None:
+            outcome = "leader"
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t, k=key: self._inflight.pop(k, None))
+        else:
+            outcome = "coalesced"
+            self.stats["coalesced"] += 1
+        get_metrics().inc("orgmind_singleflight_calls_total", flight=self.name, outcome=outcome)
+        return await asyncio.shield(task)
+
+    def snapshot(self) -> dict[str, Any]:
+        calls = self.stats["calls"]
+        return {**self.stats, "inflight": self.inflight, "coalesce_rate": self.stats["coalesced"] / calls if calls else 0.0}
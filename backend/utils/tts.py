@@ -0,0 +1,202 @@
+"""Text-to-speech proxy: pooled ElevenLabs client plus a disk-backed LRU audio cache.
+
+Audio is content-addressed by (voice_id, model, settings, text hash), so replaying
+a brief is a local file read. Cache misses stream from the provider to the client
+chunk by chunk while the same chunks are written to a temp file that is renamed
+into the cache only once the stream completes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, AsyncIterator
+from uuid import uuid4
+
+import httpx
+
+logger = logging.getLogger("orgmind.tts")
+
+DEFAULT_VOICE_SETTINGS = {"stability": 0.5, "similarity_boost": 0.5}
+
+
+class TTSProviderError(Exception):
+    """The TTS provider answered with a non-200 status."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def cache_key(voice_id: str, model: str, settings: dict[str, Any], text: str) -> str:
+    text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    material = json.dumps([voice_id, model, settings, text_hash], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class AudioCache:
+    """Size-capped LRU of audio files in one directory."""
+
+    def __init__(self, directory: str | Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "bytes": 0}
+        # key -> size, least recently used first; rebuilt from mtimes on startup.
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        for path in sorted(self.directory.glob("*.mp3"), key=lambda p: p.stat().st_mtime):
+            self._entries[path.stem] = path.stat().st_size
+            self.stats["bytes"] += path.stat().st_size
+        for stale in self.directory.glob("*.part"):
+            stale.unlink(missing_ok=True)
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}.mp3"
+
+    def get(self, key: str) -> Path | None:
+        """Return the cached file for ``key`` (marking it recently used), or None."""
+        path = self.path(key)
+        if key not in self._entries or not path.exists():
+            self._forget(key)
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        os.utime(path)
+        self.stats["hits"] += 1
+        return path
+
+    def open_temp(self) -> tuple[Path, Any]:
+        tmp = self.directory / f"{uuid4().hex}.part"
+        return tmp, open(tmp, "wb")
+
+    def commit(self, key: str, tmp: Path) -> None:
+        """Move a fully written temp file into the cache and evict down to the cap."""
+        size = tmp.stat().st_size
+        if size > self.max_bytes:
+            tmp.unlink(missing_ok=True)
+            return
+        self._forget(key)
+        os.replace(tmp, self.path(key))
+        self._entries[key] = size
+        self.stats["bytes"] += size
+        while self.stats["bytes"] > self.max_bytes and self._entries:
+            oldest = next(iter(self._entries))
+            self.path(oldest).unlink(missing_ok=True)
+            self._forget(oldest)
+            self.stats["evictions"] += 1
+
+    def _forget(self, key: str) -> None:
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self.stats["bytes"] -= size
+
+
+class TTSClient:
+    """ElevenLabs streaming client sharing one pooled ``httpx.AsyncClient``."""
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        model: str | None = None,
+        cache: AudioCache | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ):
+        self.api_key = api_key or os.getenv("ELEVENLABS_API_KEY")
+        self.base_url = (base_url or os.getenv("ELEVENLABS_BASE_URL", "https://api.elevenlabs.io")).rstrip("/")
+        self.model = model or os.getenv("ELEVENLABS_MODEL", "eleven_monolingual_v1")
+        self.cache = cache or AudioCache(
+            os.getenv("ORG_TTS_CACHE_DIR", os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "cache", "tts")),
+            int(os.getenv("ORG_TTS_CACHE_MAX_BYTES", str(200 * 1024 * 1024))),
+        )
+        self._http_client = http_client
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=60.0),
+                # Audio generation can take a while before the first byte.
+                timeout=httpx.Timeout(60.0, connect=10.0),
+            )
+        return self._http_client
+
+    def key(self, voice_id: str, text: str, settings: dict[str, Any] | None = None) -> str:
+        return cache_key(voice_id, self.model, settings or DEFAULT_VOICE_SETTINGS, text)
+
+    async def open_stream(
+        self, voice_id: str, text: str, settings: dict[str, Any] | None = None
+    ) -> AsyncIterator[bytes]:
+        """Start synthesis and return an iterator of audio chunks that also fills the cache.
+
+        Raises TTSProviderError before any bytes are yielded if the provider rejects
+        the request, so callers can still answer with a proper error status.
+        """
+        if not self.api_key:
+            raise RuntimeError("ElevenLabs API Key not configured")
+        settings = settings or DEFAULT_VOICE_SETTINGS
+        key = self.key(voice_id, text, settings)
+        client = self._client()
+        request = client.build_request(
+            "POST",
+            f"{self.base_url}/v1/text-to-speech/{voice_id}/stream",
+            json={"text": text, "model_id": self.model, "voice_settings": settings},
+            headers={"Accept": "audio/mpeg", "Content-Type": "application/json", "xi-api-key": self.api_key},
+        )
+        resp = await client.send(request, stream=True)
+        if resp.status_code != 200:
+            detail = (await resp.aread()).decode("utf-8", errors="replace")
+            await resp.aclose()
+            raise TTSProviderError(resp.status_code, detail)
+        return self._tee(resp, key)
+
+    async def _tee(self, resp: httpx.Response, key: str) -> AsyncIterator[bytes]:
+        tmp, f = self.cache.open_temp()
+        complete = False
+        try:
+            async for chunk in resp.aiter_bytes():
+                f.write(chunk)
+                yield chunk
+            complete = True
+        finally:
+            f.close()
+            await resp.aclose()
+            if complete:
+                self.cache.commit(key, tmp)
+            else:
+                # Client went away or the provider stream broke: never cache partial audio.
+                tmp.unlink(missing_ok=True)
+
+    async def aclose(self) -> None:
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+
+_tts_client: TTSClient | None = None
+
+
+def get_tts_client() -> TTSClient:
+    """Return the process-wide TTS client (created on first use)."""
+    global _tts_client
+    if _tts_client is None:
+        _tts_client = TTSClient()
+    return _tts_client
+
+
+def set_tts_client(client: TTSClient | None) -> None:
+    """Replace the process-wide TTS client (tests, custom providers)."""
+    global _tts_client
+    _tts_client = client
+
+
+async def close_tts_client() -> None:
+    """Close the process-wide TTS client if one was ever created (never creates one)."""
+    global _tts_client
+    client, _tts_client = _tts_client, None
+    if client is not None:
+        await client.aclose()
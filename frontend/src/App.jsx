@@ -3,7 +3,7 @@ import Navbar from './components/layout/Navbar/Navbar'
 import QueryResponse from './components/features/QueryResponse/QueryResponse'
 import ErrorBoundary from './components/ErrorBoundary'
 import { SkeletonCard } from './components/Skeleton'
-import { getDemoScenarios, runDemoScenario, getHealth, getStats, agentProcess } from './services/api'
+import { getDemoScenarios, runDemoScenario, getHealth, getStats, agentProcess, subscribeEvents } from './services/api'
 import { useGraph } from './hooks/useGraph'
 import { useAgents } from './hooks/useAgents'
 import Sidebar from './components/layout/Sidebar/Sidebar'
@@ -50,7 +50,19 @@ function App() {
     getHealth().then(setHealth).catch(() => { })
     refreshStats()
     const id = setInterval(() => refreshStats(), 30000)
-    return () => clearInterval(id)
+    // Apply pushed stats deltas between the (now mostly redundant) slow polls.
+    const unsubscribe = subscribeEvents((type, data) => {
+      if (type !== 'stats' || !data.bucket) return
+      setRuntimeStats((prev) => (prev ? {
+        ...prev,
+        requests_total: data.requests_total,
+        [data.bucket]: { ...(prev[data.bucket] || {}), count: data.count, avg_time: data.avg_time },
+      } : prev))
+    })
+    return () => {
+      clearInterval(id)
+      unsubscribe()
+    }
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [])
 
@@ -1,5 +1,8 @@
 import { useState, useEffect, useCallback, useRef } from 'react'
-import { getAgentStatus } from '../services/api'
+import { getAgentStatus, subscribeEvents, isPushSupported } from '../services/api'
+
+// Fallback poll interval when the push channel is unavailable.
+const POLL_INTERVAL_MS = 5000
 
 export function useAgents() {
   const [agentStatus, setAgentStatus] = useState(null)
@@ -7,7 +10,9 @@ export function useAgents() {
   const [error, setError] = useState(null)
   const [lastUpdated, setLastUpdated] = useState(null)
   const [isPolling, setIsPolling] = useState(true)
+  const [pushConnected, setPushConnected] = useState(false)
   const timerRef = useRef(null)
+  const debounceRef = useRef(null)
 
   const fetchStatus = useCallback(async () => {
     setLoading(true)
@@ -22,18 +27,36 @@ export function useAgents() {
     }
   }, [])
 
+  // Push channel: refetch the full status only when an agent step or graph bump arrives.
+  useEffect(() => {
+    if (!isPolling || !isPushSupported()) return undefined
+    const unsubscribe = subscribeEvents((type) => {
+      if (type === 'open' || type === 'hello') setPushConnected(true)
+      if (type === 'error' || type === 'dropped') setPushConnected(false)
+      if (type === 'agent' || type === 'graph') {
+        if (debounceRef.current) clearTimeout(debounceRef.current)
+        debounceRef.current = setTimeout(fetchStatus, 300)
+      }
+    })
+    return () => {
+      unsubscribe()
+      if (debounceRef.current) clearTimeout(debounceRef.current)
+    }
+  }, [isPolling, fetchStatus])
+
   useEffect(() => {
     if (!isPolling) return undefined
     fetchStatus()
-    timerRef.current = setInterval(fetchStatus, 5000) // Changed from 2s to 5s to reduce load
+    if (pushConnected) return undefined
+    timerRef.current = setInterval(fetchStatus, POLL_INTERVAL_MS)
     return () => {
       if (timerRef.current) clearInterval(timerRef.current)
     }
     // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [isPolling]) // Removed fetchStatus from deps to prevent re-creation
+  }, [isPolling, pushConnected]) // Removed fetchStatus from deps to prevent re-creation
 
   const pause = useCallback(() => setIsPolling(false), [])
   const resume = useCallback(() => setIsPolling(true), [])
 
-  return { agentStatus, loading, error, lastUpdated, isPolling, pause, resume, refresh: fetchStatus }
+  return { agentStatus, loading, error, lastUpdated, isPolling, pushConnected, pause, resume, refresh: fetchStatus }
 }
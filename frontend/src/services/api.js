@@ -103,4 +103,44 @@ export async function agentProcess(payload) {
   }
 }
 
+// Single shared EventSource for server push (/events), fanned out to listeners.
+let eventSource = null
+const eventListeners = new Set()
+const PUSH_EVENTS = ['hello', 'graph', 'agent', 'stats', 'dropped']
+
+function ensureEventSource() {
+  if (eventSource || typeof EventSource === 'undefined') return
+  eventSource = new EventSource(`${baseURL}/events`)
+  PUSH_EVENTS.forEach((type) => {
+    eventSource.addEventListener(type, (evt) => {
+      let data = {}
+      try {
+        data = JSON.parse(evt.data || '{}')
+      } catch {
+        return
+      }
+      eventListeners.forEach((listener) => listener(type, data))
+    })
+  })
+  eventSource.onopen = () => eventListeners.forEach((listener) => listener('open', {}))
+  eventSource.onerror = () => eventListeners.forEach((listener) => listener('error', {}))
+}
+
+// Subscribe to push events; returns an unsubscribe function. Listeners receive (type, data).
+export function subscribeEvents(listener) {
+  eventListeners.add(listener)
+  ensureEventSource()
+  return () => {
+    eventListeners.delete(listener)
+    if (eventListeners.size === 0 && eventSource) {
+      eventSource.close()
+      eventSource = null
+    }
+  }
+}
+
+export function isPushSupported() {
+  return typeof EventSource !== 'undefined'
+}
+
 export default api